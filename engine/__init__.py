@@ -13,6 +13,8 @@ from .window import Window
 from .components import *
 from .input import InputManager
 from . import text
+from . import cache
+from . import animation
 from . import util
 from . import theme
 
@@ -36,6 +38,8 @@ __all__ = [
     'Window',
     'InputManager',
     'text',
+    'cache',
+    'animation',
     'util',
     'theme'
 ]
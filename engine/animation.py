@@ -0,0 +1,137 @@
+import time
+
+
+# --- easing curves: map elapsed fraction t in [0, 1] to progress ---
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    return t * t
+
+
+def ease_out_quad(t: float) -> float:
+    return 1 - (1 - t) * (1 - t)
+
+
+def ease_in_out_quad(t: float) -> float:
+    return 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t)
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    return 4 * t * t * t if t < 0.5 else 1 - 4 * (1 - t) ** 3
+
+
+EASINGS = {
+    'linear': linear,
+    'ease_in_quad': ease_in_quad,
+    'ease_out_quad': ease_out_quad,
+    'ease_in_out_quad': ease_in_out_quad,
+    'ease_out_cubic': ease_out_cubic,
+    'ease_in_out_cubic': ease_in_out_cubic,
+}
+
+
+def _lerp(a, b, p: float):
+    """Interpolate numbers or equal-length tuples of numbers (positions, colors)."""
+    if isinstance(a, (tuple, list)):
+        return tuple(_lerp(x, y, p) for x, y in zip(a, b))
+    value = a + (b - a) * p
+    if isinstance(a, int) and isinstance(b, int):
+        return round(value)
+    return value
+
+
+class Animation:
+    """Tween of one attribute of a component from `start` to `end`."""
+    __slots__ = ["component", "attr", "start", "end", "duration", "easing", "on_done", "started"]
+
+    def __init__(self, component, attr: str, start, end, duration: float, easing, on_done=None) -> None:
+        self.component = component
+        self.attr = attr
+        self.start = start
+        self.end = end
+        # seconds
+        self.duration = max(0.0, duration) / 1000
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.on_done = on_done
+        self.started = time.perf_counter()
+
+    def step(self, now: float) -> bool:
+        """Apply the value for `now`; True once the animation has finished."""
+        t = (now - self.started) / self.duration if self.duration else 1.0
+        done = t >= 1.0
+        value = self.end if done else _lerp(self.start, self.end, self.easing(max(0.0, t)))
+        setattr(self.component, self.attr, value)
+        # any number of animated attributes still cost one render per frame
+        self.component.mark_dirty()
+        return done
+
+
+class Animator:
+    """The window's running animations, ticked once per frame.
+
+    Only active animations are visited; once the last one finishes the
+    window stops asking for frames and can go idle.
+    """
+    __slots__ = ["_active"]
+
+    def __init__(self) -> None:
+        # (component, attr) -> Animation; one tween per attribute
+        self._active = {}
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, key) -> bool:
+        return key in self._active
+
+    def animate(self, component, attr: str, to, duration: float = 200, easing=ease_out_cubic,
+                on_done=None, start=None) -> Animation:
+        """Tween `component.<attr>` to `to` over `duration` ms.
+
+        Animating an attribute that is already moving retargets it from
+        where it currently is. `on_done()` is called when it arrives.
+        """
+        if start is None:
+            start = getattr(component, attr)
+        anim = Animation(component, attr, start, to, duration, easing, on_done)
+        self._active[(component, attr)] = anim
+        return anim
+
+    def cancel(self, component, attr: str | None = None) -> int:
+        """Stop the animations of `component` (only `attr` if given) where they are."""
+        if attr is not None:
+            return int(self._active.pop((component, attr), None) is not None)
+        keys = [key for key in self._active if key[0] is component]
+        for key in keys:
+            del self._active[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._active.clear()
+
+    def tick(self, now: float | None = None) -> None:
+        """Advance every active animation to `now` and retire finished ones."""
+        if not self._active:
+            return
+        if now is None:
+            now = time.perf_counter()
+        active = self._active
+        for key, anim in list(active.items()):
+            if anim.step(now) and active.get(key) is anim:
+                # on_done may start a follow-up animation on the same key
+                del active[key]
+                if anim.on_done is not None:
+                    anim.on_done()
+
+
+__all__ = [
+    "Animation", "Animator", "EASINGS",
+    "linear", "ease_in_quad", "ease_out_quad", "ease_in_out_quad", "ease_out_cubic", "ease_in_out_cubic",
+]
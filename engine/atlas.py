@@ -0,0 +1,145 @@
+import weakref
+import pygame
+from .cache import manager as caches
+
+# side length of one atlas page in pixels
+PAGE_SIZE = 512
+
+
+class GlyphAtlas:
+    """Glyphs of one font in one color, rasterized once into shared pages.
+
+    Strings are composed from subsurfaces of the pages, so drawing any text
+    (counters, clocks, logs) needs no font.render once its characters have
+    been seen, and the result goes to the target in a single fblits call.
+    """
+    __slots__ = ["_font", "color", "bg_color", "page_size", "_pages", "_cursor", "_row_h", "_glyphs", "height", "_loose"]
+
+    def __init__(self, font: pygame.font.Font, color, bg_color=None, page_size: int = PAGE_SIZE) -> None:
+        # weak, so a cached atlas does not keep its font alive
+        self._font = weakref.ref(font)
+        self.color = color
+        self.bg_color = bg_color
+        self.page_size = page_size
+        self._pages = []
+        # packing position on the newest page and the height of its current row
+        self._cursor = (0, 0)
+        self._row_h = 0
+        # char -> (subsurface or None for empty glyphs, advance)
+        self._glyphs = {}
+        # bytes of glyphs too large for a page, kept on their own surfaces
+        self._loose = 0
+        # tallest glyph so far; some glyphs render taller than get_height()
+        self.height = font.get_height()
+
+    @property
+    def font(self):
+        """The atlas' font, or None once it was garbage collected."""
+        return self._font()
+
+    @property
+    def pages(self) -> int:
+        return len(self._pages)
+
+    @property
+    def nbytes(self) -> int:
+        """Pixel memory held by the pages and oversized glyphs."""
+        return len(self._pages) * self.page_size * self.page_size * 4 + self._loose
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def glyph(self, ch: str) -> tuple:
+        """(surface, advance) of `ch`, rasterizing it on first use."""
+        entry = self._glyphs.get(ch)
+        if entry is None:
+            entry = self._glyphs[ch] = self._add(ch)
+        return entry
+
+    def _add(self, ch: str) -> tuple:
+        surf = self._font().render(ch, True, self.color, self.bg_color)
+        w, h = surf.get_size()
+        if not w or not h:
+            return None, w
+        self.height = max(self.height, h)
+        size = self.page_size
+        if w > size or h > size:
+            # larger than a page; keep it on its own
+            self._loose += w * h * surf.get_bytesize()
+            return surf, w
+
+        x, y = self._cursor
+        if self._pages and x + w > size:
+            # next row
+            x, y = 0, y + self._row_h
+            self._row_h = 0
+        if not self._pages or y + h > size:
+            page = pygame.Surface((size, size), pygame.SRCALPHA)
+            page.fill((0, 0, 0, 0))
+            self._pages.append(page)
+            x, y = 0, 0
+            self._row_h = 0
+        page = self._pages[-1]
+        # the slot is still transparent, so MAX copies the glyph exactly
+        page.blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        self._cursor = (x + w, y)
+        self._row_h = max(self._row_h, h)
+        return page.subsurface((x, y, w, h)), w
+
+    def layout(self, text: str, x: int = 0, y: int = 0, gaps=None) -> tuple[list, int]:
+        """(surface, pos) pairs drawing `text` at (x, y), and the x it ends at.
+
+        `gaps` optionally adds extra pixels after each character but the last.
+        """
+        blits = []
+        glyph = self.glyph
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            surf, advance = glyph(ch)
+            if surf is not None:
+                blits.append((surf, (x, y)))
+            x += advance
+            if gaps is not None and i < last and i < len(gaps):
+                x += gaps[i]
+        return blits, x
+
+    def size(self, text: str) -> tuple[int, int]:
+        glyph = self.glyph
+        width = sum(glyph(ch)[1] for ch in text)
+        return width, self.height
+
+    def render(self, text: str) -> pygame.Surface:
+        """Draw `text` onto a new surface, like font.render."""
+        surf = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        if self.bg_color is not None:
+            surf.fill(self.bg_color)
+        surf.fblits(self.layout(text)[0])
+        return surf
+
+
+# (weak font ref, color, bg color) -> GlyphAtlas. Pages are counted against
+# the budget; a font's atlases become unreachable once the font is collected
+# and age out of the LRU.
+ATLAS_CACHE = caches.create('atlas.glyphs', 16 << 20, sizeof=lambda atlas: atlas.nbytes + 256)
+
+
+def get_atlas(font: pygame.font.Font, color, bg_color=None) -> GlyphAtlas:
+    """Shared atlas for `font` drawn in `color` (on `bg_color`)."""
+    color = tuple(color) if isinstance(color, (list, tuple, pygame.Color)) else color
+    bg_color = tuple(bg_color) if isinstance(bg_color, (list, tuple, pygame.Color)) else bg_color
+    key = (weakref.ref(font), color, bg_color)
+    atlas = ATLAS_CACHE.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, bg_color)
+        ATLAS_CACHE[key] = atlas
+    else:
+        # pages added since the last lookup count against the budget now
+        ATLAS_CACHE.refresh(key)
+    return atlas
+
+
+def clear_atlases() -> None:
+    ATLAS_CACHE.clear()
+
+
+__all__ = ["GlyphAtlas", "get_atlas", "clear_atlases", "PAGE_SIZE", "ATLAS_CACHE"]
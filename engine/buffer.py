@@ -0,0 +1,216 @@
+from bisect import bisect_right
+
+# lines per block; blocks are split at twice this size
+BLOCK_LINES = 256
+
+
+class TextBuffer:
+    """Editable text stored as blocks of lines, with a line-start index.
+
+    A shallow rope: an edit rewrites only the lines it touches inside one or
+    two blocks and re-indexes block offsets lazily, so keystrokes in a long
+    document cost about the length of the edited line, not the document.
+    Offset <-> (line, column) mapping bisects the block index instead of
+    rescanning the text.
+    """
+    __slots__ = ["_blocks", "_weights", "_starts", "_line_starts", "_valid", "_length", "_text", "version"]
+
+    def __init__(self, text: str = "") -> None:
+        self.version = 0
+        self.set(text)
+
+    def set(self, text: str) -> None:
+        """Replace the whole content."""
+        lines = text.split('\n')
+        self._blocks = [lines[i:i + BLOCK_LINES] for i in range(0, len(lines), BLOCK_LINES)]
+        self._weights = [sum(map(len, block)) + len(block) for block in self._blocks]
+        self._starts = []
+        self._line_starts = []
+        # blocks before _valid have correct entries in _starts/_line_starts
+        self._valid = 0
+        self._length = len(text)
+        self._text = text
+        self.version += 1
+
+    # --- reading ---
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TextBuffer):
+            other = other.text
+        return self.text == other
+
+    __hash__ = None
+
+    @property
+    def text(self) -> str:
+        """The whole content as a string, joined once per edit."""
+        if self._text is None:
+            self._text = '\n'.join(self.lines())
+        return self._text
+
+    @property
+    def line_count(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+    def lines(self, start: int = 0, stop: int | None = None):
+        """Iterate lines `start`..`stop` (exclusive) without joining the text."""
+        if stop is None:
+            stop = self.line_count
+        if start >= stop:
+            return
+        b, i = self._locate_line(start)
+        n = stop - start
+        for block in self._blocks[b:]:
+            for line in block[i:]:
+                yield line
+                n -= 1
+                if not n:
+                    return
+            i = 0
+
+    def line(self, index: int) -> str:
+        b, i = self._locate_line(index)
+        return self._blocks[b][i]
+
+    def line_start(self, index: int) -> int:
+        """Offset of the first character of line `index`."""
+        b, i = self._locate_line(index)
+        offset = self._starts[b]
+        for line in self._blocks[b][:i]:
+            offset += len(line) + 1
+        return offset
+
+    def line_of(self, offset: int) -> tuple[int, int]:
+        """(line, column) of the caret position `offset`."""
+        offset = max(0, min(offset, self._length))
+        self._index()
+        b = bisect_right(self._starts, offset) - 1
+        off = offset - self._starts[b]
+        line = self._line_starts[b]
+        for text in self._blocks[b]:
+            if off <= len(text):
+                return line, off
+            off -= len(text) + 1
+            line += 1
+        # only reached for the end of the last block
+        return line - 1, len(self._blocks[b][-1])
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            a, b, step = key.indices(self._length)
+            if step != 1:
+                return self.text[key]
+            return self._slice(a, b)
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError('TextBuffer index out of range')
+        li, col = self.line_of(key)
+        line = self.line(li)
+        return line[col] if col < len(line) else '\n'
+
+    def _slice(self, a: int, b: int) -> str:
+        if a >= b:
+            return ''
+        if self._text is not None:
+            return self._text[a:b]
+        la, ca = self.line_of(a)
+        lb, cb = self.line_of(b)
+        if la == lb:
+            return self.line(la)[ca:cb]
+        parts = list(self.lines(la, lb + 1))
+        parts[0] = parts[0][ca:]
+        parts[-1] = parts[-1][:cb]
+        return '\n'.join(parts)
+
+    # --- editing ---
+
+    def insert(self, offset: int, text: str) -> None:
+        self.replace(offset, offset, text)
+
+    def delete(self, a: int, b: int) -> None:
+        self.replace(a, b, '')
+
+    def replace(self, a: int, b: int, text: str) -> None:
+        """Replace characters `a`..`b` with `text`."""
+        a = max(0, min(a, self._length))
+        b = max(a, min(b, self._length))
+        la, ca = self.line_of(a)
+        lb, cb = self.line_of(b)
+        head = self.line(la)[:ca]
+        tail = self.line(lb)[cb:]
+        self._replace_lines(la, lb, (head + text + tail).split('\n'))
+        self._length += len(text) - (b - a)
+        self._text = None
+        self.version += 1
+
+    # --- index ---
+
+    def _index(self) -> None:
+        """Recompute block offsets from the first block an edit touched."""
+        count = len(self._blocks)
+        v = self._valid
+        if v >= count:
+            return
+        starts = self._starts
+        line_starts = self._line_starts
+        del starts[v:]
+        del line_starts[v:]
+        if v:
+            offset = starts[v - 1] + self._weights[v - 1]
+            line = line_starts[v - 1] + len(self._blocks[v - 1])
+        else:
+            offset = line = 0
+        for b in range(v, count):
+            starts.append(offset)
+            line_starts.append(line)
+            offset += self._weights[b]
+            line += len(self._blocks[b])
+        self._valid = count
+
+    def _locate_line(self, index: int) -> tuple[int, int]:
+        self._index()
+        b = bisect_right(self._line_starts, index) - 1
+        b = max(0, min(b, len(self._blocks) - 1))
+        i = index - self._line_starts[b]
+        return b, max(0, min(i, len(self._blocks[b]) - 1))
+
+    def _replace_lines(self, l0: int, l1: int, new_lines: list) -> None:
+        """Replace lines `l0`..`l1` (inclusive) with `new_lines`."""
+        blocks = self._blocks
+        weights = self._weights
+        b0, i0 = self._locate_line(l0)
+        b1, i1 = self._locate_line(l1)
+        if b0 == b1:
+            blocks[b0][i0:i1 + 1] = new_lines
+        else:
+            blocks[b1][:i1 + 1] = []
+            blocks[b0][i0:] = new_lines
+            del blocks[b0 + 1:b1]
+            del weights[b0 + 1:b1]
+            b1 = b0 + 1
+
+        # re-weigh, split oversized and drop emptied blocks in the touched range
+        b = b1
+        while b >= b0:
+            block = blocks[b]
+            if not block:
+                del blocks[b]
+                del weights[b]
+            elif len(block) > 2 * BLOCK_LINES:
+                parts = [block[i:i + BLOCK_LINES] for i in range(0, len(block), BLOCK_LINES)]
+                blocks[b:b + 1] = parts
+                weights[b:b + 1] = [sum(map(len, p)) + len(p) for p in parts]
+            else:
+                weights[b] = sum(map(len, block)) + len(block)
+            b -= 1
+        self._valid = min(self._valid, b0)
+
+
+__all__ = ["TextBuffer", "BLOCK_LINES"]
@@ -0,0 +1,147 @@
+from collections import OrderedDict
+import sys
+import pygame
+
+
+def estimate_bytes(value) -> int:
+    """Rough memory cost of a cached value; surfaces count their pixel data."""
+    if isinstance(value, pygame.Surface):
+        w, h = value.get_size()
+        return w * h * value.get_bytesize() + 64
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """Mapping bounded by an estimated byte budget, evicting least recently used entries.
+
+    Only get() counts towards the hit/miss statistics; `key in cache` does not.
+    """
+    __slots__ = ["name", "_budget", "_data", "bytes", "hits", "misses", "evictions", "_sizeof"]
+
+    def __init__(self, name: str, budget: int, sizeof=estimate_bytes) -> None:
+        self.name = name
+        self._budget = budget
+        # key -> (value, estimated bytes), oldest first
+        self._data = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sizeof = sizeof
+
+    @property
+    def budget(self) -> int:
+        """Byte budget; lowering it evicts immediately."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: int) -> None:
+        self._budget = value
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def __getitem__(self, key):
+        entry = self._data[key]
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def __setitem__(self, key, value) -> None:
+        size = self._sizeof(value)
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self._budget:
+            # would evict everything else and still not fit
+            return
+        self._data[key] = (value, size)
+        self.bytes += size
+        self._evict()
+
+    def refresh(self, key) -> None:
+        """Re-measure an entry that grew in place, evicting others if over budget."""
+        entry = self._data.get(key)
+        if entry is not None:
+            self[key] = entry[0]
+
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        self.bytes -= entry[1]
+        return entry[0]
+
+    def _evict(self) -> None:
+        data = self._data
+        while self.bytes > self._budget and data:
+            _, (_, size) = data.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'entries': len(self._data),
+            'bytes': self.bytes,
+            'budget': self._budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class CacheManager:
+    """Registry of named LRU caches, for budgets and statistics in one place."""
+    __slots__ = ["_caches"]
+
+    def __init__(self) -> None:
+        self._caches = {}
+
+    def create(self, name: str, budget: int, sizeof=estimate_bytes) -> LRUCache:
+        cache = LRUCache(name, budget, sizeof)
+        self._caches[name] = cache
+        return cache
+
+    def __getitem__(self, name: str) -> LRUCache:
+        return self._caches[name]
+
+    def __iter__(self):
+        return iter(self._caches.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(cache.bytes for cache in self._caches.values())
+
+    def stats(self) -> dict:
+        """Per-cache statistics: name -> {entries, bytes, budget, hits, misses, evictions}."""
+        return {name: cache.stats for name, cache in self._caches.items()}
+
+    def clear(self) -> None:
+        for cache in self._caches.values():
+            cache.clear()
+
+
+# caches used by the engine register here
+manager = CacheManager()
+
+
+__all__ = ["LRUCache", "CacheManager", "estimate_bytes", "manager"]
@@ -2,16 +2,39 @@ from ..window import Window
 import pygame
 
 
+def _reparent(child, parent) -> None:
+    """Unlink `child` from its old parent and point it at `parent`."""
+    old = child.parent
+    if old is not parent and child in old.children:
+        old.children.remove(child)
+        child._mark_parent_composite_dirty()
+    child.parent = parent
+    child._cached_size = None
+    child._invalidate_abs_pos()
+
+
 class ComponentBase:
+    # whether Tab traversal and clicks give this component keyboard focus
+    _focusable = False
+    # pygame event types _event() handles; None means any. The window only
+    # offers a component the event types it declares here, so display-only
+    # components declare an empty set.
+    _event_types = None
+    # False keeps this component out of static ancestors' composites; it is
+    # painted from its own entry, so swapping its surface never re-bakes them
+    _bakeable = True
+
     __slots__ = [
-        "parent", "window", "_surface", "children", "_size", "blits", "_pos", 
+        "parent", "window", "_surface", "children", "_size", "_blit", "_rect", "_pos", 
         "_was_hovered", "events", "_cached_size", "_composite_surface", 
-        "_composite_dirty", "_last_child_count"
+        "_composite_dirty", "_last_child_count", "_dirty",
+        "_abs_pos", "_static", "_composite_origin", "_visible"
     ]
     def __init__(self, parent, pos, size=None) -> None:
         self.parent = parent
         self._surface = None
         self._pos = pos
+        self._abs_pos = None
 
         # initialize _size: if provided, use it; otherwise default to parent's remaining space
         if size is not None:
@@ -28,7 +51,17 @@ class ComponentBase:
                 self._size = (0, 0)
 
         self.children = []
-        self.blits = []
+        # this component's display list entry: (surface, absolute pos) and
+        # the screen rect it covers; None until first rendered
+        self._blit = None
+        self._rect = None
+        # waiting in the window's render queue
+        self._dirty = False
+        # paint the whole subtree from one cached composite surface
+        self._static = False
+        self._composite_origin = None
+        # hidden subtrees are left out of the display list entirely
+        self._visible = True
         
         self._was_hovered = False
         self._cached_size = None  # Cache the clamped size
@@ -41,78 +74,257 @@ class ComponentBase:
         # simple event listeners: mapping event_name -> list[callable]
         self.events = {}
 
-        parent.addChild(self)
-
-        p = self.parent
+        p = parent
         while not isinstance(p, Window):
             p = p.parent
         self.window = p
 
+        parent.addChild(self)
+
+        # first render happens with the next frame
+        self.mark_dirty()
+
     def addChild(self, child) -> None:
+        """Attach `child` here, moving it from its current parent if needed."""
+        if child in self.children:
+            return
+        _reparent(child, self)
         self.children.append(child)
         self._mark_composite_dirty()
+        self.window._mark_display_dirty()
+        # positions and clamped sizes are relative to the new parent
+        child._mark_subtree_dirty()
+
+    def remove(self) -> None:
+        """Detach this component and its subtree from the parent.
+
+        The component keeps its state and can be attached again with
+        ``parent.addChild(component)``.
+        """
+        parent = self.parent
+        if self in parent.children:
+            parent.children.remove(self)
+            self._mark_parent_composite_dirty()
+        self.window._detach(self._subtree())
+
+    def destroy(self) -> None:
+        """Remove this component for good and release what it holds.
+
+        Listeners, window hooks and surfaces of the whole subtree are
+        dropped; the components must not be used afterwards.
+        """
+        comps = self._subtree()
+        self.remove()
+        queue = self.window._render_queue
+        animations = self.window.animations
+        # children first, so parents still see their subtree in 'destroy'
+        for comp in reversed(comps):
+            comp.emit('destroy')
+            comp._on_destroy()
+            animations.cancel(comp)
+            queue.discard(comp)
+            comp._dirty = False
+            comp.events.clear()
+            comp.children = []
+            comp._surface = None
+            comp._composite_surface = None
+            comp._blit = None
+            comp._rect = None
+
+    def _on_destroy(self) -> None:
+        """Called when this component is destroyed; release external resources."""
+
+    def _subtree(self) -> list:
+        """This component and its descendants, parents first."""
+        out = []
+        stack = [self]
+        while stack:
+            comp = stack.pop()
+            out.append(comp)
+            stack.extend(comp.children[::-1])
+        return out
 
     def _mark_composite_dirty(self) -> None:
         """Mark this component's composite surface as dirty and propagate up the parent chain."""
+        window = getattr(self, 'window', None)
+        if window is not None and window._batch_depth:
+            window._batch_composite.add(self)
+            return
         self._composite_dirty = True
         self._composite_surface = None
+        self._mark_parent_composite_dirty()
+
+    def _mark_parent_composite_dirty(self) -> None:
         # Propagate up to parent
         if hasattr(self.parent, '_mark_composite_dirty'):
+            if self.parent._static:
+                # re-bake with the next frame
+                self.parent.mark_dirty()
             self.parent._mark_composite_dirty()
 
+    def mark_dirty(self) -> None:
+        """Schedule a render() before the next draw instead of rendering now.
+
+        Any number of changes in one frame cost a single render.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self.window._render_queue.add(self)
+
+    def _mark_subtree_dirty(self) -> None:
+        stack = [self]
+        while stack:
+            comp = stack.pop()
+            comp.mark_dirty()
+            stack.extend(comp.children)
+
     def _build_blits(self) -> None:
-        """Build blits using simple direct approach (no composite surfaces)."""
-        # Always use direct approach for maximum performance
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        """Point this component's display list entry at its freshly drawn surface.
 
-    def _rebuild_composite(self) -> None:
-        """Rebuild the composite surface containing this component and all children."""
-        if not self.children:
+        Children keep their own entries and are rendered by the window.
+        """
+        if self._static:
+            self._rebuild_composite()
+            self._update_entry(self._composite_surface, self._composite_origin)
             return
-            
-        # Calculate size needed for composite
-        min_x = 0
-        min_y = 0
-        max_x = self.size[0]
-        max_y = self.size[1]
-        
-        for child in self.children:
-            child_right = child.pos[0] + child.size[0]
-            child_bottom = child.pos[1] + child.size[1]
-            max_x = max(max_x, child_right)
-            max_y = max(max_y, child_bottom)
-            
-        # Create composite surface
-        comp_width = max(1, max_x - min_x)
-        comp_height = max(1, max_y - min_y)
-        try:
-            # Use standard surface creation for speed
-            self._composite_surface = pygame.Surface((comp_width, comp_height), pygame.SRCALPHA)
-            
-            # Blit this component's surface first (background)
-            if self.surface:
-                self._composite_surface.blit(self.surface, (0, 0))
-            
-            # Blit all children on top
-            for child in self.children:
-                child.render()  # Ensure child is up to date
-                if child.children and hasattr(child, '_composite_surface') and child._composite_surface:
-                    # Child has its own composite - use that
-                    self._composite_surface.blit(child._composite_surface, child.pos)
-                elif child.surface:
-                    # Child has no children or no composite - use regular surface
-                    self._composite_surface.blit(child.surface, child.pos)
-                    
-            # Mark as clean
-            self._composite_dirty = False
-            self._last_child_count = len(self.children)
-        except Exception as e:
-            # Fall back to no composite if there's an error
-            self._composite_surface = None
+        # Prefer the surface the component just drew into; some components
+        # (Label) produce surfaces that differ from the clamped size.
+        surf = self._surface if self._surface is not None else self.surface
+        self._update_entry(surf, self.absolute_pos)
+
+    def _update_entry(self, surf, abs_pos, notify: bool = True) -> None:
+        """Point this component's display list entry at `surf` drawn at `abs_pos`."""
+        window = self.window
+        # hidden, removed or not yet listed components are indexed (and
+        # damaged) by the display list rebuild when they enter the tree
+        listed = self in window._z
+        old = self._blit
+        if old is None or old[0] is not surf or old[1] != abs_pos or self._rect.size != surf.get_size():
+            if old is not None and listed:
+                window._damage.append(self._rect)
+            self._blit = (surf, abs_pos)
+            self._rect = pygame.Rect(abs_pos, surf.get_size())
+            if listed:
+                window._spatial.insert(self, self._rect)
+            # the cached frame list holds the old tuple
+            window._frame_blits = None
+        if listed:
+            # Surfaces are redrawn in place, so report the area as damaged
+            window._damage.append(self._rect)
+
+        root = window._baked.get(self) if notify else None
+        if root is not None and not root._composite_dirty:
+            # painted through a static ancestor's composite; re-bake it
+            root._composite_dirty = True
+            root.mark_dirty()
+
+    @property
+    def static(self) -> bool:
+        """Whether this subtree is painted from one cached composite surface.
+
+        Meant for panels that rarely change (settings pages, legends): the
+        whole subtree costs a single blit per frame, and any change inside
+        it re-bakes the composite once. Descendants still receive events.
+        """
+        return self._static
+
+    @static.setter
+    def static(self, value: bool) -> None:
+        value = bool(value)
+        if value != self._static:
+            self._static = value
             self._composite_dirty = True
+            self._composite_surface = None
+            self.window._mark_display_dirty()
+            self._mark_subtree_dirty()
+
+    @property
+    def visible(self) -> bool:
+        """Whether this subtree is shown.
+
+        A hidden subtree is not rendered, offered events or painted; changes
+        made while hidden render once it is shown again.
+        """
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        value = bool(value)
+        if value == self._visible:
+            return
+        self._visible = value
+        self._mark_parent_composite_dirty()
+        if value:
+            self.window._mark_display_dirty()
+        else:
+            # drops focus, hover and index entries of the subtree
+            self.window._detach(self._subtree())
+
+    def _release_surfaces(self) -> None:
+        """Drop the surfaces of this subtree; they are redrawn when needed again."""
+        for comp in self._subtree():
+            comp._surface = None
+            comp._composite_surface = None
+            comp._composite_dirty = True
+            comp._blit = None
+            comp._rect = None
+            comp.mark_dirty()
+
+    @property
+    def blits(self) -> list:
+        """Display list entries of this subtree, in paint order."""
+        if not self._visible:
+            return []
+        out = [self._blit] if self._blit is not None else []
+        for child in self.children:
+            out.extend(child.blits)
+        return out
+
+    def _rebuild_composite(self) -> None:
+        """Flatten this component and its subtree into one composite surface.
+
+        Dirty descendants are rendered first so the bake is current; their
+        entries still track their own positions for hit testing.
+        """
+        own = self._surface if self._surface is not None else self.surface
+        layers = [(own, self.absolute_pos)]
+        # descendants rendered below must not queue another bake
+        self._dirty = True
+        stack = self.children[::-1]
+        while stack:
+            comp = stack.pop()
+            if not comp._visible:
+                continue
+            if not comp._bakeable:
+                # painted above the composite from its own entry
+                continue
+            if comp._static:
+                # a nested static subtree is painted by its own composite
+                if comp._dirty or comp._composite_dirty or comp._composite_surface is None:
+                    comp._dirty = False
+                    comp.render()
+                if comp._blit is not None:
+                    layers.append(comp._blit)
+                continue
+            if comp._dirty:
+                comp._dirty = False
+                comp.render()
+            if comp._blit is not None:
+                layers.append(comp._blit)
+            stack.extend(comp.children[::-1])
+        self._dirty = False
+
+        bounds = pygame.Rect(layers[0][1], own.get_size()).unionall(
+            [pygame.Rect(pos, surf.get_size()) for surf, pos in layers[1:]]
+        )
+        ox, oy = bounds.topleft
+        composite = pygame.Surface((max(1, bounds.w), max(1, bounds.h)), pygame.SRCALPHA)
+        composite.fblits([(surf, (x - ox, y - oy)) for surf, (x, y) in layers])
+
+        self._composite_surface = composite
+        self._composite_origin = (ox, oy)
+        self._composite_dirty = False
+        self._last_child_count = len(self.children)
 
     def _clamp_size(self) -> tuple[int, int]:
         return (
@@ -120,14 +332,21 @@ class ComponentBase:
             max(0, min(self._size[1], self.parent._size[1] - self.pos[1]))
         )
 
+    @classmethod
+    def _handles(cls, event_type) -> bool:
+        return cls._event_types is None or event_type in cls._event_types
+
+    def _hit_rect(self) -> pygame.Rect:
+        """Screen rect used for hit testing (the indexed one once rendered)."""
+        if self._rect is not None:
+            return self._rect
+        return pygame.Rect(self.absolute_pos, self.size)
+
     def _hovered(self, mouse_pos=None) -> tuple[bool, bool]:
         if not mouse_pos:
             mouse_pos = pygame.mouse.get_pos()
 
-        # Cache rect calculation since absolute_pos is now cached
-        abs_pos = self.absolute_pos  # This is now cached
-        rect = pygame.Rect(abs_pos[0], abs_pos[1], *self.size)
-        hovered = rect.collidepoint(mouse_pos)
+        hovered = self._hit_rect().collidepoint(mouse_pos)
         changed = hovered != self._was_hovered
         if changed:
             self._was_hovered = hovered
@@ -157,10 +376,34 @@ class ComponentBase:
     @pos.setter
     def pos(self, value) -> None:
         if self._pos != value:
+            old_x, old_y = self.absolute_pos
+            old_size = self.size
             self._pos = value
             self._cached_size = None  # Invalidate size cache
-            self._mark_composite_dirty()
-            self._build_blits()
+            self._invalidate_abs_pos()
+            # the content did not change, only where it sits in the parent
+            self._mark_parent_composite_dirty()
+            new_x, new_y = self.absolute_pos
+            self._translate_subtree(new_x - old_x, new_y - old_y)
+            if self.size != old_size:
+                # clamped against the parent's edge; needs a new surface
+                self.mark_dirty()
+
+    def _translate_subtree(self, dx: int, dy: int) -> None:
+        """Offset the display list entries of this subtree without re-rendering."""
+        if not (dx or dy):
+            return
+        stack = [self]
+        while stack:
+            comp = stack.pop()
+            entry = comp._blit
+            if entry is not None:
+                x, y = entry[1]
+                comp._update_entry(entry[0], (x + dx, y + dy), notify=False)
+            if comp._composite_origin is not None:
+                ox, oy = comp._composite_origin
+                comp._composite_origin = (ox + dx, oy + dy)
+            stack.extend(comp.children)
 
     @property
     def size(self) -> tuple[int, int]:
@@ -175,30 +418,74 @@ class ComponentBase:
             self._size = value
             self._cached_size = None  # Invalidate size cache
             self._mark_composite_dirty()
-            self._build_blits()
             self._surface = None  # Force recreation on next access
-            self.render()
+            self.mark_dirty()
 
     @property
     def absolute_pos(self) -> tuple[int, int]:
-        """Calculate absolute position by traversing up the parent chain."""
-        x, y = self.pos
-        parent = self.parent
-        while hasattr(parent, 'pos') and not isinstance(parent, type(self.window)):
-            parent_pos = parent.pos
-            x += parent_pos[0]
-            y += parent_pos[1]
-            parent = parent.parent
-        return (x, y)
+        """Position on the window, cached until this component or an ancestor moves."""
+        abs_pos = self._abs_pos
+        if abs_pos is None:
+            x, y = self._pos
+            parent = self.parent
+            if isinstance(parent, ComponentBase):
+                px, py = parent.absolute_pos
+                x += px
+                y += py
+            abs_pos = self._abs_pos = (x, y)
+        return abs_pos
+
+    def _invalidate_abs_pos(self) -> None:
+        """Drop cached absolute positions of this subtree."""
+        stack = [self]
+        while stack:
+            comp = stack.pop()
+            if comp._abs_pos is None and comp is not self:
+                # descendants are only cached through their parent
+                continue
+            comp._abs_pos = None
+            stack.extend(comp.children)
+
+    @property
+    def focused(self) -> bool:
+        return self.window._focus is self
+
+    def focus(self) -> None:
+        self.window.set_input_focus(self)
+
+    def _on_focus(self) -> None:
+        """Called when this component gains keyboard focus."""
+
+    def _on_blur(self) -> None:
+        """Called when this component loses keyboard focus."""
+
+    def _activation_key(self, event: pygame.event.Event) -> bool:
+        """Whether `event` is Space/Enter pressed while this component has focus."""
+        return (
+            event.type == pygame.KEYDOWN
+            and event.key in (pygame.K_SPACE, pygame.K_RETURN, pygame.K_KP_ENTER)
+            and self.focused
+        )
+
+    def animate(self, attr: str, to, duration: float = 200, easing='ease_out_cubic', on_done=None):
+        """Tween `attr` to `to` over `duration` ms on the window's animator.
+
+        The component re-renders once per frame while it moves.
+        """
+        return self.window.animations.animate(self, attr, to, duration, easing, on_done)
 
     # Placeholders, will be overwritten
     def render(self) -> None:
         ...
 
     def _event(self, event: pygame.event.Event) -> bool:
+        if self.window._routing:
+            # the window offers routed events to each component itself
+            return False
         return any(
             self.children[i]._event(event)
             for i in range(len(self.children) - 1, -1, -1)
+            if self.children[i]._visible
         )
 
     # Lightweight event emitter for components
@@ -223,7 +510,8 @@ class ComponentBase:
     def emit(self, event_name: str, *args, **kwargs):
         for cb in list(self.events.get(event_name, [])):
             try:
-                cb(*args, **kwargs)
+                # async listeners run as tasks under window.run_async()
+                self.window._settle(cb(*args, **kwargs))
             except Exception:
                 # swallow exceptions from listeners to avoid breaking UI loop
                 pass
@@ -7,6 +7,9 @@ import pygame
 
 
 class Button(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     __slots__ = [
         "_size",
         "_ov_bg_color",
@@ -62,7 +65,7 @@ class Button(ComponentBase):
         if self._text != value:
             self._text = value
             self._rendered = False  # Mark for re-render
-            self.render()
+            self.mark_dirty()
 
     # Resolved at render time so theme updates propagate immediately
     @property
@@ -85,14 +88,16 @@ class Button(ComponentBase):
         if event.type == pygame.MOUSEMOTION:
             # re-render on hover change so colors update
             if self._hovered(event.pos)[1]:
-                self.render()
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self._hovered(event.pos)[0]:
-                try:
-                    self.on_click(self.text)
-                except Exception:
-                    pass
-                return True  # Consume the event
+                self.mark_dirty()
+        elif (
+            event.type == pygame.MOUSEBUTTONDOWN and self._hovered(event.pos)[0]
+            or self._activation_key(event)
+        ):
+            try:
+                self.window._settle(self.on_click(self.text))
+            except Exception:
+                pass
+            return True  # Consume the event
         return False
 
     def render(self) -> None:
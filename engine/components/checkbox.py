@@ -4,6 +4,9 @@ from .. import theme
 import pygame
 
 class CheckBox(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     __slots__ = [
         "_size", "_text", "_font",
         "_ov_bg_color", "_ov_border_color", "_ov_bg_checked_color", "_ov_bg_hovered_color",
@@ -95,25 +98,27 @@ class CheckBox(ComponentBase):
     @checked.setter
     def checked(self, value: bool):
         self._checked = value
-        self.render()
+        self.mark_dirty()
 
     def _event(self, event):
         if event.type == pygame.MOUSEMOTION:
             if self._hovered(event.pos)[1]:
-                self.render()
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self._hovered(event.pos)[0]:
-                # toggle
-                self._checked = not self._checked
-                # call callback
-                try:
-                    self.on_change(self._checked)
-                except Exception:
-                    pass
-                # emit event for listeners
-                self.emit('change', self._checked)
-                self.render()
-                return True  # Consume the event
+                self.mark_dirty()
+        elif (
+            event.type == pygame.MOUSEBUTTONDOWN and self._hovered(event.pos)[0]
+            or self._activation_key(event)
+        ):
+            # toggle
+            self._checked = not self._checked
+            # call callback
+            try:
+                self.on_change(self._checked)
+            except Exception:
+                pass
+            # emit event for listeners
+            self.emit('change', self._checked)
+            self.mark_dirty()
+            return True  # Consume the event
 
         return False
 
@@ -180,10 +185,7 @@ class CheckBox(ComponentBase):
                     pass
 
         # rebuild blits and render children
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
 
 __all__ = ["CheckBox"]
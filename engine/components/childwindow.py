@@ -8,6 +8,8 @@ from typing import Callable, Optional, Tuple, Any
 
 
 class ChildWindow(ComponentBase):
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
     __slots__ = [
         '_title', '_size', '_toolbar_height', '_resizable', '_draggable',
         '_minimized', '_maximized', '_closable', '_minimizable', '_maximizable',
@@ -209,11 +211,7 @@ class ChildWindow(ComponentBase):
         if self._on_close:
             self._on_close(self)
         self.emit('close', self)
-        # Optionally remove from parent
-        if hasattr(self.parent, 'children') and self in self.parent.children:
-            self.parent.children.remove(self)
-            if hasattr(self.parent, '_mark_composite_dirty'):
-                self.parent._mark_composite_dirty()
+        self.remove()
 
     def _handle_minimize(self) -> None:
         """Handle minimize button click."""
@@ -253,11 +251,12 @@ class ChildWindow(ComponentBase):
 
     def _recreate_ui(self) -> None:
         """Recreate UI components after size/state changes."""
-        # Clear children and recreate
-        self.children.clear()
+        # destroy the old title bar so focus, hover and listeners let go of it
+        for child in list(self.children):
+            child.destroy()
         self._create_ui_components()
         self._rendered = False
-        self.render()
+        self.mark_dirty()
 
     @property
     def title(self) -> str:
@@ -290,12 +289,9 @@ class ChildWindow(ComponentBase):
     def add_content(self, component: ComponentBase) -> None:
         """Add a component to the content area."""
         if self._content_area:
-            # Update the component's parent to be the content area
-            component.parent = self._content_area
             self._content_area.addChild(component)
         else:
             # Fallback to adding to window frame
-            component.parent = self._window_frame
             self._window_frame.addChild(component)
 
     def _event(self, event: pygame.event.Event) -> bool:
@@ -368,7 +364,7 @@ class ChildWindow(ComponentBase):
         if not self._rendered:
             # The window frame and its children will handle rendering
             if hasattr(self, '_window_frame'):
-                self._window_frame.render()
+                self._window_frame.mark_dirty()
             self._rendered = True
 
         # Mark composite as dirty and build blits
@@ -6,6 +6,9 @@ from ..window import Window
 
 
 class Dropdown(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     def __init__(self, parent, pos, size=(200, 34), options=None, selected=0, bg=None, text_color=None, border_color=None, font=(None, 20), on_select=None):
         self._size = size
         self._options = options or []
@@ -46,7 +49,7 @@ class Dropdown(ComponentBase):
             hovered = pygame.Rect(ax, ay, self._size[0], exp_h).collidepoint((mx, my))
             if hovered != getattr(self, '_was_hovered', False):
                 self._was_hovered = hovered
-                self.render()
+                self.mark_dirty()
             return bool(self._open and hovered)
 
         # MOUSEBUTTONDOWN: handle toggle / option click / close on outside
@@ -87,7 +90,7 @@ class Dropdown(ComponentBase):
         # KEYDOWN: space/enter opens, arrows navigate, escape/enter close
         if event.type == pygame.KEYDOWN:
             key = event.key
-            focused = getattr(self, '_was_hovered', False)
+            focused = self.focused or getattr(self, '_was_hovered', False)
             if not self._open and focused and key in (pygame.K_SPACE, pygame.K_RETURN):
                 self._handle_dropdown_open()
                 return True
@@ -101,12 +104,12 @@ class Dropdown(ComponentBase):
 
             if key in (pygame.K_UP, pygame.K_w) and self._options:
                 self._selected_index = (self._selected_index - 1) % len(self._options)
-                self.render()
+                self.mark_dirty()
                 return True
 
             if key in (pygame.K_DOWN, pygame.K_s) and self._options:
                 self._selected_index = (self._selected_index + 1) % len(self._options)
-                self.render()
+                self.mark_dirty()
                 return True
 
             if key in (pygame.K_RETURN, pygame.K_KP_ENTER):
@@ -132,7 +135,7 @@ class Dropdown(ComponentBase):
                     print(f"[Dropdown] open: popup will be requested; popup_gid(before)={getattr(self,'_popup_gid',None)}; window.blits.layers={len(getattr(w,'blits',[]))}")
             except Exception:
                 pass
-        self.render()
+        self.mark_dirty()
 
     def _close(self):
         popup_h = self._item_height * len(self._options)
@@ -195,13 +198,18 @@ class Dropdown(ComponentBase):
             pass
 
         self._open = False
-        self.render()
+        self.mark_dirty()
 
     def _set_dropdown_closed(self):
         self._open = False
-        self.render()
+        self.mark_dirty()
         return
 
+    def _on_destroy(self) -> None:
+        # take the popup overlay down with the dropdown
+        if self._open:
+            self._close()
+
     def render(self) -> None:
         # Simplified dropdown rendering
         bg = self.bg
@@ -235,10 +243,7 @@ class Dropdown(ComponentBase):
         pts = [(ax - 6, ay - 3), (ax + 6, ay - 3), (ax, ay + 5)]
         pygame.draw.polygon(self.surface, txt_col, pts)
 
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
         if not (self._open and self._options):
             return
@@ -331,8 +336,6 @@ class Dropdown(ComponentBase):
                             print(f"[Dropdown] fallback append without gid; layer1-count={len(w.blits[1])}")
                     except Exception:
                         pass
-        else:
-            self.blits.append((popup, popup_pos))
 
 
 __all__ = ['Dropdown']
@@ -1,18 +1,96 @@
-from ..text import get_font, draw, _render_selection, _measure_caret_x
+from ..text import get_font, draw_lines, _render_selection, _measure_caret_x, prefix_widths
 from ..input import InputManager
+from ..buffer import TextBuffer
 from .base import ComponentBase
 from .. import theme
 import pygame
-import time
+
+# caret blink half-period in milliseconds
+CARET_BLINK_MS = 500
+
+
+class _Caret(ComponentBase):
+    """Caret and IME composition of a Field, composited above its text.
+
+    The overlay stays in the display list and keeps two surfaces, with and
+    without the caret bar. A blink points its entry at the other one, so it
+    costs neither a render, a display list rebuild nor a re-bake.
+    """
+    # never offered events; clicks fall through to the field underneath
+    _event_types = frozenset()
+    # blinks swap this entry; never bake it into a static ancestor
+    _bakeable = False
+
+    __slots__ = ['_origin', '_height', '_color', '_comp_surf', '_blank']
+
+    def __init__(self, parent) -> None:
+        # caret top-left inside the overlay, line height, bar color
+        self._origin = (0, 0)
+        self._height = 1
+        self._color = (250, 250, 250)
+        self._comp_surf = None
+        # same as the surface, minus the caret bar
+        self._blank = None
+        super().__init__(parent, (0, 0), (2, 1))
+
+    def place(self, rect: pygame.Rect, clip: pygame.Rect, color, comp_surf=None) -> None:
+        """Show the caret at `rect` (field coordinates), clipped to `clip`."""
+        full = rect.union(pygame.Rect(rect.topleft, comp_surf.get_size())) if comp_surf else rect
+        area = full.clip(clip)
+        self._origin = (rect.x - area.x, rect.y - area.y)
+        self._height = rect.h
+        self._color = color
+        self._comp_surf = comp_surf
+        self.pos = area.topleft
+        self.size = area.size
+        self.mark_dirty()
+
+    def clear(self) -> None:
+        """Drop the composition and show nothing until placed again."""
+        if self._comp_surf is not None:
+            self._comp_surf = None
+            self.mark_dirty()
+        self.show()
+
+    def show(self) -> None:
+        """Point the entry at the surface matching the field's blink phase."""
+        if self._blank is None:
+            # not rendered yet; render() calls back here
+            return
+        field = self.parent
+        solid = field._caret_visible and field._focused
+        self._update_entry(self._surface if solid else self._blank, self.absolute_pos)
+
+    def render(self) -> None:
+        surf = self.surface
+        blank = self._blank
+        if blank is None or blank.get_size() != surf.get_size():
+            blank = self._blank = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 0))
+        blank.fill((0, 0, 0, 0))
+        x, y = self._origin
+        pygame.draw.rect(surf, self._color, (x, y, 2, self._height))
+        comp = self._comp_surf
+        if comp is not None:
+            for target in (surf, blank):
+                target.blit(comp, (x, y))
+                pygame.draw.rect(target, (80, 80, 80), (x, y + self._height - 2, comp.get_width(), 2))
+        self.show()
 
 
 class Field(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((
+        pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+        pygame.KEYDOWN, pygame.TEXTINPUT, pygame.TEXTEDITING
+    ))
+
     __slots__ = [
-        '_value', '_font', '_color', '_bg_color', '_caret',
+        '_buffer', '_font', '_color', '_bg_color', '_caret',
         '_sel_start', '_sel_end', '_placeholder', 'on_enter',
-        '_caret_visible', '_last_blink', '_dragging', '_composition',
+        '_caret_visible', '_caret_overlay', '_blink_timer', '_dragging', '_composition',
         '_focused', '_scroll_x', '_scroll_y', '_sel_anchor', '_user_scrolled',
-        'input_manager', '_prev_caret', '_prev_value', '_max_scroll_y',
+        'input_manager', '_prev_caret', '_prev_version', '_max_scroll_y', '_max_line_w',
         '_composite_surface', '_composite_dirty', '_last_child_count'
     ]
 
@@ -26,7 +104,8 @@ class Field(ComponentBase):
             size=None,
             multiline=False
         ):
-        self._value = value
+        # editable text with a line index; edits cost the edited line only
+        self._buffer = TextBuffer(value)
         self._font = font
         self._color = color
         self._bg_color = bg_color
@@ -36,9 +115,9 @@ class Field(ComponentBase):
         self._placeholder = placeholder
         self.on_enter = on_enter
 
-        # caret blink state
+        # caret blink phase, toggled by a window interval while focused
         self._caret_visible = True
-        self._last_blink = time.time()
+        self._blink_timer = None
 
         # horizontal scroll offset so caret is always visible
         self._scroll_x = 0
@@ -66,16 +145,53 @@ class Field(ComponentBase):
         # time of last manual user scroll (wheel) to avoid auto-scroll fighting user
         self._user_scrolled = 0
 
+        # widest line in pixels; None until measured
+        self._max_line_w = None
+
         super().__init__(parent, pos, size)
 
+        # blank unless focused or composing
+        self._caret_overlay = _Caret(self)
+
+    def _on_focus(self) -> None:
+        self._focused = True
+        self._restart_blink()
+        self.mark_dirty()
+
+    def _on_blur(self) -> None:
+        self._focused = False
+        self._dragging = False
+        self._composition = ''
+        if self._blink_timer is not None:
+            self.window.cancel(self._blink_timer)
+            self._blink_timer = None
+        self.mark_dirty()
+
+    def _blink(self) -> None:
+        self._caret_visible = not self._caret_visible
+        self._caret_overlay.show()
+
+    def _restart_blink(self) -> None:
+        """Show the caret solid and start a new blink period."""
+        self._caret_visible = True
+        if self._blink_timer is not None:
+            self.window.cancel(self._blink_timer)
+        self._blink_timer = self.window.set_interval(self._blink, CARET_BLINK_MS)
+
     @property
     def value(self):
-        return self._value
+        return self._buffer.text
 
     @value.setter
     def value(self, v):
-        self._value = v
-        self.render()
+        self._buffer.set(v)
+        self._max_line_w = None
+        self.mark_dirty()
+
+    @property
+    def buffer(self) -> TextBuffer:
+        """The editable text buffer backing `value`."""
+        return self._buffer
 
     @property
     def font(self):
@@ -84,7 +200,8 @@ class Field(ComponentBase):
     @font.setter
     def font(self, f):
         self._font = f
-        self.render()
+        self._max_line_w = None
+        self.mark_dirty()
 
     @property
     def color(self):
@@ -93,7 +210,7 @@ class Field(ComponentBase):
     @color.setter
     def color(self, c):
         self._color = c
-        self.render()
+        self.mark_dirty()
 
     @property
     def bg_color(self):
@@ -102,7 +219,7 @@ class Field(ComponentBase):
     @bg_color.setter
     def bg_color(self, c):
         self._bg_color = c
-        self.render()
+        self.mark_dirty()
 
     @property
     def placeholder(self):
@@ -111,7 +228,7 @@ class Field(ComponentBase):
     @placeholder.setter
     def placeholder(self, p):
         self._placeholder = p
-        self.render()
+        self.mark_dirty()
 
     @property
     def multiline(self):
@@ -158,10 +275,10 @@ class Field(ComponentBase):
     # determine text and color. Render placeholder separately so it does
     # not affect caret measurement/placement.
         placeholder_text = self._placeholder
-        value_text = self._value
+        buf = self._buffer
 
         # whether the field currently has no user-visible characters
-        is_empty = (value_text == '')
+        is_empty = not len(buf)
         if self._bg_color is not None:
             value_color = self._color
         else:
@@ -175,54 +292,45 @@ class Field(ComponentBase):
         if is_empty and not focused and placeholder_text:
             ph_surf = font.render(placeholder_text, True, placeholder_color)
             surf.blit(ph_surf, (padding_x, padding_y))
+            self._caret_overlay.clear()
             # finalize blits
-            self.blits = [(self._surface, self.absolute_pos)]
-            for child in self.children:
-                text_x = padding_x - int(getattr(self, '_scroll_x', 0))
-                child.render()
-                self.blits.extend(child.blits)
+            self._build_blits()
             return
 
-        # prepare text and ensure caret is visible by adjusting horizontal scroll
-        text = value_text
+        # single-line fields measure the whole value; multiline ones work per line
+        text = '' if self.multiline else buf.text
 
-        # caret blink toggle
-        if time.time() - self._last_blink > 0.5:
-            self._caret_visible = not self._caret_visible
-            self._last_blink = time.time()
+        # lines are drawn every `line_step` pixels, like text.draw
+        line_h = font.size('T')[1]
+        line_step = max(1, int(line_h * 1.2))
 
         if self.multiline:
-            lines = text.split('\n')
-            pos = max(0, min(self._caret, len(text)))
-            line_index = 0
-            col = 0
-            for i, ln in enumerate(lines):
-                if pos <= len(ln):
-                    line_index = i
-                    col = pos
-                    line_text = ln
-                    break
-                pos -= (len(ln) + 1)
-            else:
-                line_index = len(lines) - 1
-                line_text = lines[-1]
-                col = len(line_text)
+            line_index, col = buf.line_of(self._caret)
+            line_text = buf.line(line_index)
             caret_x = _measure_caret_x(line_text, font, col)
             # compute caret position (line/column) and update horizontal scroll so caret is visible
-            line_spacing = 1.2
-            caret_y = int(line_index * font.size(line_text)[1] * line_spacing)
+            caret_y = line_index * line_step
         else:
             caret_x = _measure_caret_x(text, font, self._caret)
             caret_y = 0
 
         content_width = self.size[0] - padding_x * 2
 
-        # compute widest line so we can clamp horizontal scroll
-        lines_for_width = text.split('\n') if text else ['']
-        try:
-            max_line_w = max(font.size(ln)[0] for ln in lines_for_width)
-        except Exception:
-            max_line_w = content_width
+        # widest line seen so far, to clamp horizontal scroll. The document
+        # is never measured as a whole: the width grows with the caret line,
+        # the lines an edit touched (typed or pasted text) and the lines
+        # drawn below. It restarts after value/font changes; lines that
+        # shrink keep the old width until then.
+        max_line_w = self._max_line_w
+        prev_caret = getattr(self, '_prev_caret', None)
+        if max_line_w is None or prev_caret is None:
+            max_line_w = 0
+        elif getattr(self, '_prev_version', None) != buf.version:
+            a = buf.line_of(min(prev_caret, self._caret))[0]
+            b = buf.line_of(max(prev_caret, self._caret))[0]
+            max_line_w = max(max_line_w, *(font.size(ln)[0] for ln in buf.lines(a, b + 1)))
+        caret_line = line_text if self.multiline else text
+        max_line_w = max(max_line_w, prefix_widths(caret_line, font)[-1])
 
         # Maximum scroll so the rightmost edge of text is at the middle of the content area
         max_scroll_x = max(0, int(max_line_w - content_width / 2))
@@ -234,8 +342,8 @@ class Field(ComponentBase):
         # and clear the manual-scroll lock when a change is detected.
         if getattr(self, '_user_scrolled', False):
             prev_caret = getattr(self, '_prev_caret', None)
-            prev_value = getattr(self, '_prev_value', None)
-            if prev_caret != self._caret or prev_value != self._value:
+            prev_version = getattr(self, '_prev_version', None)
+            if prev_caret != self._caret or prev_version != buf.version:
                 self._user_scrolled = False
 
         if focused and not getattr(self, '_user_scrolled', False):
@@ -263,26 +371,11 @@ class Field(ComponentBase):
         else:
             content_offset_x = text_x
 
-        # compute total text height so we request a draw surface tall enough to contain
-        # the rendered lines (prevents bottom lines from being dropped when scrolled)
+        # total text height bounds vertical scrolling
         if self.multiline:
-            lines_all = text.split('\n') if text else ['']
-            # line height using font metrics; use a consistent line spacing factor
-            line_h = font.size('T')[1]
-            line_spacing = 1.2
-            total_text_height = int(len(lines_all) * line_h * line_spacing)
+            total_text_height = buf.line_count * line_step
         else:
-            total_text_height = font.size(text)[1] if text else font.size('T')[1]
-
-    # render text using the fast cached draw function and blit it shifted by scroll
-        # request a larger width/height so we can shift the blit and still keep pixels
-        extra_h = font.size('T')[1] if hasattr(font, 'size') else 0
-        # draw height should include visible content height, extra line gap and margins
-        draw_height = max(content_height + int(extra_h) + margin * 2, total_text_height + margin * 2, content_height + int(getattr(self, '_scroll_y', 0)))
-        # choose draw width large enough to contain the longest line so right-side
-        # characters don't get dropped when scrolled.
-        draw_width = max(content_width + margin * 2 + int(getattr(self, '_scroll_x', 0)), max_line_w + margin * 2)
-        text_surf = draw(text, font, value_color, self._bg_color, width=draw_width, height=draw_height)
+            total_text_height = line_h
 
         # compute maximum vertical scroll so the user cannot scroll indefinitely.
         # We choose a max that allows the caret to be centered in the content area
@@ -299,8 +392,7 @@ class Field(ComponentBase):
         # manually scrolled with the wheel. Compute desired scroll and clamp it.
         if self.multiline and focused and not getattr(self, '_user_scrolled', False):
             try:
-                # character/line height and caret top/bottom in text coordinate space
-                line_h = font.size('T')[1]
+                # caret top/bottom in text coordinate space
                 caret_top = caret_y
                 caret_bottom = caret_y + line_h
                 # compute visible text area in text coordinates (relative to text origin)
@@ -329,65 +421,48 @@ class Field(ComponentBase):
         else:
             content_offset_y = padding_y
 
-        # draw selection first using content offsets
-        if self._sel_start != self._sel_end:
-            _render_selection(surf, text, self._sel_start, self._sel_end, font, (50, 100, 200), content_offset_x, content_offset_y, line_spacing=1.2)
-
-        surf.blit(text_surf, (content_offset_x, content_offset_y))
-
-        # draw caret on top of text when focused
-        if self._caret_visible and focused:
-            if self.multiline:
-                # character height for caret; use the base line height
-                ch = font.size(line_text)[1]
-                caret_rect = pygame.Rect(int(content_offset_x + caret_x), int(content_offset_y + caret_y), 2, ch)
-            else:
-                ci = max(0, min(self._caret, len(text)))
-                cx = _measure_caret_x(text, font, ci)
-                ch = font.size(text)[1]
-                caret_rect = pygame.Rect(int(content_offset_x + cx), int(content_offset_y), 2, ch)
-            pygame.draw.rect(surf, caret_color, caret_rect)
-
-        # draw IME composition (underlined) at caret position if present
-        if getattr(self, '_composition', None):
-            comp = self._composition
-            comp_surf = font.render(comp, True, (80, 80, 80))
-            if self.multiline:
-                # compute line index and index within the line
-                lines = text.split('\n')
-                pos = max(0, min(self._caret, len(text)))
-                li = 0
-                for li, ln in enumerate(lines):
-                    if pos <= len(ln):
-                        col = pos
-                        line_text = ln
-                        break
-                    pos -= (len(ln) + 1)
-                else:
-                    li = len(lines) - 1
-                    line_text = lines[-1]
-                    col = len(line_text)
-                cx = _measure_caret_x(line_text, font, col)
-                ly = int(li * font.size(line_text)[1] * 1.2)
-                surf.blit(comp_surf, (int(content_offset_x + cx), int(content_offset_y + ly)))
-                underline_rect = pygame.Rect(int(content_offset_x + cx), int(content_offset_y + ly + font.size(line_text)[1] - 2), comp_surf.get_width(), 2)
-            else:
-                cx = _measure_caret_x(text, font, self._caret)
-                surf.blit(comp_surf, (int(content_offset_x + cx), int(content_offset_y)))
-                underline_rect = pygame.Rect(int(content_offset_x + cx), int(content_offset_y + font.size(text)[1] - 2), comp_surf.get_width(), 2)
-            pygame.draw.rect(surf, (80, 80, 80), underline_rect)
+        # only the lines crossing the content area are drawn, so the cost does
+        # not depend on the length of the document
+        first = max(0, (inner_rect.top - content_offset_y) // line_step)
+        last = min(buf.line_count, (inner_rect.bottom - content_offset_y) // line_step + 1)
+        if first < last:
+            first_y = content_offset_y + first * line_step
+            # draw selection first using content offsets
+            if self._sel_start != self._sel_end:
+                _render_selection(
+                    surf, None, self._sel_start, self._sel_end, font, (50, 100, 200),
+                    content_offset_x, first_y, line_spacing=1.2,
+                    lines=buf.lines(first, last), base=buf.line_start(first)
+                )
+            draw_lines(surf, buf.lines(first, last), font, value_color, self._bg_color,
+                       content_offset_x, first_y, line_step, inner_rect)
+            # drawing just cached these widths
+            max_line_w = max(max_line_w, *(prefix_widths(ln, font)[-1] for ln in buf.lines(first, last)))
+        self._max_line_w = max_line_w
+
+        # the caret and IME composition live on a small overlay above the
+        # text, so blinking does not re-render the field
+        composition = self._composition
+        overlay = self._caret_overlay
+        if not (focused or composition):
+            overlay.clear()
+        else:
+            caret_rect = pygame.Rect(int(content_offset_x + caret_x), int(content_offset_y + caret_y), 2, line_h)
+            comp_surf = font.render(composition, True, (80, 80, 80)) if composition else None
+            if focused and (prev_caret != self._caret or getattr(self, '_prev_version', None) != buf.version):
+                # keep the caret solid while it moves or text is typed
+                self._restart_blink()
+            overlay.place(caret_rect, inner_rect, caret_color, comp_surf)
+
         # restore clip so subsequent drawing isn't clipped
         surf.set_clip(prev_clip)
 
         # finalize blits
-        self.blits = [(self._surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
         # remember caret/value for next render so we can detect user edits
         self._prev_caret = self._caret
-        self._prev_value = self._value
+        self._prev_version = buf.version
 
     def _event(self, event: pygame.event.Event) -> bool:
         handled = False
@@ -6,6 +6,8 @@ import pygame
 
 
 class Frame(ComponentBase):
+    _event_types = frozenset()
+
     __slots__ = ["_size", "_ov_color", "_corner_radius", "_rendered"]
 
     def __init__(
@@ -28,7 +30,7 @@ class Frame(ComponentBase):
         if self._ov_color != value:
             self._ov_color = value
             self._rendered = False  # Mark for re-render
-            self.render()
+            self.mark_dirty()
 
     @property
     def corner_radius(self) -> Any:
@@ -38,7 +40,7 @@ class Frame(ComponentBase):
     def corner_radius(self, value) -> None:
         self._corner_radius = value
         self._rendered = False  # Mark for re-render
-        self.render()
+        self.mark_dirty()
 
     def render(self) -> None:
         # Only render if we haven't rendered yet or something changed
@@ -5,6 +5,9 @@ import pygame
 
 
 class IconButton(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     __slots__ = [
         "_size",
         "_icon",
@@ -44,7 +47,7 @@ class IconButton(ComponentBase):
     @icon.setter
     def icon(self, surf: pygame.Surface) -> None:
         self._icon = surf
-        self.render()
+        self.mark_dirty()
 
     # Resolved at render time so theme updates propagate immediately
     @property
@@ -59,14 +62,16 @@ class IconButton(ComponentBase):
         if event.type == pygame.MOUSEMOTION:
             # re-render on hover change so colors update
             if self._hovered(event.pos)[1]:
-                self.render()
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self._hovered(event.pos)[0]:
-                try:
-                    self.on_click(self)
-                except Exception:
-                    pass
-                return True  # Consume the event
+                self.mark_dirty()
+        elif (
+            event.type == pygame.MOUSEBUTTONDOWN and self._hovered(event.pos)[0]
+            or self._activation_key(event)
+        ):
+            try:
+                self.window._settle(self.on_click(self))
+            except Exception:
+                pass
+            return True  # Consume the event
         return False
 
     def render(self) -> None:
@@ -91,10 +96,7 @@ class IconButton(ComponentBase):
             except Exception:
                 pass
 
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
 
 __all__ = ["IconButton"]
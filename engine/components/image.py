@@ -4,6 +4,8 @@ import pygame
 
 
 class Image(ComponentBase):
+    _event_types = frozenset()
+
     __slots__ = [
         '_image_source', '_original_surface', '_fit_mode', 
         '_size', '_rendered', '_scaling_filter', '_alpha', '_image_cache'
@@ -143,7 +145,7 @@ class Image(ComponentBase):
             if value is not None:
                 self._original_surface = self._load_and_convert_image(value)
                 self._rendered = False
-                self.render()
+                self.mark_dirty()
 
     @property
     def image_surface(self) -> Optional[pygame.Surface]:
@@ -155,7 +157,7 @@ class Image(ComponentBase):
         if value is not None:
             self._original_surface = value.copy()
             self._rendered = False
-            self.render()
+            self.mark_dirty()
 
     @property
     def fit_mode(self) -> str:
@@ -166,7 +168,7 @@ class Image(ComponentBase):
         if self._fit_mode != value:
             self._fit_mode = value
             self._rendered = False
-            self.render()
+            self.mark_dirty()
 
     @property
     def alpha(self) -> int:
@@ -178,7 +180,7 @@ class Image(ComponentBase):
         if self._alpha != value:
             self._alpha = value
             self._rendered = False
-            self.render()
+            self.mark_dirty()
 
     def _scale_image(self) -> pygame.Surface:
         """Scale the original image based on fit_mode and component size."""
@@ -295,7 +297,7 @@ class Image(ComponentBase):
 
             self._original_surface = self._load_and_convert_image(self._image_source)
             self._rendered = False
-            self.render()
+            self.mark_dirty()
         except Exception as e:
             print(f"Warning: Could not reload image: {e}")
 
@@ -4,6 +4,8 @@ from .. import text
 
 
 class Label(ComponentBase):
+    _event_types = frozenset()
+
     __slots__ = ['_text', '_font', '_ov_color', '_ov_bg_color', '_size', '_line_spacing', '_wrap', '_composite_surface', '_composite_dirty', '_last_child_count']
 
     def __init__(
@@ -31,7 +33,7 @@ class Label(ComponentBase):
     @text.setter
     def text(self, value):
         self._text = value
-        self.render()
+        self.mark_dirty()
 
     @property
     def font(self):
@@ -40,7 +42,7 @@ class Label(ComponentBase):
     @font.setter
     def font(self, value):
         self._font = value
-        self.render()
+        self.mark_dirty()
 
     @property
     def color(self):
@@ -49,7 +51,7 @@ class Label(ComponentBase):
     @color.setter
     def color(self, value):
         self._ov_color = value
-        self.render()
+        self.mark_dirty()
 
     @property
     def bg_color(self):
@@ -58,7 +60,7 @@ class Label(ComponentBase):
     @bg_color.setter
     def bg_color(self, value):
         self._ov_bg_color = value
-        self.render()
+        self.mark_dirty()
 
     @property
     def line_spacing(self):
@@ -67,7 +69,7 @@ class Label(ComponentBase):
     @line_spacing.setter
     def line_spacing(self, value):
         self._line_spacing = value
-        self.render()
+        self.mark_dirty()
 
     @property
     def wrap(self):
@@ -76,7 +78,7 @@ class Label(ComponentBase):
     @wrap.setter
     def wrap(self, value):
         self._wrap = value
-        self.render()
+        self.mark_dirty()
 
     def render(self):
         if self._wrap:
@@ -91,9 +93,6 @@ class Label(ComponentBase):
                 *self.size, self._line_spacing
             )
 
-        self.blits = [(self._surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
 
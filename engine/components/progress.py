@@ -1,10 +1,12 @@
 from .base import ComponentBase
 from .. import theme
 import pygame
-import math
+import warnings
 
 
 class ProgressBar(ComponentBase):
+    _event_types = frozenset()
+
     __slots__ = [
         "_size",
         "_value",
@@ -14,17 +16,10 @@ class ProgressBar(ComponentBase):
         "_ov_knob_color",
         "_corner_radius",
         "_progress_display",
-        "_progress_target",
         "_progressive",
         "_progress_rate",
-        "_min_progress_rate",
         "_progress_slowdown",
-        "_last_tick",
-        "_last_rendered_fill",
-        "_last_rendered_fill_float",
-        "_last_rendered_width",
-        "_last_rendered_height",
-        "_last_rendered_target",
+        "_min_progress_rate",
         "_composite_surface",
         "_composite_dirty",
         "_last_child_count",
@@ -51,33 +46,18 @@ class ProgressBar(ComponentBase):
         self._ov_knob_color = knob_color
         self._corner_radius = corner_radius
 
-        # progressive smoothing defaults
+        # value currently drawn; eases towards _value when progressive
         self._progress_display = float(value)
-        self._progress_target = float(value)
 
-        self._progressive = False  # Disable progressive animation for render-on-change system
-        # units per second base rate; actual rate will be divided by (1 + slowdown*distance)
+        self._progressive = False
+        # responsiveness; an eased change takes about 3 / rate seconds
         self._progress_rate = 10
-        # minimum forward progress units per second when target > display
-        self._min_progress_rate = 2.0
-
-        # slowdown coefficient (higher => more slowdown when far away)
+        # deprecated tuning knobs, folded into the animation duration
         self._progress_slowdown = 0.01
-        self._last_tick = None
-        self._last_rendered_fill = -1
-        self._last_rendered_fill_float = -9999.0
-        self._last_rendered_width = -1
-        self._last_rendered_height = -1
-        self._last_rendered_target = -9999.0
+        self._min_progress_rate = 2.0
 
         super().__init__(parent, pos, self._size)
 
-        @self.window.event('draw')
-        def _handler(frame):
-            dt_ms = self.window.dt
-            dt = max(0.0, dt_ms / 1000.0)
-            self._frame_progress_update(dt)
-
     @property
     def value(self):
         return self._value
@@ -88,14 +68,15 @@ class ProgressBar(ComponentBase):
         if v == self._value:
             return
         self._value = v
-        # set target for progressive mode
-        self._progress_target = float(self._value)
-        # In render-on-change system, update display immediately if not progressive
-        if not self._progressive:
-            self._progress_display = float(self._value)
+        if self._progressive:
+            # retargets a running animation from where the bar is now
+            distance = abs(v - self._progress_display)
+            self.animate('_progress_display', float(v), self._progress_duration(distance))
+        else:
+            self._progress_display = float(v)
         self.emit("change", self._value)
         # ensure at least one render is scheduled
-        self.render()
+        self.mark_dirty()
 
     # Resolved at render time so theme updates propagate immediately
     @property
@@ -114,7 +95,6 @@ class ProgressBar(ComponentBase):
     def corner_radius(self):
         return self._corner_radius
 
-    # progressive mode configuration helpers
     @property
     def progressive(self) -> bool:
         return self._progressive
@@ -122,15 +102,18 @@ class ProgressBar(ComponentBase):
     @progressive.setter
     def progressive(self, enabled: bool) -> None:
         """Enable/disable progressive smoothing. When enabled the visible
-        progress will ease towards the target value over time.
+        progress eases towards the target value on the window's animator.
         """
+        if not enabled and self._progressive:
+            # jump to the value instead of finishing the ease
+            self.window.animations.cancel(self, '_progress_display')
+            self._progress_display = float(self._value)
+            self.mark_dirty()
         self._progressive = enabled
-        # reset timing so smoothing starts cleanly
-        self._last_tick = None
 
     @property
     def progress_rate(self) -> float:
-        """Base units-per-second rate used for smoothing."""
+        """Responsiveness of progressive smoothing; higher settles faster."""
         return self._progress_rate
 
     @progress_rate.setter
@@ -139,22 +122,38 @@ class ProgressBar(ComponentBase):
 
     @property
     def progress_slowdown(self) -> float:
-        """Slowdown coefficient (higher => more slowdown when far from target)."""
+        """Deprecated: lengthens a progressive ease by a factor of (1 + slowdown)."""
+        warnings.warn("ProgressBar.progress_slowdown is deprecated; use progress_rate",
+                      DeprecationWarning, stacklevel=2)
         return self._progress_slowdown
 
     @progress_slowdown.setter
     def progress_slowdown(self, v: float) -> None:
-        self._progress_slowdown = v
+        warnings.warn("ProgressBar.progress_slowdown is deprecated; use progress_rate",
+                      DeprecationWarning, stacklevel=2)
+        self._progress_slowdown = max(0.0, v)
 
     @property
     def min_progress_rate(self) -> float:
-        """Minimum units-per-second forward drift when target is ahead."""
+        """Deprecated: slowest average speed (units per second) of a progressive ease."""
+        warnings.warn("ProgressBar.min_progress_rate is deprecated; use progress_rate",
+                      DeprecationWarning, stacklevel=2)
         return self._min_progress_rate
 
     @min_progress_rate.setter
     def min_progress_rate(self, v: float) -> None:
+        warnings.warn("ProgressBar.min_progress_rate is deprecated; use progress_rate",
+                      DeprecationWarning, stacklevel=2)
         self._min_progress_rate = max(0.0, v)
 
+    def _progress_duration(self, distance: float) -> float:
+        # an exponential ease at this rate settles in about 3 / rate seconds
+        duration = 3000.0 / max(1e-6, self._progress_rate) * (1.0 + self._progress_slowdown)
+        if self._min_progress_rate > 0:
+            # short moves must not crawl below the minimum rate
+            duration = min(duration, 1000.0 * distance / self._min_progress_rate)
+        return duration
+
     def render(self) -> None:
         bg = self.bg_color or (230, 230, 230)
         fg = self.fg_color or (40, 110, 200)
@@ -168,7 +167,7 @@ class ProgressBar(ComponentBase):
         except Exception:
             surf.fill(bg)
 
-        # draw the current display fraction (may be updated by frame handler)
+        # draw the current display fraction (eased by the animator when progressive)
         frac = (self._progress_display / self._max) if self._max != 0 else 0.0
         if frac > 0:
             # Simplified rendering - just integer pixels for better performance
@@ -177,96 +176,7 @@ class ProgressBar(ComponentBase):
                 pygame.draw.rect(surf, fg, (0, 0, fill_width, h), border_radius=self.corner_radius)
 
         # build blits consistently with other components
-        self.blits = [(surf, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
-
-    def _frame_progress_update(self, dt: float) -> None:
-        """Called every frame from the Window draw event handler. dt is seconds."""
-        if not self._progressive:
-            # ensure display stays in sync when progressive disabled
-            self._progress_display = float(self._value)
-            return
-
-        # perform smoothing step using exponential easing so the visible value
-        # smoothly approaches the target in a frame-rate independent way.
-        dist = self._progress_target - self._progress_display
-        if abs(dist) <= 1e-6:
-            return
-
-        # compute responsiveness: higher progress_rate => faster easing
-        # apply slowdown based on proximity: when the display approaches the
-        # target (small normalized distance) the slowdown factor increases so
-        # the easing decelerates smoothly instead of stopping abruptly.
-        try:
-            norm_den = max(1.0, float(self._max))
-        except Exception:
-            norm_den = 1.0
-        norm_dist = min(1.0, abs(dist) / norm_den)
-        # slowdown factor grows as norm_dist -> 0 (near target)
-        slowdown_factor = 1.0 + self._progress_slowdown * (1.0 - norm_dist)
-        effective_rate = self._progress_rate / max(1e-6, slowdown_factor)
-        time_constant = 1.0 / max(1e-6, effective_rate)
-        # smoothing factor alpha = 1 - exp(-dt / time_constant)
-        try:
-            alpha = 1.0 - math.exp(-dt / time_constant)
-        except Exception:
-            alpha = min(1.0, max(0.0, self._progress_rate * dt))
-
-        # apply easing (clamp to avoid overshoot)
-        new_display = self._progress_display + dist * alpha
-
-        # enforce a minimum forward rate so the bar keeps moving during long
-        # pauses even when exponential alpha is tiny. Only apply when target
-        # is ahead (we're moving forward).
-        if dist > 0.0:
-            # compute a minimum forward change but cap it to a fraction of the
-            # remaining distance so we don't prevent natural deceleration.
-            per_frame_min = self._min_progress_rate * dt
-            cap = max(0.0, dist * 0.5)
-            min_change = min(per_frame_min, cap)
-            actual_change = new_display - self._progress_display
-            if actual_change < min_change:
-                # clamp to min_change but don't overshoot the target
-                new_display = self._progress_display + min(min_change, dist)
-
-        # if we're within one tiny unit, snap to target to avoid infinite tail
-        if abs(self._progress_target - new_display) < 1e-3:
-            new_display = float(self._progress_target)
-
-        self._progress_display = new_display
-
-        # determine whether to re-render: do so only when displayed fill
-        # changes by >= 1.0 fractional pixels (avoid integer-rounding stutter)
-        try:
-            w, h = self.size
-            float_fill = (
-                (self._progress_display / self._max) * w
-                if self._max != 0
-                else 0.0
-            )
-        except Exception:
-            float_fill = -9999.0
-
-        # If we're still easing toward the target, render every frame so
-        # the visual movement is smooth even if it lags behind the logical value.
-        if abs(self._progress_target - self._progress_display) > 1e-6:
-            try:
-                self._extracted_from__frame_progress_update_58(float_fill)
-            except Exception:
-                pass
-        elif abs(float_fill - (self._last_rendered_fill_float or -9999.0)) >= 0.5:
-            try:
-                self._extracted_from__frame_progress_update_58(float_fill)
-            except Exception:
-                pass
-
-    # TODO Rename this here and in `_frame_progress_update`
-    def _extracted_from__frame_progress_update_58(self, float_fill):
-        self._last_rendered_fill_float = float_fill
-        self._last_rendered_fill = int(max(0, float_fill))
-        self.render()
+        self._build_blits()
 
 
 __all__ = ["ProgressBar"]
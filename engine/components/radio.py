@@ -4,8 +4,12 @@ import pygame
 
 
 class Radio(ComponentBase):
-    # class-level group registry: list of lists, each index is a group
-    _groups: list[list] = []
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
+    # class-level group registry: gid -> member radios; a group is
+    # dropped once its last member is destroyed
+    _groups: dict[int, list] = {}
 
     # instance slots to match ComponentBase pattern and reduce per-instance memory
     __slots__ = ["_size", "_checked", "on_change", "_gid", "_composite_surface", "_composite_dirty", "_last_child_count"]
@@ -16,17 +20,14 @@ class Radio(ComponentBase):
         self.on_change = on_change
         super().__init__(parent, pos, self._size)
 
-        # group_gid is either None or an index into Radio._groups
+        # group_gid is either None or a key into Radio._groups
         if group_gid is None:
             self._gid = None
         else:
             gid = int(group_gid)
-            # ensure groups list has that index
             if gid < 0:
                 raise ValueError('group_gid must be >= 0 or None')
-            while len(Radio._groups) <= gid:
-                Radio._groups.append([])
-            Radio._groups[gid].append(self)
+            Radio._groups.setdefault(gid, []).append(self)
             self._gid = gid
 
     @property
@@ -48,7 +49,7 @@ class Radio(ComponentBase):
             pass
         if emit:
             self.emit('change', self._checked)
-        self.render()
+        self.mark_dirty()
 
     def _select_self_and_unselect_others(self):
         if self._gid is None:
@@ -67,13 +68,32 @@ class Radio(ComponentBase):
         except Exception:
             pass
 
+    def _on_destroy(self) -> None:
+        if self._gid is not None:
+            members = Radio._groups.get(self._gid, [])
+            if self in members:
+                members.remove(self)
+            if not members:
+                Radio._groups.pop(self._gid, None)
+
     def _event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN:
             mx, my = event.pos
-            rect = pygame.Rect(0, 0, *self.size).move(*self.absolute_pos)
-            if rect.collidepoint((mx, my)):
+            if self._hit_rect().collidepoint((mx, my)):
                 self._select_self_and_unselect_others()
                 return True
+        elif self._activation_key(event):
+            self._select_self_and_unselect_others()
+            return True
+        elif event.type == pygame.KEYDOWN and self.focused and self._gid is not None:
+            # arrows move focus and selection through the group
+            step = {pygame.K_LEFT: -1, pygame.K_UP: -1, pygame.K_RIGHT: 1, pygame.K_DOWN: 1}.get(event.key)
+            members = Radio._groups[self._gid]
+            if step is not None and len(members) > 1:
+                target = members[(members.index(self) + step) % len(members)]
+                target.focus()
+                target._select_self_and_unselect_others()
+                return True
         return super()._event(event)
 
     def render(self) -> None:
@@ -112,10 +132,7 @@ class Radio(ComponentBase):
                 pass
 
         # expose blits
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
 
 __all__ = ['Radio']
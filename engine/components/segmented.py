@@ -6,6 +6,9 @@ from typing import List, Callable, Optional
 
 
 class SegmentedButton(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     __slots__ = [
         "_size",
         "_segments",
@@ -58,7 +61,7 @@ class SegmentedButton(ComponentBase):
             self._selected = -1
         else:
             self._selected = max(0, min(self._selected, len(self._segments) - 1))
-        self.render()
+        self.mark_dirty()
 
     @property
     def selected(self) -> int:
@@ -70,7 +73,7 @@ class SegmentedButton(ComponentBase):
             return
         self._selected = idx
         self.emit("change", idx, self._segments[idx] if 0 <= idx < len(self._segments) else None)
-        self.render()
+        self.mark_dirty()
 
     # Resolved at render time so theme updates propagate immediately
     @property
@@ -89,7 +92,7 @@ class SegmentedButton(ComponentBase):
         if event.type == pygame.MOUSEMOTION:
             # re-render on hover change
             if self._hovered(event.pos)[1]:
-                self.render()
+                self.mark_dirty()
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self._hovered(event.pos)[0]:
                 mx, my = event.pos
@@ -98,18 +101,35 @@ class SegmentedButton(ComponentBase):
                 n = max(1, len(self._segments))
                 seg_w = self._size[0] // n
                 idx = min(len(self._segments) - 1, lx // seg_w)
-                if idx != self._selected:
-                    self._selected = idx
-                    try:
-                        if callable(self.on_change):
-                            self.on_change(idx, self._segments[idx])
-                    except Exception:
-                        pass
-                    self.emit("change", idx, self._segments[idx])
-                    self.render()
+                self._select(idx)
+                return True
+        elif event.type == pygame.KEYDOWN and self.focused and self._segments:
+            # arrows step through the segments, Home/End jump to the ends
+            last = len(self._segments) - 1
+            idx = {
+                pygame.K_LEFT: max(0, self._selected - 1),
+                pygame.K_RIGHT: min(last, self._selected + 1),
+                pygame.K_HOME: 0,
+                pygame.K_END: last,
+            }.get(event.key)
+            if idx is not None:
+                self._select(idx)
                 return True
         return False
 
+    def _select(self, idx: int) -> None:
+        """Select segment `idx` as the user would, notifying on_change and listeners."""
+        if idx == self._selected:
+            return
+        self._selected = idx
+        try:
+            if callable(self.on_change):
+                self.on_change(idx, self._segments[idx])
+        except Exception:
+            pass
+        self.emit("change", idx, self._segments[idx])
+        self.mark_dirty()
+
     def render(self) -> None:
         surf = self.surface  # Cache surface reference
         bg = self.bg_color
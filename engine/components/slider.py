@@ -6,6 +6,9 @@ import pygame
 
 
 class Slider(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN))
+
     __slots__ = [
         "_size",
         "_min",
@@ -69,7 +72,7 @@ class Slider(ComponentBase):
     def min_value(self, v: int) -> None:
         self._min = v
         self._value = max(self._min, self._value)
-        self.render()
+        self.mark_dirty()
 
     @property
     def max_value(self) -> int:
@@ -79,7 +82,7 @@ class Slider(ComponentBase):
     def max_value(self, v: int) -> None:
         self._max = v
         self._value = min(self._max, self._value)
-        self.render()
+        self.mark_dirty()
 
     @property
     def value(self) -> int:
@@ -105,8 +108,7 @@ class Slider(ComponentBase):
     def _event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN:
             mx, my = event.pos
-            ax, ay = self.absolute_pos
-            if pygame.Rect(ax, ay, *self._size).collidepoint((mx, my)):
+            if self._hit_rect().collidepoint((mx, my)):
                 self._dragging = True
                 self._set_from_mouse(mx)
                 return True
@@ -122,7 +124,7 @@ class Slider(ComponentBase):
                 return True
             # re-render on hover changes
             if self._hovered(event.pos)[1]:
-                self.render()
+                self.mark_dirty()
 
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_LEFT, pygame.K_a):
@@ -149,7 +151,7 @@ class Slider(ComponentBase):
             except Exception:
                 pass
             self.emit("change", self._value)
-            self.render()
+            self.mark_dirty()
 
     def render(self) -> None:
         bg = self.bg_color or (220, 220, 220)
@@ -183,10 +185,7 @@ class Slider(ComponentBase):
             pass
 
         # build blits
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
 
 __all__ = ["Slider"]
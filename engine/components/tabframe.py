@@ -6,6 +6,8 @@ import pygame
 
 
 class TabFrame(ComponentBase):
+    _event_types = frozenset()
+
     __slots__ = ["_size", "_tab_frames", "_current", "_ov_color", "_corner_radius", "_header_height", "_composite_surface", "_composite_dirty", "_last_child_count"]
 
     def __init__(
@@ -42,7 +44,7 @@ class TabFrame(ComponentBase):
         content_width = self._size[0] - 16  # 8px margin on each side
         content_height = self._size[1] - content_y - 8  # Header height + bottom margin
 
-        for _ in range(count):
+        for i in range(count):
             frame = Frame(
                 self,
                 (8, content_y),
@@ -50,11 +52,10 @@ class TabFrame(ComponentBase):
                 color=self._ov_color,
                 corner_radius=self._corner_radius
             )
+            # only the current page is shown
+            frame.visible = i == self._current
             self._tab_frames.append(frame)
 
-        # Set the first frame as active
-        self.children = [self._tab_frames[0]] if self._tab_frames else []
-
     def __getitem__(self, index: int) -> Frame:
         """Allow access to tab frames using tabframe[index] syntax."""
         if 0 <= index < len(self._tab_frames):
@@ -74,6 +75,7 @@ class TabFrame(ComponentBase):
             color=self._ov_color,
             corner_radius=self._corner_radius
         )
+        frame.visible = len(self._tab_frames) == self._current
         self._tab_frames.append(frame)
         return frame
 
@@ -91,7 +93,7 @@ class TabFrame(ComponentBase):
         # Update all tab frame colors
         for frame in self._tab_frames:
             frame.color = v
-        self.render()
+        self.mark_dirty()
 
     @property
     def corner_radius(self) -> int:
@@ -103,7 +105,7 @@ class TabFrame(ComponentBase):
         # Update all tab frame corner radius
         for frame in self._tab_frames:
             frame.corner_radius = v
-        self.render()
+        self.mark_dirty()
 
     @property
     def current(self) -> int:
@@ -113,19 +115,19 @@ class TabFrame(ComponentBase):
     def current(self, idx: int) -> None:
         if not self._tab_frames:
             self._current = 0
-            self.children = []
-            self.render()
+            self.mark_dirty()
             return
 
         idx = max(0, min(idx, len(self._tab_frames) - 1))
         if idx == self._current:
             return
 
+        self._tab_frames[self._current].visible = False
         self._current = idx
         # Switch to the selected tab frame
-        self.children = [self._tab_frames[self._current]]
+        self._tab_frames[idx].visible = True
         self.emit("tabchange", idx)
-        self.render()
+        self.mark_dirty()
 
     def render(self) -> None:
         # draw frame background
@@ -140,14 +142,8 @@ class TabFrame(ComponentBase):
             # fallback
             self.surface.fill(self.color)
 
-        # render only the current tab's frame
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            try:
-                child.render()
-                self.blits.extend(child.blits)
-            except Exception:
-                pass
+        # hidden pages are skipped by the display list
+        self._build_blits()
 
 
 __all__ = ["TabFrame"]
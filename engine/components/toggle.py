@@ -2,10 +2,16 @@ from .base import ComponentBase
 from .. import theme
 import pygame
 
+# knob slide duration in milliseconds
+KNOB_ANIMATION_MS = 120
+
 
 class Toggle(ComponentBase):
+    _focusable = True
+    _event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     __slots__ = [
-        '_size', '_ov_bg', '_ov_knob', '_value', 'on_change', '_corner_radius', '_ov_bg_on',
+        '_size', '_ov_bg', '_ov_knob', '_value', 'on_change', '_corner_radius', '_ov_bg_on', '_knob',
         '_composite_surface', '_composite_dirty', '_last_child_count'
     ]
 
@@ -28,6 +34,8 @@ class Toggle(ComponentBase):
         self._value = value
         self.on_change = on_change if on_change is not None else (lambda v: ...)
         self._corner_radius = corner_radius
+        # knob position from 0.0 (off) to 1.0 (on), animated between them
+        self._knob = 1.0 if value else 0.0
 
         super().__init__(parent, pos, self._size)
 
@@ -38,7 +46,8 @@ class Toggle(ComponentBase):
     @value.setter
     def value(self, v: bool):
         self._value = v
-        self.render()
+        self.animate('_knob', 1.0 if v else 0.0, KNOB_ANIMATION_MS)
+        self.mark_dirty()
 
     # Resolve theme values at render time so updates apply live
     @property
@@ -56,16 +65,14 @@ class Toggle(ComponentBase):
     def _event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
             if self._hovered(event.pos)[1]:
-                self.render()
+                self.mark_dirty()
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self._hovered(event.pos)[0]:
                 self._toggle()
                 return True  # Consume the event
-        elif event.type == pygame.KEYDOWN:
-            # allow space/enter to toggle when focused
-            if getattr(self, '_was_hovered', False) and event.key in (pygame.K_SPACE, pygame.K_RETURN):
-                self._toggle()
-                return True  # Consume the event
+        elif self._activation_key(event):
+            self._toggle()
+            return True  # Consume the event
 
         return False
 
@@ -76,7 +83,8 @@ class Toggle(ComponentBase):
         except Exception:
             pass
         self.emit('change', self._value)
-        self.render()
+        self.animate('_knob', 1.0 if self._value else 0.0, KNOB_ANIMATION_MS)
+        self.mark_dirty()
 
     def render(self) -> None:
         hovered = self._hovered()[0]
@@ -108,15 +116,12 @@ class Toggle(ComponentBase):
         # knob
         kw = int(self.size[1] - 6)
         pad = 3
-        kx = self.size[0] - kw - pad if self._value else pad
+        kx = pad + round((self.size[0] - kw - 2 * pad) * self._knob)
         kc = self.knob_color
         pygame.draw.ellipse(self.surface, kc, (kx, pad, kw, kw))
 
         # finalize blits
-        self.blits = [(self.surface, self.absolute_pos)]
-        for child in self.children:
-            child.render()
-            self.blits.extend(child.blits)
+        self._build_blits()
 
 
 __all__ = ['Toggle']
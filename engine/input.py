@@ -34,9 +34,10 @@ class InputManager:
     """Centralized input handling for Input components.
 
     Components should call `input_manager.handle_event(component, event)` from
-    their `_event` method. The manager will mutate component attributes
-    (like `_value`, `_caret`, `_sel_start`, `_sel_end`, `_composition`,
-    `_dragging`) and call `component.render()` when needed. It will also call
+    their `_event` method. The manager edits the component's `_buffer`
+    (a `TextBuffer`), mutates attributes like `_caret`, `_sel_start`,
+    `_sel_end`, `_composition` and `_dragging`, and calls
+    `component.mark_dirty()` when needed. It will also call
     `component.emit('submit', value)` and `component.on_enter` as appropriate.
     """
 
@@ -46,11 +47,32 @@ class InputManager:
         self.component = component
         self.multiline = multiline
 
+    def _replace(self, a: int, b: int, txt: str) -> bool:
+        """Replace characters a..b with `txt` and put the caret after it."""
+        comp = self.component
+        comp._buffer.replace(a, b, txt)
+        comp._caret = a + len(txt)
+        comp._sel_start = comp._sel_end = comp._caret
+        comp._sel_anchor = None
+        comp.mark_dirty()
+        return True
+
+    def _insert(self, txt: str) -> bool:
+        """Insert `txt` at the caret, replacing the selection if any."""
+        comp = self.component
+        if comp._sel_start != comp._sel_end:
+            a, b = sorted((comp._sel_start, comp._sel_end))
+            return self._replace(a, b, txt)
+        return self._replace(comp._caret, comp._caret, txt)
+
+    def _line_col(self, pos: int) -> tuple[int, int]:
+        return self.component._buffer.line_of(pos)
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         comp = self.component
+        buf = comp._buffer
         # Ensure component has expected attributes with sensible default types
         defaults = {
-            '_value': '',
             '_caret': 0,
             '_sel_start': 0,
             '_sel_end': 0,
@@ -96,12 +118,11 @@ class InputManager:
 
                 clicks = getattr(event, 'clicks', 1)
                 if clicks >= 2:
-                    s = comp._value
-                    if not s:
+                    s = buf
+                    if not len(s):
                         return True
                     # For multiline, find the clicked line and compute word selection there
                     if getattr(comp, 'multiline', False):
-                        lines = s.split('\n')
                         # Visual layout constants must match Field.render
                         padding_x = 10
                         padding_y = 8
@@ -115,9 +136,9 @@ class InputManager:
                             content_offset_y = padding_y
                         # determine clicked line index
                         y_in_text = rel_y - content_offset_y
-                        li = int(y_in_text / (line_h * line_spacing)) if line_h > 0 else 0
-                        li = max(0, min(li, len(lines) - 1))
-                        line_text = lines[li]
+                        li = int(y_in_text // max(1, int(line_h * line_spacing)))
+                        li = max(0, min(li, buf.line_count - 1))
+                        line_text = buf.line(li)
                         # compute x relative to the drawn text same as Field
                         if getattr(comp, '_scroll_x', 0) > 0:
                             content_offset_x = padding_x - int(getattr(comp, '_scroll_x', 0)) - margin
@@ -126,10 +147,9 @@ class InputManager:
                         x_in_line = rel_x - content_offset_x
                         idx_in_line = _get_caret_index_at_x(line_text, font, x_in_line)
                         # map to overall index
-                        base = sum(len(l) + 1 for l in lines[:li])
-                        idx = max(0, min(base + idx_in_line, len(s)))
+                        idx = max(0, min(buf.line_start(li) + idx_in_line, len(s)))
                     else:
-                        idx = _get_caret_index_at_x(s, font, rel_x)
+                        idx = _get_caret_index_at_x(buf.text, font, rel_x)
                     if idx > 0 and idx == len(s):
                         idx -= 1
                     start = idx
@@ -143,14 +163,13 @@ class InputManager:
                     comp._caret = end
                     # set anchor to the start of the double-click selection
                     comp._sel_anchor = start
-                    comp.render()
+                    comp.mark_dirty()
                     return True
 
                 comp._dragging = True
                 comp._composition = ''
                 # For multiline, determine clicked line and map x to that line
                 if getattr(comp, 'multiline', False):
-                    lines = comp._value.split('\n')
                     padding_x = 10
                     padding_y = 8
                     margin = 12
@@ -161,22 +180,21 @@ class InputManager:
                     else:
                         content_offset_y = padding_y
                     y_in_text = rel_y - content_offset_y
-                    li = int(y_in_text / (line_h * line_spacing)) if line_h > 0 else 0
-                    li = max(0, min(li, len(lines) - 1))
+                    li = int(y_in_text // max(1, int(line_h * line_spacing)))
+                    li = max(0, min(li, buf.line_count - 1))
                     if getattr(comp, '_scroll_x', 0) > 0:
                         content_offset_x = padding_x - int(getattr(comp, '_scroll_x', 0)) - margin
                     else:
                         content_offset_x = padding_x - int(getattr(comp, '_scroll_x', 0))
                     x_in_line = rel_x - content_offset_x
-                    idx_in_line = _get_caret_index_at_x(lines[li], font, x_in_line)
-                    base = sum(len(l) + 1 for l in lines[:li])
-                    comp._caret = max(0, min(base + idx_in_line, len(comp._value)))
+                    idx_in_line = _get_caret_index_at_x(buf.line(li), font, x_in_line)
+                    comp._caret = max(0, min(buf.line_start(li) + idx_in_line, len(buf)))
                 else:
-                    comp._caret = _get_caret_index_at_x(comp._value, font, rel_x)
+                    comp._caret = _get_caret_index_at_x(buf.text, font, rel_x)
                 comp._sel_start = comp._sel_end = comp._caret
                 # set the selection anchor at the caret when starting a drag/click
                 comp._sel_anchor = comp._caret
-                comp.render()
+                comp.mark_dirty()
                 return True
 
         # Keyboard handling
@@ -188,16 +206,16 @@ class InputManager:
             # Select all (Ctrl+A)
             if event.key == pygame.K_a and (event.mod & pygame.KMOD_CTRL):
                 comp._sel_start = 0
-                comp._sel_end = len(comp._value)
+                comp._sel_end = len(buf)
                 comp._caret = comp._sel_end
                 comp._sel_anchor = 0
-                comp.render()
+                comp.mark_dirty()
                 return True
 
             # Copy
             if event.key == pygame.K_c and (event.mod & pygame.KMOD_CTRL) and comp._sel_start != comp._sel_end:
                 a, b = sorted((comp._sel_start, comp._sel_end))
-                piece = comp._value[a:b]
+                piece = buf[a:b]
                 try:
                     clipboard.copy(piece)
                 except Exception:
@@ -207,17 +225,12 @@ class InputManager:
             # Cut
             if event.key == pygame.K_x and (event.mod & pygame.KMOD_CTRL) and comp._sel_start != comp._sel_end:
                 a, b = sorted((comp._sel_start, comp._sel_end))
-                piece = comp._value[a:b]
+                piece = buf[a:b]
                 try:
                     clipboard.copy(piece)
                 except Exception:
                     pass
-                comp._value = comp._value[:a] + comp._value[b:]
-                comp._caret = a
-                comp._sel_start = comp._sel_end = comp._caret
-                comp._sel_anchor = None
-                comp.render()
-                return True
+                return self._replace(a, b, '')
 
             # Paste
             if event.key == pygame.K_v and (event.mod & pygame.KMOD_CTRL):
@@ -230,17 +243,7 @@ class InputManager:
                         txt = ''
 
                     # insert even if empty string (user expects paste action)
-                    if comp._sel_start != comp._sel_end:
-                        a, b = sorted((comp._sel_start, comp._sel_end))
-                        comp._value = comp._value[:a] + txt + comp._value[b:]
-                        comp._caret = a + len(txt)
-                    else:
-                        comp._value = comp._value[:comp._caret] + txt + comp._value[comp._caret:]
-                        comp._caret += len(txt)
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp._sel_anchor = None
-                    comp.render()
-                    return True
+                    return self._insert(txt)
                 except Exception:
                     pass
 
@@ -248,67 +251,36 @@ class InputManager:
             if event.key == pygame.K_BACKSPACE:
                 ctrl = bool(event.mod & pygame.KMOD_CTRL)
                 if comp._sel_start != comp._sel_end:
-                    a, b = sorted((comp._sel_start, comp._sel_end))
-                    comp._value = comp._value[:a] + comp._value[b:]
-                    comp._caret = a
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp._sel_anchor = None
-                    comp.render()
-                    return True
+                    return self._insert('')
                 # Ctrl+Backspace: delete previous word
                 if ctrl and comp._caret > 0:
-                    new_pos = _prev_word_index(comp._value, comp._caret)
-                    comp._value = comp._value[:new_pos] + comp._value[comp._caret:]
-                    comp._caret = new_pos
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp._sel_anchor = None
-                    comp.render()
-                    return True
+                    return self._replace(_prev_word_index(buf, comp._caret), comp._caret, '')
 
                 # normal backspace: delete single char to the left
                 if not ctrl and comp._caret > 0:
-                    comp._value = comp._value[:comp._caret - 1] + comp._value[comp._caret:]
-                    comp._caret -= 1
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp._sel_anchor = None
-                    comp.render()
-                    return True
+                    return self._replace(comp._caret - 1, comp._caret, '')
 
             # Delete
             if event.key == pygame.K_DELETE:
                 ctrl = bool(event.mod & pygame.KMOD_CTRL)
                 # If there's a selection, delete it first
                 if comp._sel_start != comp._sel_end:
-                    a, b = sorted((comp._sel_start, comp._sel_end))
-                    comp._value = comp._value[:a] + comp._value[b:]
-                    comp._caret = a
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp._sel_anchor = None
-                    comp.render()
-                    return True
+                    return self._insert('')
 
                 # Ctrl+Delete: delete to next word boundary
-                if ctrl and comp._caret < len(comp._value):
-                    new_pos = _next_word_index(comp._value, comp._caret)
-                    comp._value = comp._value[:comp._caret] + comp._value[new_pos:]
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp._sel_anchor = None
-                    comp.render()
-                    return True
+                if ctrl and comp._caret < len(buf):
+                    return self._replace(comp._caret, _next_word_index(buf, comp._caret), '')
 
                 # Normal delete: delete single character after caret
-                if comp._caret < len(comp._value):
-                    comp._value = comp._value[:comp._caret] + comp._value[comp._caret + 1:]
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp.render()
-                    return True
+                if comp._caret < len(buf):
+                    return self._replace(comp._caret, comp._caret + 1, '')
 
             # Left arrow
             if event.key == pygame.K_LEFT:
                 ctrl = bool(event.mod & pygame.KMOD_CTRL)
                 shift = bool(event.mod & pygame.KMOD_SHIFT)
                 if ctrl:
-                    new_pos = _prev_word_index(comp._value, comp._caret)
+                    new_pos = _prev_word_index(buf, comp._caret)
                 else:
                     new_pos = max(0, comp._caret - 1)
                 if shift:
@@ -326,30 +298,18 @@ class InputManager:
                     comp._caret = new_pos
                     comp._sel_start = comp._sel_end = comp._caret
                     comp._sel_anchor = None
-                comp.render()
+                comp.mark_dirty()
                 return True
 
             # Up arrow (move caret up one visual line)
             if event.key == pygame.K_UP and getattr(self, 'multiline', False):
                 shift = bool(event.mod & pygame.KMOD_SHIFT)
                 # compute current line and column
-                lines = comp._value.split('\n')
-                pos = max(0, min(comp._caret, len(comp._value)))
-                li = 0
-                col = 0
-                for i, ln in enumerate(lines):
-                    if pos <= len(ln):
-                        li = i
-                        col = pos
-                        break
-                    pos -= (len(ln) + 1)
-                else:
-                    li = len(lines) - 1
-                    col = len(lines[-1])
+                li, col = self._line_col(comp._caret)
                 # move up a line keeping column if possible
                 new_li = max(0, li - 1)
-                new_col = min(col, len(lines[new_li]))
-                new_pos = sum(len(l) + 1 for l in lines[:new_li]) + new_col
+                new_col = min(col, len(buf.line(new_li)))
+                new_pos = buf.line_start(new_li) + new_col
                 if shift:
                     anchor = comp._sel_anchor if getattr(comp, '_sel_anchor', None) is not None else comp._caret
                     if anchor is None:
@@ -362,28 +322,16 @@ class InputManager:
                     comp._caret = new_pos
                     comp._sel_start = comp._sel_end = comp._caret
                     comp._sel_anchor = None
-                comp.render()
+                comp.mark_dirty()
                 return True
 
             # Down arrow (move caret down one visual line)
             if event.key == pygame.K_DOWN and getattr(self, 'multiline', False):
                 shift = bool(event.mod & pygame.KMOD_SHIFT)
-                lines = comp._value.split('\n')
-                pos = max(0, min(comp._caret, len(comp._value)))
-                li = 0
-                col = 0
-                for i, ln in enumerate(lines):
-                    if pos <= len(ln):
-                        li = i
-                        col = pos
-                        break
-                    pos -= (len(ln) + 1)
-                else:
-                    li = len(lines) - 1
-                    col = len(lines[-1])
-                new_li = min(len(lines) - 1, li + 1)
-                new_col = min(col, len(lines[new_li]))
-                new_pos = sum(len(l) + 1 for l in lines[:new_li]) + new_col
+                li, col = self._line_col(comp._caret)
+                new_li = min(buf.line_count - 1, li + 1)
+                new_col = min(col, len(buf.line(new_li)))
+                new_pos = buf.line_start(new_li) + new_col
                 if shift:
                     anchor = comp._sel_anchor if getattr(comp, '_sel_anchor', None) is not None else comp._caret
                     if anchor is None:
@@ -396,7 +344,7 @@ class InputManager:
                     comp._caret = new_pos
                     comp._sel_start = comp._sel_end = comp._caret
                     comp._sel_anchor = None
-                comp.render()
+                comp.mark_dirty()
                 return True
 
             # Right arrow
@@ -404,9 +352,9 @@ class InputManager:
                 ctrl = bool(event.mod & pygame.KMOD_CTRL)
                 shift = bool(event.mod & pygame.KMOD_SHIFT)
                 if ctrl:
-                    new_pos = _next_word_index(comp._value, comp._caret)
+                    new_pos = _next_word_index(buf, comp._caret)
                 else:
-                    new_pos = min(len(comp._value), comp._caret + 1)
+                    new_pos = min(len(buf), comp._caret + 1)
                 if shift:
                     anchor = comp._sel_anchor if getattr(comp, '_sel_anchor', None) is not None else comp._caret
                     if anchor is None:
@@ -419,34 +367,21 @@ class InputManager:
                     comp._caret = new_pos
                     comp._sel_start = comp._sel_end = comp._caret
                     comp._sel_anchor = None
-                comp.render()
+                comp.mark_dirty()
                 return True
 
             # Enter / submit
             if event.key == pygame.K_RETURN:
                 if self.multiline:
-                    ch = '\n'
-                    if comp._sel_start != comp._sel_end:
-                        a, b = sorted((comp._sel_start, comp._sel_end))
-                        comp._value = comp._value[:a] + ch + comp._value[b:]
-                        comp._caret = a + len(ch)
-                        comp._sel_start = comp._sel_end = comp._caret
-                        comp.render()
-                        return True
-
-                    comp._value = comp._value[:comp._caret] + ch + comp._value[comp._caret:]
-                    comp._caret += len(ch)
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp.render()
-                    return True
+                    return self._insert('\n')
 
                 if callable(getattr(comp, 'on_enter', None)):
                     try:
-                        comp.on_enter(comp._value)
+                        comp.window._settle(comp.on_enter(buf.text))
                     except Exception:
                         pass
                 try:
-                    comp.emit('submit', comp._value)
+                    comp.emit('submit', buf.text)
                 except Exception:
                     pass
                 return True
@@ -457,18 +392,7 @@ class InputManager:
             # KEYDOWN insertion when TEXTINPUT is not available.
             if not hasattr(pygame, 'TEXTINPUT'):
                 if ch := event.unicode:
-                    if comp._sel_start != comp._sel_end:
-                        a, b = sorted((comp._sel_start, comp._sel_end))
-                        comp._value = comp._value[:a] + ch + comp._value[b:]
-                        comp._caret = a + len(ch)
-                        comp._sel_start = comp._sel_end = comp._caret
-                        comp.render()
-                        return True
-                    comp._value = comp._value[:comp._caret] + ch + comp._value[comp._caret:]
-                    comp._caret += len(ch)
-                    comp._sel_start = comp._sel_end = comp._caret
-                    comp.render()
-                    return True
+                    return self._insert(ch)
 
         # TEXTINPUT (IME)
         if event.type == pygame.TEXTINPUT:
@@ -477,16 +401,7 @@ class InputManager:
                 return False
                 
             if txt := getattr(event, 'text', ''):
-                if comp._sel_start != comp._sel_end:
-                    a, b = sorted((comp._sel_start, comp._sel_end))
-                    comp._value = comp._value[:a] + txt + comp._value[b:]
-                    comp._caret = a + len(txt)
-                else:
-                    comp._value = comp._value[:comp._caret] + txt + comp._value[comp._caret:]
-                    comp._caret += len(txt)
-                comp._sel_start = comp._sel_end = comp._caret
-                comp.render()
-                return True
+                return self._insert(txt)
 
         # Mouse drag selection
         if event.type == pygame.MOUSEMOTION and getattr(comp, '_dragging', False):
@@ -502,7 +417,6 @@ class InputManager:
             rel_x = max(0, min(rel_x, comp.size[0] - 1))
             # Map mouse position to caret index; handle multiline consistently
             if getattr(comp, 'multiline', False):
-                lines = comp._value.split('\n')
                 # Match Field.render constants
                 padding_x = 10
                 padding_y = 8
@@ -519,17 +433,16 @@ class InputManager:
                 else:
                     content_offset_x = padding_x - int(getattr(comp, '_scroll_x', 0))
                 y_in_text = rel_y - content_offset_y
-                li = int(y_in_text / (line_h * line_spacing)) if line_h > 0 else 0
-                li = max(0, min(li, len(lines) - 1))
+                li = int(y_in_text // max(1, int(line_h * line_spacing)))
+                li = max(0, min(li, buf.line_count - 1))
                 x_in_line = rel_x - content_offset_x
-                idx_in_line = _get_caret_index_at_x(lines[li], font, x_in_line)
-                base = sum(len(l) + 1 for l in lines[:li])
-                idx = max(0, min(base + idx_in_line, len(comp._value)))
+                idx_in_line = _get_caret_index_at_x(buf.line(li), font, x_in_line)
+                idx = max(0, min(buf.line_start(li) + idx_in_line, len(buf)))
             else:
-                idx = _get_caret_index_at_x(comp._value, font, rel_x)
+                idx = _get_caret_index_at_x(buf.text, font, rel_x)
             comp._sel_end = idx
             comp._caret = idx
-            comp.render()
+            comp.mark_dirty()
             return True
 
         if event.type == pygame.MOUSEBUTTONUP and (event.button == 1 and getattr(comp, '_dragging', False)):
@@ -573,7 +486,7 @@ class InputManager:
             except Exception:
                 pass
             try:
-                comp.render()
+                comp.mark_dirty()
             except Exception:
                 pass
             return True
@@ -581,7 +494,7 @@ class InputManager:
         # TEXTEDITING (IME composition)
         if event.type == getattr(pygame, 'TEXTEDITING', None):
             comp._composition = getattr(event, 'text', '') or ''
-            comp.render()
+            comp.mark_dirty()
             return True
 
         return False
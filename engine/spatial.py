@@ -0,0 +1,120 @@
+import pygame
+
+
+class SpatialGrid:
+    """Uniform grid of screen rects for fast area and point lookups.
+
+    Every item is stored in each cell its rect overlaps, so a query only
+    touches the cells it covers instead of scanning every item.
+    """
+    __slots__ = ["cell_size", "_cells", "_items"]
+
+    def __init__(self, cell_size: int = 128) -> None:
+        self.cell_size = cell_size
+        # (cx, cy) -> set of items overlapping that cell
+        self._cells = {}
+        # item -> (rect, cell keys it occupies)
+        self._items = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def _cell_range(self, rect: pygame.Rect):
+        cs = self.cell_size
+        # right/bottom are exclusive; a zero-sized rect still occupies its cell
+        x0, y0 = rect.left // cs, rect.top // cs
+        x1 = max(rect.left, rect.right - 1) // cs
+        y1 = max(rect.top, rect.bottom - 1) // cs
+        return x0, y0, x1, y1
+
+    def _keys(self, rect: pygame.Rect) -> tuple:
+        x0, y0, x1, y1 = self._cell_range(rect)
+        return tuple((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+
+    def insert(self, item, rect) -> None:
+        """Add `item` covering `rect`, replacing any previous entry."""
+        rect = pygame.Rect(rect)
+        old = self._items.get(item)
+        if old is not None:
+            if old[0] == rect:
+                return
+            keys = self._keys(rect)
+            if keys == old[1]:
+                # moved within the same cells
+                self._items[item] = (rect, keys)
+                return
+            self._discard(item, old[1])
+        else:
+            keys = self._keys(rect)
+
+        cells = self._cells
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = {item}
+            else:
+                bucket.add(item)
+        self._items[item] = (rect, keys)
+
+    update = insert
+
+    def remove(self, item) -> bool:
+        """Remove `item`. Returns True if it was indexed."""
+        old = self._items.pop(item, None)
+        if old is None:
+            return False
+        self._discard(item, old[1])
+        return True
+
+    def _discard(self, item, keys) -> None:
+        cells = self._cells
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is not None:
+                bucket.discard(item)
+                if not bucket:
+                    del cells[key]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._items.clear()
+
+    def rect_of(self, item):
+        """Indexed rect of `item`, or None."""
+        entry = self._items.get(item)
+        return entry[0] if entry is not None else None
+
+    def query_rect(self, rect) -> set:
+        """Items whose rect intersects `rect`."""
+        rect = pygame.Rect(rect)
+        items = self._items
+        cells = self._cells
+        x0, y0, x1, y1 = self._cell_range(rect)
+        out = set()
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # query covers more cells than are populated; walk those instead
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    out |= bucket
+        else:
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        out |= bucket
+        return {item for item in out if items[item][0].colliderect(rect)}
+
+    def query_point(self, pos) -> list:
+        """Items whose rect contains `pos`."""
+        cs = self.cell_size
+        bucket = self._cells.get((int(pos[0]) // cs, int(pos[1]) // cs))
+        if not bucket:
+            return []
+        items = self._items
+        return [item for item in bucket if items[item][0].collidepoint(pos)]
+
+
+__all__ = ["SpatialGrid"]
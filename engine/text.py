@@ -1,4 +1,8 @@
+from bisect import bisect_left, bisect_right
+import weakref
 import pygame
+from .cache import manager as caches
+from .atlas import get_atlas
 
 fontCache = {}
 def get_font(font_name, size, bold=False, italic=False) -> pygame.font.Font:
@@ -15,59 +19,103 @@ def get_font(font_name, size, bold=False, italic=False) -> pygame.font.Font:
 DEFAULT_LETTER_SPACING = 1  # px to insert between letters by default
 MAX_LETTER_EXTRA = 2  # maximum extra px allowed per-letter-gap
 
-# Caches for rendered surfaces to avoid re-rendering identical lines/words
-LINE_RENDER_CACHE: dict = {}
-WORD_RENDER_CACHE: dict = {}
+# Caches for rendered surfaces to avoid re-rendering identical lines/words.
+# Each is an LRU bounded by estimated bytes; adjust with e.g.
+# `LINE_RENDER_CACHE.budget = 4 << 20` and inspect with `caches.stats()`.
+LINE_RENDER_CACHE = caches.create('text.line', 8 << 20)
+WORD_RENDER_CACHE = caches.create('text.word', 4 << 20)
 
 # Toggle to enable/disable rendering caches (useful for testing/debugging or
 # when memory usage must be minimized)
 CACHE_ENABLED = True
 
+# Opt in to composing text from per-font glyph atlases (engine.atlas) instead
+# of calling font.render per line/word/character. Text whose content changes
+# every frame then costs no rendering at all, but glyphs are placed by their
+# advances alone, without the font's kerning.
+GLYPH_ATLAS_ENABLED = False
+
 # Cache for split_text results (layout) and for fully rendered justified surfaces
-SPLIT_TEXT_CACHE: dict = {}
-DRAW_JUSTIFIED_SURF_CACHE: dict = {}
+SPLIT_TEXT_CACHE = caches.create('text.split', 1 << 20)
+DRAW_JUSTIFIED_SURF_CACHE = caches.create('text.justified', 16 << 20)
 
 def _font_id_key(font):
     return id(font) if isinstance(font, pygame.font.Font) else tuple(font)
 
 
 # --- Text input helpers: caret measurement, hit-testing, and rendering ---
+
+# Cumulative caret offsets per (line, font, backend). Keyed by the line text,
+# so an edit only re-measures the line it touched. Sized as a list of small
+# ints; walking every entry with estimate_bytes would cost more than measuring.
+PREFIX_WIDTH_CACHE = caches.create('text.prefix', 16 << 20, sizeof=lambda widths: 8 * len(widths) + 64)
+# font -> {char or char pair: width}; entries go away with their font
+_GLYPH_WIDTHS = weakref.WeakKeyDictionary()
+
+def _glyph_width(font: pygame.font.Font, s: str) -> int:
+    widths = _GLYPH_WIDTHS.get(font)
+    if widths is None:
+        widths = _GLYPH_WIDTHS[font] = {}
+    w = widths.get(s)
+    if w is None:
+        w = widths[s] = font.size(s)[0]
+    return w
+
+def prefix_widths(text: str, font: pygame.font.Font) -> list[int]:
+    """x offset of every caret position in `text` (len(text) + 1 entries), as drawn.
+
+    With the glyph atlas the offsets are summed glyph advances; with
+    font.render each step also applies the kerning of the preceding pair.
+    """
+    # a weak reference never matches a later font reusing a collected one's id
+    key = (text, weakref.ref(font), GLYPH_ATLAS_ENABLED)
+    widths = PREFIX_WIDTH_CACHE.get(key)
+    if widths is not None:
+        return widths
+    widths = [0] * (len(text) + 1)
+    x = 0
+    prev = ''
+    for i, ch in enumerate(text):
+        if GLYPH_ATLAS_ENABLED or not prev:
+            x += _glyph_width(font, ch)
+        else:
+            # width of the pair minus the previous glyph: advance plus kerning
+            x += _glyph_width(font, prev + ch) - _glyph_width(font, prev)
+        widths[i + 1] = x
+        prev = ch
+    PREFIX_WIDTH_CACHE[key] = widths
+    return widths
+
 def _measure_caret_x(text: str, font: pygame.font.Font, index: int) -> int:
     """Return x offset in pixels of caret positioned at `index` in `text`.
 
     Index 0 -> before first char. Index == len(text) -> after last char.
-    Uses per-character widths plus DEFAULT_LETTER_SPACING between characters.
     """
-    # Use the font's measured width for the substring up to `index` so the
-    # caret matches exactly where the text is rendered (handles kerning).
     if not text or index <= 0:
         return 0
     # clamp index
-    idx = max(0, min(index, len(text)))
-    return font.size(text[:idx])[0]
+    idx = min(index, len(text))
+    return prefix_widths(text, font)[idx]
 
 def _get_caret_index_at_x(text: str, font: pygame.font.Font, x: int) -> int:
     """Return the caret index corresponding to pixel x within the rendered text.
 
     Chooses the closest caret position between characters.
     """
-    if x <= 0:
+    if x <= 0 or not text:
         return 0
-    # Walk measuring substring widths to find the closest caret position.
-    prev_w = 0
-    for i in range(1, len(text) + 1):
-        w = font.size(text[:i])[0]
-        mid = (prev_w + w) / 2.0
-        if x < mid:
-            return i - 1
-        prev_w = w
-    return len(text)
+    widths = prefix_widths(text, font)
+    # widths[i - 1] <= x < widths[i]
+    i = bisect_right(widths, x)
+    if i > len(text):
+        return len(text)
+    return i - 1 if x < (widths[i - 1] + widths[i]) / 2.0 else i
 
 def _render_line_with_caret(surf: pygame.Surface, text: str, caret_index: int, font: pygame.font.Font, color, bg_color, x: int, y: int, caret_color=(30, 30, 32), caret_width=2, caret_visible=True):
     """Render a single-line `text` onto `surf` at (x,y) and draw caret at caret_index.
 
     Uses a single font.render for the full line for speed, computes caret x using
-    `measure_caret_x` and draws a vertical rect as caret when `caret_visible`.
+    `_measure_caret_x` and draws a vertical rect as caret when `caret_visible`.
     """
     # Render the full line (fast)
     line_surf = font.render(text, True, color, bg_color)
@@ -79,29 +127,34 @@ def _render_line_with_caret(surf: pygame.Surface, text: str, caret_index: int, f
         if caret_index is None:
             return
         caret_index = max(0, min(caret_index, len(text)))
-        cx = x + measure_caret_x(text, font, caret_index)
+        cx = x + _measure_caret_x(text, font, caret_index)
         ch = font.size(text)[1]
         caret_rect = pygame.Rect(int(cx), y, caret_width, ch)
         pygame.draw.rect(surf, caret_color, caret_rect)
 
-def _render_selection(surf: pygame.Surface, text: str, sel_start: int, sel_end: int, font: pygame.font.Font, sel_color, x: int, y: int, line_spacing: float = 1.2):
+def _render_selection(surf: pygame.Surface, text: str, sel_start: int, sel_end: int, font: pygame.font.Font, sel_color, x: int, y: int, line_spacing: float = 1.2, lines=None, base: int = 0):
     """Render selection background between sel_start and sel_end.
 
     Supports selections spanning multiple lines (explicit newlines in `text`).
     Draws one rect per-line for the portion of the selection that falls on
     that line. `x,y` are the top-left coordinates where the text was drawn.
+    Pass `lines` (and the offset `base` of the first one, drawn at `y`) to
+    only consider the visible lines of a longer text.
     """
     if sel_start == sel_end:
         return
     if sel_start > sel_end:
         sel_start, sel_end = sel_end, sel_start
 
-    # Split lines and iterate to draw per-line selection rectangles.
-    lines = text.split('\n')
-    base = 0
+    if lines is None:
+        lines = text.split('\n')
+    # same line pitch as draw()
+    step = int(font.size('T')[1] * line_spacing)
     for i, line in enumerate(lines):
         line_start = base
         line_end = base + len(line)
+        if line_start > sel_end:
+            break
         # selection overlap on this line (exclusive end)
         a = max(sel_start, line_start)
         b = min(sel_end, line_end)
@@ -109,15 +162,39 @@ def _render_selection(surf: pygame.Surface, text: str, sel_start: int, sel_end:
             # local indices within this line
             local_a = a - line_start
             local_b = b - line_start
-            start_x = x + measure_caret_x(line, font, local_a)
-            end_x = x + measure_caret_x(line, font, local_b)
+            start_x = x + _measure_caret_x(line, font, local_a)
+            end_x = x + _measure_caret_x(line, font, local_b)
             h = font.size(line)[1]
-            y_line = int(y + i * h * line_spacing)
-            rect = pygame.Rect(int(start_x), y_line, int(end_x - start_x), h)
+            rect = pygame.Rect(int(start_x), int(y + i * step), int(end_x - start_x), h)
             pygame.draw.rect(surf, sel_color, rect)
         # advance base for next line (account for newline char)
         base = line_end + 1
 
+def draw_lines(surf: pygame.Surface, lines, font: pygame.font.Font, color, bg_color, x: int, y: int, line_step: int, clip: pygame.Rect) -> None:
+    """Draw `lines` one below the other from (x, y) onto `surf`.
+
+    Only the characters falling inside `clip` are drawn, so the cost depends
+    on the visible area rather than the length of the lines.
+    """
+    atlas = get_atlas(font, color, bg_color) if GLYPH_ATLAS_ENABLED else None
+    blits = []
+    left = clip.left - x
+    right = clip.right - x
+    for line in lines:
+        if line:
+            widths = prefix_widths(line, font)
+            i0 = max(0, bisect_right(widths, left) - 1)
+            i1 = bisect_left(widths, right) + 1
+            visible = line[i0:i1]
+            if visible:
+                if atlas is not None:
+                    blits.extend(atlas.layout(visible, x + widths[i0], y)[0])
+                else:
+                    blits.append((font.render(visible, True, color, bg_color), (x + widths[i0], y)))
+        y += line_step
+    if blits:
+        surf.fblits(blits)
+
 def _font_cache_key(font, color, bg_color):
     # font may be a pygame.font.Font instance or a tuple accepted by get_font
     font_id = id(font) if isinstance(font, pygame.font.Font) else tuple(font)
@@ -137,11 +214,18 @@ def draw(text, font, color, bg_color=None, width=300, height=200, line_spacing=1
     surf = pygame.Surface((width, height), pygame.SRCALPHA)
     y = 0
     fkey_base = _font_cache_key(font, color, bg_color)
+    atlas = get_atlas(font, color, bg_color) if GLYPH_ATLAS_ENABLED else None
+    blits = []
     for raw_line in text.split('\n'):
         line_h = font.size(raw_line)[1]
         if y + int(line_h * line_spacing) > height:
             break
 
+        if atlas is not None:
+            blits.extend(atlas.layout(raw_line, 0, int(y))[0])
+            y += int(line_h * line_spacing)
+            continue
+
         cache_key = (raw_line, fkey_base)
         line_surf = LINE_RENDER_CACHE.get(cache_key) if CACHE_ENABLED else None
         if line_surf is None:
@@ -153,6 +237,8 @@ def draw(text, font, color, bg_color=None, width=300, height=200, line_spacing=1
         surf.blit(line_surf, (0, int(y)))
         y += int(line_h * line_spacing)
 
+    if blits:
+        surf.fblits(blits)
     return surf
 
 def draw_justified(text, font, color, bg_color=None, width=300, height=200, line_spacing=1.2):
@@ -169,7 +255,7 @@ def draw_justified(text, font, color, bg_color=None, width=300, height=200, line
     # Attempt to reuse a fully rendered surface for identical inputs
     cache_draw_key = (text, _font_id_key(font), tuple(color) if isinstance(color, (list, tuple)) else color,
                       tuple(bg_color) if isinstance(bg_color, (list, tuple)) else bg_color,
-                      width, height, line_spacing)
+                      width, height, line_spacing, GLYPH_ATLAS_ENABLED)
     if CACHE_ENABLED:
         cached_surf = DRAW_JUSTIFIED_SURF_CACHE.get(cache_draw_key)
         if cached_surf is not None:
@@ -185,6 +271,18 @@ def draw_justified(text, font, color, bg_color=None, width=300, height=200, line
 
     surf = pygame.Surface(get_total_size(lines, font, line_spacing), pygame.SRCALPHA)
 
+    if GLYPH_ATLAS_ENABLED:
+        surf.fblits(_justified_glyph_blits(lines, get_atlas(font, color, bg_color), font, height, line_spacing))
+    else:
+        _draw_justified_lines(surf, lines, font, color, bg_color, height, line_spacing)
+
+    if CACHE_ENABLED:
+        # store a copy so callers mutating the returned surface don't corrupt the cache
+        DRAW_JUSTIFIED_SURF_CACHE[cache_draw_key] = surf.copy()
+    return surf
+
+def _draw_justified_lines(surf, lines, font, color, bg_color, height, line_spacing) -> None:
+    """Render `split_text` lines onto `surf` with font.render (cached per line/word)."""
     y = 0
     fkey_base = _font_cache_key(font, color, bg_color)
     for line, space_info, letter_spacings in lines:
@@ -283,11 +381,40 @@ def draw_justified(text, font, color, bg_color=None, width=300, height=200, line
                 x += font.size(' ')[0]
         y += int(line_h * line_spacing)
 
-    if CACHE_ENABLED:
-        # store a copy or the surface itself; store a copy to avoid callers mutating it
-        DRAW_JUSTIFIED_SURF_CACHE[cache_draw_key] = surf.copy()
-        return DRAW_JUSTIFIED_SURF_CACHE[cache_draw_key].copy()
-    return surf
+def _justified_glyph_blits(lines, atlas, font, height, line_spacing) -> list:
+    """Glyph atlas counterpart of `_draw_justified_lines`: (surface, pos) pairs for one fblits."""
+    blits = []
+    space_w = font.size(' ')[0]
+    y = 0
+    for line, space_info, letter_spacings in lines:
+        line_h = font.size(line)[1]
+        if y + int(line_h * line_spacing) > height:
+            break
+
+        if isinstance(space_info, tuple) and space_info[0] == 'words':
+            _, per_space, remainder, letter_gap_extras = space_info
+            words = line.split(' ')
+            x = 0
+            letter_idx = 0
+            for gi, w in enumerate(words):
+                if w:
+                    n = max(len(w) - 1, 0)
+                    extras = letter_gap_extras[letter_idx:letter_idx + n] if letter_gap_extras else []
+                    # same spacing as render_word_per_char when extras apply
+                    gaps = [DEFAULT_LETTER_SPACING + (extras[i] if i < len(extras) else 0) for i in range(n)] if extras else None
+                    out, x = atlas.layout(w, x, int(y), gaps)
+                    blits.extend(out)
+                    letter_idx += n
+                if gi < len(words) - 1:
+                    x += space_w + per_space + (1 if gi < remainder else 0)
+        elif letter_spacings:
+            gaps = [DEFAULT_LETTER_SPACING + extra for extra in letter_spacings]
+            blits.extend(atlas.layout(line, 0, int(y), gaps)[0])
+        else:
+            # plain, padded and single-spaced lines all draw the line as is
+            blits.extend(atlas.layout(line, 0, int(y))[0])
+        y += int(line_h * line_spacing)
+    return blits
 
 # Justify utils
 def split_text(text: str, font: pygame.font.Font, max_width: int, justify=True) -> list[tuple[str, int, list[int]]]:
@@ -525,6 +652,11 @@ def measure_line_words_width(words: list, font: pygame.font.Font) -> int:
 def render_word_per_char(surf: pygame.Surface, word: str, x: int, y: int, font: pygame.font.Font, color, bg_color, extras: list[int] | None = None):
     """Render a word character-by-character, applying DEFAULT_LETTER_SPACING between characters plus optional extras per-letter-gap."""
     extras = extras or []
+    if GLYPH_ATLAS_ENABLED:
+        gaps = [DEFAULT_LETTER_SPACING + (extras[i] if i < len(extras) else 0) for i in range(len(word) - 1)]
+        blits, x = get_atlas(font, color, bg_color).layout(word, x, y, gaps)
+        surf.fblits(blits)
+        return x
     for i, ch in enumerate(word):
         ch_surf = font.render(ch, True, color, bg_color)
         surf.blit(ch_surf, (x, y))
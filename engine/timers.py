@@ -0,0 +1,108 @@
+import heapq
+import time
+
+
+class TimerQueue:
+    """One-shot and repeating callbacks ordered in a heap by due time.
+
+    The main loop asks for the next due time to know how long it may sleep,
+    and runs whatever is due once per iteration; nothing is polled.
+    Cancelled timers are dropped lazily when they reach the top of the heap.
+    """
+    __slots__ = ["_heap", "_timers", "_next_id", "_seq"]
+
+    def __init__(self) -> None:
+        # (due, sequence, timer id); sequence keeps equal due times in order
+        self._heap = []
+        # timer id -> [callback, args, interval seconds or None, due]
+        self._timers = {}
+        self._next_id = 1
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, timer_id) -> bool:
+        return timer_id in self._timers
+
+    def add(self, callback, delay: float, interval: float | None = None, args: tuple = ()) -> int:
+        """Schedule `callback(*args)` in `delay` ms, then every `interval` ms if given."""
+        timer_id = self._next_id
+        self._next_id += 1
+        due = time.perf_counter() + max(0.0, delay) / 1000
+        if interval is not None:
+            # a zero interval would run on every loop iteration
+            interval = max(1.0, interval) / 1000
+        self._timers[timer_id] = [callback, args, interval, due]
+        self._push(due, timer_id)
+        return timer_id
+
+    def cancel(self, timer_id) -> bool:
+        """Stop a timer. Returns True if it was still scheduled."""
+        if self._timers.pop(timer_id, None) is None:
+            return False
+        # drop stale entries once they dominate the heap
+        if len(self._heap) > 2 * len(self._timers) + 16:
+            self._heap = [e for e in self._heap if e[2] in self._timers and self._timers[e[2]][3] == e[0]]
+            heapq.heapify(self._heap)
+        return True
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._timers.clear()
+
+    def next_due(self) -> float | None:
+        """perf_counter() time of the earliest live timer, or None."""
+        heap = self._heap
+        timers = self._timers
+        while heap:
+            due, _, timer_id = heap[0]
+            entry = timers.get(timer_id)
+            if entry is not None and entry[3] == due:
+                return due
+            heapq.heappop(heap)
+        return None
+
+    def run_due(self, now: float | None = None) -> int:
+        """Run every timer due at `now`; returns how many ran.
+
+        Timers scheduled by the callbacks wait for the next call, so a
+        zero delay cannot starve the loop.
+        """
+        if now is None:
+            now = time.perf_counter()
+        heap = self._heap
+        timers = self._timers
+        due_ids = []
+        while heap and heap[0][0] <= now:
+            due, _, timer_id = heapq.heappop(heap)
+            entry = timers.get(timer_id)
+            if entry is not None and entry[3] == due:
+                due_ids.append(timer_id)
+
+        ran = 0
+        for timer_id in due_ids:
+            # an earlier callback may have cancelled this one
+            entry = timers.get(timer_id)
+            if entry is None:
+                continue
+            callback, args, interval, due = entry
+            if interval is None:
+                del timers[timer_id]
+            else:
+                due += interval
+                if due <= now:
+                    # fell behind (e.g. a long frame); skip the missed ticks
+                    due = now + interval
+                entry[3] = due
+                self._push(due, timer_id)
+            callback(*args)
+            ran += 1
+        return ran
+
+    def _push(self, due: float, timer_id: int) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, timer_id))
+
+
+__all__ = ["TimerQueue"]
@@ -45,7 +45,8 @@ def cached_render(font, text, color):
 
     return _text_cache[cache_key]
 
-def draw_performance_statistics(surface, dt) -> None:
+def get_performance_statistics(dt) -> pygame.Surface:
+    """Return the cached statistics overlay, refreshing it at most every 40ms."""
     # sourcery skip: extract-method
     global _cached_stats_surface, _last_stats_update
 
@@ -78,6 +79,35 @@ def draw_performance_statistics(surface, dt) -> None:
         except Exception:
             _cached_stats_surface = surf
 
-    # Always blit the cached surface
-    surface.blit(_cached_stats_surface, (surface.get_width() - _cached_stats_surface.get_width(), surface.get_height() - _cached_stats_surface.get_height()))
+    return _cached_stats_surface
 
+def draw_performance_statistics(surface, dt) -> pygame.Rect:
+    stats = get_performance_statistics(dt)
+    rect = stats.get_rect(bottomright=surface.get_size())
+    # Always blit the cached surface
+    surface.blit(stats, rect)
+    return rect
+
+def merge_rects(rects, bounds: pygame.Rect, max_rects: int = 24) -> list[pygame.Rect]:
+    """Clip `rects` to `bounds` and merge overlapping ones.
+
+    Returns a short list of non-overlapping-ish rects suitable for
+    `pygame.display.update`. When more than `max_rects` remain they are
+    collapsed into their bounding box, which is cheaper to push than many
+    tiny updates.
+    """
+    merged = []
+    for r in rects:
+        r = bounds.clip(r)
+        if not r.w or not r.h:
+            continue
+        # absorb every merged rect this one touches, repeating until stable
+        idx = r.collidelist(merged)
+        while idx != -1:
+            r.union_ip(merged.pop(idx))
+            idx = r.collidelist(merged)
+        merged.append(r)
+
+    if len(merged) > max_rects:
+        return [merged[0].unionall(merged[1:])]
+    return merged
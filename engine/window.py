@@ -1,6 +1,29 @@
 from . import util
+from .spatial import SpatialGrid
+from .timers import TimerQueue
+from .animation import Animator
+from contextlib import contextmanager
+import asyncio
+import inspect
 import pygame
+import math
+import threading
 import time
+import traceback
+
+# Posted by Window.wake() to end an idle wait early
+WAKE_EVENT = pygame.event.custom_type()
+
+# Events routed to the components under the cursor instead of the whole tree
+POINTER_EVENTS = frozenset((
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL
+))
+# Events routed to the component holding keyboard focus
+KEY_EVENTS = frozenset((
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING
+))
+# Longest idle wait (ms) while tasks run on the window's own event loop
+TASK_POLL_MS = 10
 
 
 class Window:
@@ -8,11 +31,20 @@ class Window:
         "_surface", "children", "pos", "clock", "dt",
         "_size", "_event_handlers", "blits", "frame",
         "debug", "mode", "_overlay_focus", "_next_gid",
-        "_last_frame_time"
+        "_last_frame_time", "present_mode", "_damage", "_full_redraw",
+        "_prev_frame", "_stats_surface", "idle", "idle_timeout", "stats",
+        "_loop_marks", "_display_list", "_display_dirty", "_frame_blits",
+        "_frame_rects", "_spatial", "_z", "_routing", "_hover", "_capture",
+        "_focus", "_subscribers", "_render_queue",
+        "_batch_depth", "_batch_composite",
+        "_baked", "_timers", "animations", "_tasks", "_loop",
+        "_soon", "_soon_lock"
     ]
 
     def __init__(self, size = (800, 600)) -> None:
         self._surface = pygame.display.set_mode(size)
+        # event type -> [(priority, handler)], highest priority first. Lists
+        # are replaced rather than mutated so dispatch never copies them.
         self._event_handlers = {}
         self.children = []
         self.pos = (0,0)
@@ -26,8 +58,90 @@ class Window:
         self.debug = False
         self.mode = 'hybrid'
         # blits will be a list of layers, each layer is a list of (surface, pos) tuples
-        # layer 0 is the base layer (children), subsequent layers are overlays
-        self.blits = []
+        # layer 0 is the base layer (children), subsequent layers are overlays.
+        # The base layer is kept in the retained display list below, so
+        # layer 0 stays empty.
+        self.blits = [[]]
+
+        # Retained display list: every component in paint order. Components
+        # keep their own (surface, pos) entry up to date; the list is only
+        # re-flattened when the tree changes shape.
+        self._display_list = []
+        self._display_dirty = True
+        # components waiting for render(); flushed once before each draw
+        self._render_queue = set()
+        # nesting depth of batch() blocks, and components whose composite
+        # invalidation is deferred until the outermost one exits
+        self._batch_depth = 0
+        self._batch_composite = set()
+        # cached on-screen entries (and their rects) handed to fblits
+        self._frame_blits = None
+        self._frame_rects = []
+        # absolute rects of rendered components, for culling and hit tests
+        self._spatial = SpatialGrid()
+        # component -> paint order index in the display list
+        self._z = {}
+        # descendant -> static ancestor whose composite already paints it
+        self._baked = {}
+        # event type -> components declaring it, in paint order; filled
+        # lazily per type and reset with the display list
+        self._subscribers = {}
+
+        # Pointer routing: while set, components handle events for
+        # themselves only and do not forward them to their children.
+        self._routing = False
+        # components under the cursor at the last mouse motion
+        self._hover = []
+        # component that consumed the last button press; it receives
+        # motion and the release even when the cursor leaves it
+        self._capture = None
+        # component receiving keyboard and text input
+        self._focus = None
+
+        # 'flip' repaints the whole window every frame; 'dirty' repaints and
+        # pushes only the regions that changed since the previous frame.
+        self.present_mode = 'flip'
+        # screen areas reported as changed since the last draw()
+        self._damage = []
+        self._full_redraw = True
+        # (surface id, pos, size) -> rect of everything presented last frame
+        self._prev_frame = {}
+        self._stats_surface = None
+
+        # When idle is enabled the main loop blocks in pygame.event.wait()
+        # while nothing needs drawing instead of spinning. idle_timeout (ms)
+        # bounds a single wait so polling-based work still gets a turn.
+        self.idle = False
+        self.idle_timeout = 1000
+        # main loop counters, useful to verify idle behaviour in production
+        self.stats = {
+            'frames': 0,       # frames actually drawn
+            'iterations': 0,   # main loop iterations
+            'idle_waits': 0,   # times the loop blocked waiting for events
+            'wakeups': 0,      # idle waits ended by an event
+            'idle_time': 0.0,  # seconds spent blocked
+            'timers': 0,       # timer callbacks run
+            'coalesced': 0,    # thread-safe calls replaced before they ran
+            'cpu_time': 0.0,   # process CPU seconds while in mainloop
+            'wall_time': 0.0,  # wall-clock seconds while in mainloop
+        }
+        self._loop_marks = None
+
+        # set_timeout()/set_interval() callbacks; the idle wait ends when
+        # the next one is due
+        self._timers = TimerQueue()
+        # running tweens, advanced once per drawn frame
+        self.animations = Animator()
+        # tasks started by async handlers (see spawn())
+        self._tasks = set()
+        # event loop owned by the window for tasks spawned under mainloop();
+        # created on first use and stepped once per loop iteration
+        self._loop = None
+        # calls posted from other threads, run once per frame on the UI
+        # thread: key -> (callback, args). A keyed call replaces a pending
+        # one with the same key, so only the last write survives.
+        self._soon = {}
+        self._soon_lock = threading.Lock()
         
         # High precision timing
         self._last_frame_time = time.perf_counter()
@@ -40,7 +154,19 @@ class Window:
             pass
 
     def addChild(self, child) -> None:
+        """Attach `child` at the top level, moving it from its current parent if needed."""
+        if child in self.children:
+            return
+        old = child.parent
+        if old is not self and child in old.children:
+            old.children.remove(child)
+            child._mark_parent_composite_dirty()
+        child.parent = self
+        child._cached_size = None
+        child._invalidate_abs_pos()
         self.children.append(child)
+        self._mark_display_dirty()
+        child._mark_subtree_dirty()
 
     @property
     def surface(self) -> pygame.Surface:
@@ -61,14 +187,59 @@ class Window:
     @size.setter
     def size(self, size) -> None:
         self._surface = pygame.display.set_mode(size)
+        self._full_redraw = True
+        self._frame_blits = None
         self.render()
 
-    def event(self, event_type:int|str):
+    def invalidate(self, rect=None) -> None:
+        """Mark a screen area as changed so the next draw() repaints it.
+
+        Passing no rect schedules a full repaint.
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._damage.append(pygame.Rect(rect))
+
+    def event(self, event_type:int|str, priority: int = 0):
         def decorator(func):
-            self._event_handlers[event_type] = func
+            self.on(event_type, func, priority)
             return func
         return decorator
 
+    def on(self, event_type: int|str, handler, priority: int = 0):
+        """Subscribe `handler` to a pygame event type or a hook name ('draw', 'focus').
+
+        Handlers run highest priority first, then in subscription order.
+        A handler returning True stops the remaining ones. Returns `handler`
+        so it can be passed to off() later.
+        """
+        entries = list(self._event_handlers.get(event_type, ()))
+        i = len(entries)
+        while i > 0 and entries[i - 1][0] < priority:
+            i -= 1
+        entries.insert(i, (priority, handler))
+        self._event_handlers[event_type] = entries
+        return handler
+
+    def off(self, event_type: int|str, handler=None) -> None:
+        """Unsubscribe `handler`, or every handler of `event_type` when omitted."""
+        if handler is None:
+            self._event_handlers.pop(event_type, None)
+            return
+        entries = [e for e in self._event_handlers.get(event_type, ()) if e[1] != handler]
+        if entries:
+            self._event_handlers[event_type] = entries
+        else:
+            self._event_handlers.pop(event_type, None)
+
+    def _dispatch(self, event_type, *args) -> bool:
+        """Call the handlers of `event_type`; True if one stopped propagation."""
+        for _, handler in self._event_handlers.get(event_type, ()):
+            if self._settle(handler(*args)):
+                return True
+        return False
+
     def _event(self, event: pygame.event.Event) -> None:
         # If an overlay has claimed focus, give it the first chance to handle the event
         overlay = getattr(self, '_overlay_focus', None)
@@ -83,70 +254,432 @@ class Window:
                 # swallow overlay errors and fall back to normal dispatch
                 pass
 
-        for child in self.children:
-            if child._event(event):
+        if event.type in POINTER_EVENTS:
+            if self._route_pointer(event):
+                return
+        elif event.type in KEY_EVENTS:
+            if self._route_key(event):
                 return
+        elif self._route_subscribers(event):
+            return
+
+        if self._dispatch(event.type, event):
+            return
+        # app-level KEYDOWN hooks may bind Tab themselves
+        self._tab_focus(event)
+
+    def subscribers(self, event_type) -> list:
+        """Components whose class declares `event_type`, in paint order."""
+        if self._display_dirty:
+            self._rebuild_display_list()
+        subs = self._subscribers.get(event_type)
+        if subs is None:
+            subs = [c for c in self._display_list if c._handles(event_type)]
+            self._subscribers[event_type] = subs
+        return subs
 
-        self._event_handlers.get(event.type, lambda e: None)(event)
+    def _route_subscribers(self, event: pygame.event.Event) -> bool:
+        """Offer a non-input event to its subscribers, topmost first."""
+        subs = self.subscribers(event.type)
+        if not subs:
+            # nobody cares about this type; no tree walk at all
+            return False
+        self._routing = True
+        try:
+            for comp in reversed(subs):
+                if comp._event(event):
+                    return True
+        finally:
+            self._routing = False
+        return False
+
+    def _route_pointer(self, event: pygame.event.Event) -> bool:
+        """Offer a pointer event to the components under the cursor only.
+
+        Components are tried topmost first, so each event costs a spatial
+        lookup plus the handful of components stacked at that point instead
+        of a walk over the whole tree.
+        """
+        etype = event.type
+        capture = self._capture
+        if etype == pygame.MOUSEBUTTONUP:
+            self._capture = None
+        if etype != pygame.MOUSEMOTION and not self.subscribers(etype):
+            # motion is still tracked for enter/leave
+            return False
+        pos = getattr(event, 'pos', None)
+        if pos is None:
+            # wheel events carry no position
+            pos = pygame.mouse.get_pos()
+        under = self.components_at(pos)
+
+        self._routing = True
+        try:
+            if capture is not None and capture._handles(etype) and capture in self._z:
+                if capture._event(event):
+                    return True
+
+            if etype == pygame.MOUSEMOTION:
+                self._update_hover(event, under)
+            elif etype == pygame.MOUSEBUTTONDOWN:
+                self._capture = None
+
+            for comp in reversed(under):
+                if comp is capture or not comp._handles(etype):
+                    continue
+                if comp._event(event):
+                    if etype == pygame.MOUSEBUTTONDOWN:
+                        self._capture = comp
+                        # clicking a focusable component focuses it,
+                        # clicking anything else drops focus
+                        self.set_input_focus(comp if comp._focusable else None)
+                    return True
+        finally:
+            self._routing = False
+        if etype == pygame.MOUSEBUTTONDOWN:
+            self.set_input_focus(None)
+        return False
+
+    def _route_key(self, event: pygame.event.Event) -> bool:
+        """Deliver keyboard/text input to the focused component and its ancestors.
+
+        Without focus, the components under the cursor get the event so
+        hover-driven shortcuts keep working.
+        """
+        if self._display_dirty:
+            self._rebuild_display_list()
+        focus = self._focus
+        if focus is not None and focus in self._z:
+            path = []
+            comp = focus
+            while comp is not self:
+                path.append(comp)
+                comp = comp.parent
+        else:
+            path = self._hover[::-1]
+
+        self._routing = True
+        try:
+            for comp in path:
+                if comp._handles(event.type) and comp._event(event):
+                    return True
+        finally:
+            self._routing = False
+        return False
+
+    def _tab_focus(self, event: pygame.event.Event) -> bool:
+        """Move focus on Tab / Shift+Tab; True only if focus actually moved."""
+        if event.type != pygame.KEYDOWN or event.key != pygame.K_TAB:
+            return False
+        previous = self._focus
+        if event.mod & pygame.KMOD_SHIFT:
+            self.focus_prev()
+        else:
+            self.focus_next()
+        return self._focus is not previous
+
+    @property
+    def input_focus(self):
+        """Component currently receiving keyboard input, or None."""
+        return self._focus
+
+    def set_input_focus(self, component) -> None:
+        """Move keyboard focus to `component` (None clears it).
+
+        The previous component gets 'blur', the new one 'focus', and a
+        window 'focus' handler is called with the new component.
+        """
+        previous = self._focus
+        if component is previous:
+            return
+        self._focus = component
+        if previous is not None:
+            previous._on_blur()
+            previous.emit('blur')
+        if component is not None:
+            component._on_focus()
+            component.emit('focus')
+        self._dispatch('focus', component)
+
+    def clear_input_focus(self) -> None:
+        self.set_input_focus(None)
+
+    def _focus_order(self) -> list:
+        if self._display_dirty:
+            self._rebuild_display_list()
+        return [c for c in self._display_list if c._focusable]
+
+    def focus_next(self, reverse: bool = False):
+        """Move focus to the next focusable component in tree order, wrapping."""
+        order = self._focus_order()
+        if not order:
+            return None
+        try:
+            i = order.index(self._focus)
+            i = (i - 1 if reverse else i + 1) % len(order)
+        except ValueError:
+            i = -1 if reverse else 0
+        self.set_input_focus(order[i])
+        return order[i]
+
+    def focus_prev(self):
+        return self.focus_next(reverse=True)
+
+    def _update_hover(self, event, under: list) -> None:
+        """Emit enter/leave and let components the cursor left drop their hover state."""
+        previous = self._hover
+        self._hover = under
+        if previous == under:
+            return
+        now = set(under)
+        before = set(previous)
+        for comp in reversed(previous):
+            if comp not in now:
+                comp.emit('mouseleave')
+                if comp in self._z and comp is not self._capture and comp._handles(event.type):
+                    # the motion tells the component the cursor is gone
+                    comp._event(event)
+        for comp in under:
+            if comp not in before:
+                comp.emit('mouseenter')
+
+    @contextmanager
+    def batch(self):
+        """Group many changes into one update.
+
+        Inside the block nothing is rendered and composite invalidation is
+        collected instead of walking up the tree per change; on exit every
+        affected component is rendered once::
+
+            with window.batch():
+                for field in fields:
+                    field.value = ''
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._end_batch()
+
+    def _end_batch(self) -> None:
+        pending = self._batch_composite
+        self._batch_composite = set()
+        # one walk up per affected branch; shared ancestors are visited once
+        seen = set()
+        for comp in pending:
+            node = comp
+            while hasattr(node, '_mark_composite_dirty') and node not in seen:
+                seen.add(node)
+                node._composite_dirty = True
+                node._composite_surface = None
+                if node._static:
+                    node.mark_dirty()
+                node = node.parent
+        self.flush_renders()
 
     def render(self) -> None:
-        for child in self.children:
-            child.render()
+        """Render every component in the tree now, parents first."""
+        if self._batch_depth:
+            # deferred until the batch ends
+            for comp in self._display_list:
+                comp.mark_dirty()
+            return
+        if self._display_dirty:
+            self._rebuild_display_list()
+        self._render_queue.clear()
+        for comp in self._display_list:
+            comp._dirty = False
+            comp.render()
+        # rendering can schedule follow-up work (e.g. newly created children)
+        self.flush_renders()
+
+    def flush_renders(self) -> None:
+        """Render each component marked dirty since the last frame, once, in tree order."""
+        if self._batch_depth:
+            return
+        while True:
+            if self._display_dirty:
+                # components entering the tree re-queue their pending renders
+                self._rebuild_display_list()
+            if not self._render_queue:
+                break
+            queue = self._render_queue
+            self._render_queue = set()
+            z = self._z
+            # components outside the tree keep their dirty flag and are
+            # queued again when they come back (see _rebuild_display_list)
+            for comp in sorted((c for c in queue if c in z), key=z.__getitem__):
+                if comp._dirty:
+                    comp._dirty = False
+                    comp.render()
 
     def draw(self) -> None:
         self.frame += 1
+        # animated attributes mark their components dirty; they render below
+        self.animations.tick()
         # use theme background if available (dark-mode by default)
         try:
             from . import theme
             bg = theme.get('window_bg')
         except Exception:
             bg = (0, 0, 0)
-        self.surface.fill(bg)
 
-        if self._event_handlers:
-            self._event_handlers.get('draw', lambda e: None)(self.frame)
+        self._dispatch('draw', self.frame)
+        # after the hooks, so their changes show in this frame
+        self.flush_renders()
 
-        # Compose base layer from children
-        base_blits = []
-        for child in self.children:
-            # each child provides a flat list of (surface, pos) tuples
-            base_blits += child.blits
+        if self._display_dirty:
+            self._rebuild_display_list()
+        if self._frame_blits is None:
+            self._build_frame_blits()
 
-        # If self.blits already contains overlay layers (list of lists), preserve them.
-        # Detect whether self.blits is already a list-of-lists; if not, treat it as empty overlays.
-        overlays = []
-        if self.blits and isinstance(self.blits[0], list):
-            overlays = self.blits[1:]
+        flat = self._frame_blits
+        rects = self._frame_rects
 
-        # Build final layered structure: base followed by overlays
-        layers = [base_blits] + overlays
+        # Overlay layers (dropdown popups etc.) are few and may be swapped in
+        # place, so they are still collected every frame.
+        overlays = self._overlay_blits()
+        if overlays:
+            flat = flat + [(surf, pos) for surf, pos, _ in overlays]
+            rects = rects + [rect for _, _, rect in overlays]
 
-        # expose as window.blits (list of lists)
-        self.blits = layers
+        if self.present_mode == 'dirty':
+            self._present_dirty(flat, rects, overlays, bg)
+        else:
+            self._present_full(flat, bg)
 
-        # Build flat list for pygame-ce fblits with viewport culling
-        flat = []
-        window_rect = pygame.Rect(0, 0, *self.size)
-        
-        for layer in layers:
+        self._damage.clear()
+        self._full_redraw = False
+
+    def _mark_display_dirty(self) -> None:
+        """The component tree changed shape; rebuild the display list lazily."""
+        self._display_dirty = True
+        self._frame_blits = None
+
+    def release_hidden_surfaces(self) -> int:
+        """Free the surfaces of every hidden subtree, e.g. under memory pressure.
+
+        They are redrawn when shown again. Returns the number of subtrees released.
+        """
+        released = 0
+        stack = list(self.children)
+        while stack:
+            comp = stack.pop()
+            if comp._visible:
+                stack.extend(comp.children)
+            else:
+                comp._release_surfaces()
+                released += 1
+        return released
+
+    def _detach(self, comps) -> None:
+        """Forget window-level references to components leaving the tree."""
+        gone = set(comps)
+        if self._focus in gone:
+            self.set_input_focus(None)
+        if self._capture in gone:
+            self._capture = None
+        if self._overlay_focus in gone:
+            self._overlay_focus = None
+        self._hover = [c for c in self._hover if c not in gone]
+        for comp in gone:
+            if self._spatial.remove(comp):
+                self._damage.append(comp._rect)
+        self._mark_display_dirty()
+
+    def _rebuild_display_list(self) -> None:
+        """Flatten the component tree into paint order (parents first)."""
+        old = self._display_list
+        new = []
+        baked = {}
+        # (component, static ancestor or None)
+        stack = [(c, None) for c in self.children[::-1] if c._visible]
+        while stack:
+            comp, root = stack.pop()
+            new.append(comp)
+            if root is not None and comp._bakeable:
+                baked[comp] = root
+            if comp._static:
+                # descendants are baked into the nearest static ancestor
+                root = comp
+            # hidden subtrees are skipped whole
+            stack.extend((c, root) for c in comp.children[::-1] if c._visible)
+
+        # whatever dropped out of the tree leaves a hole to repaint
+        kept = set(new)
+        for comp in old:
+            if comp not in kept:
+                self._spatial.remove(comp)
+                if comp._blit is not None:
+                    self._damage.append(comp._rect)
+        # components (re)entering the tree, e.g. a TabFrame page switched in
+        previous = self._z
+        for comp in new:
+            if comp not in previous:
+                if comp._dirty:
+                    self._render_queue.add(comp)
+                if comp._rect is not None:
+                    self._spatial.insert(comp, comp._rect)
+                    self._damage.append(comp._rect)
+
+        self._display_list = new
+        self._z = {comp: i for i, comp in enumerate(new)}
+        self._baked = baked
+        self._subscribers = {}
+        self._display_dirty = False
+        self._frame_blits = None
+
+    def _build_frame_blits(self) -> None:
+        """Collect the on-screen display list entries for fblits."""
+        # Viewport culling - only the grid cells covering the window are
+        # visited, so offscreen components cost nothing
+        z = self._z
+        # descendants of static components are painted by their composite
+        baked = self._baked
+        visible = [c for c in self._spatial.query_rect(self.surface.get_rect()) if c in z and c not in baked]
+        visible.sort(key=z.__getitem__)
+        flat = [c._blit for c in visible]
+        rects = [c._rect for c in visible]
+        self._frame_blits = flat
+        self._frame_rects = rects
+
+    def components_at(self, pos) -> list:
+        """Components covering `pos`, bottom-most first."""
+        if self._display_dirty:
+            self._rebuild_display_list()
+        z = self._z
+        hits = [c for c in self._spatial.query_point(pos) if c in z]
+        hits.sort(key=z.__getitem__)
+        return hits
+
+    def component_at(self, pos):
+        """Topmost component covering `pos`, or None."""
+        hits = self.components_at(pos)
+        return hits[-1] if hits else None
+
+    def _overlay_blits(self) -> list:
+        """Return (surface, pos, rect) for every on-screen overlay entry."""
+        out = []
+        window_rect = self.surface.get_rect()
+        for layer in self.blits[1:]:
             for entry in layer:
-                if not entry:
-                    continue
-                    
-                surf, pos = None, None
-                if isinstance(entry, tuple) and len(entry) == 2:
-                    surf, pos = entry
-                elif isinstance(entry, tuple) and len(entry) == 3:
+                if isinstance(entry, tuple) and len(entry) == 3:
                     # (gid, surface, pos)
                     _, surf, pos = entry
+                elif isinstance(entry, tuple) and len(entry) == 2:
+                    surf, pos = entry
                 else:
                     continue
-                
-                # Viewport culling - only render surfaces that intersect with window
                 if surf and pos:
-                    surf_rect = pygame.Rect(pos[0], pos[1], surf.get_width(), surf.get_height())
-                    if window_rect.colliderect(surf_rect):
-                        flat.append((surf, pos))
+                    rect = pygame.Rect(pos, surf.get_size())
+                    if window_rect.colliderect(rect):
+                        out.append((surf, pos, rect))
+        return out
+
+    def _present_full(self, flat, bg) -> None:
+        self.surface.fill(bg)
 
         # Direct pygame-ce fblits for maximum performance
         if flat:
@@ -156,6 +689,65 @@ class Window:
 
         pygame.display.flip()
 
+    def _present_dirty(self, flat, rects, overlays, bg) -> None:
+        """Repaint and push only the regions that changed since last frame."""
+        surface = self.surface
+        window_rect = surface.get_rect()
+
+        # Display list entries report their own changes through
+        # invalidate(). Overlays can be swapped in place, so diff them against
+        # the previous frame: anything that appeared, disappeared or moved is
+        # damaged at both its old and new location.
+        damage = self._damage
+        frame = {}
+        prev = self._prev_frame
+        for surf, pos, rect in overlays:
+            key = (id(surf), tuple(pos), rect.size)
+            frame[key] = rect
+            if key not in prev:
+                damage.append(rect)
+        for key, rect in prev.items():
+            if key not in frame:
+                damage.append(rect)
+        self._prev_frame = frame
+
+        stats = util.get_performance_statistics(self.dt)
+        stats_rect = stats.get_rect(bottomright=window_rect.bottomright)
+        if stats is not self._stats_surface:
+            self._stats_surface = stats
+            damage.append(stats_rect)
+
+        if self._full_redraw:
+            self._present_full(flat, bg)
+            return
+
+        if not damage:
+            return
+
+        # the statistics overlay is translucent; repaint it whole whenever
+        # anything underneath it changes so it never blends onto itself
+        if stats_rect.collidelist(damage) != -1:
+            damage.append(stats_rect)
+
+        dirty = util.merge_rects(damage, window_rect)
+        if sum(r.w * r.h for r in dirty) * 2 > window_rect.w * window_rect.h:
+            # mostly everything changed; a single flip is cheaper
+            self._present_full(flat, bg)
+            return
+
+        for r in dirty:
+            surface.set_clip(r)
+            surface.fill(bg, r)
+            hits = r.collidelistall(rects)
+            if hits:
+                surface.fblits([flat[i] for i in hits])
+        surface.set_clip(None)
+
+        if stats_rect.collidelist(dirty) != -1:
+            surface.blit(stats, stats_rect)
+
+        pygame.display.update(dirty)
+
     def add_overlay(self, surface: pygame.Surface, pos: tuple[int,int], layer:int=1) -> int:
         """Add an overlay surface to a given layer and return a numeric GID.
 
@@ -175,6 +767,7 @@ class Window:
             # best-effort; if _next_gid can't be set, continue without increment
             pass
         self.blits[layer].append((gid, surface, pos))
+        self.invalidate((pos, surface.get_size()))
         return gid
 
     def remove_overlay(self, gid: int) -> bool:
@@ -183,37 +776,288 @@ class Window:
         if not (self.blits and isinstance(self.blits[0], list)):
             return False
         for i in range(1, len(self.blits)):
-            before = len(self.blits[i])
-            self.blits[i] = [b for b in self.blits[i] if not (isinstance(b, tuple) and len(b) == 3 and b[0] == gid)]
-            if len(self.blits[i]) != before:
-                removed = True
+            kept = []
+            for b in self.blits[i]:
+                if isinstance(b, tuple) and len(b) == 3 and b[0] == gid:
+                    self.invalidate((b[2], b[1].get_size()))
+                    removed = True
+                else:
+                    kept.append(b)
+            self.blits[i] = kept
         return removed
 
-    def mainloop(self) -> None:
+    @property
+    def cpu_usage(self) -> float:
+        """Fraction of one core used by the process while in mainloop."""
+        wall = self.stats['wall_time']
+        return self.stats['cpu_time'] / wall if wall > 0 else 0.0
+
+    def wake(self) -> None:
+        """Interrupt an idle wait so the main loop runs another iteration.
+
+        Safe to call from other threads.
+        """
+        try:
+            pygame.event.post(pygame.event.Event(WAKE_EVENT))
+        except pygame.error:
+            pass
+
+    def set_timeout(self, callback, delay: float, *args) -> int:
+        """Call `callback(*args)` once, `delay` ms from now, from the main loop.
+
+        Returns a timer id for cancel().
+        """
+        return self._timers.add(callback, delay, None, args)
+
+    def set_interval(self, callback, interval: float, *args) -> int:
+        """Call `callback(*args)` every `interval` ms from the main loop.
+
+        Missed ticks (after a long frame) are skipped, not run in a burst.
+        Returns a timer id for cancel().
+        """
+        return self._timers.add(callback, interval, interval, args)
+
+    def cancel(self, timer_id) -> bool:
+        """Stop a timeout or interval. Returns True if it was still scheduled."""
+        return self._timers.cancel(timer_id)
+
+    def _run_timers(self) -> None:
+        self.stats['timers'] += self._timers.run_due()
+
+    def call_soon_threadsafe(self, callback, *args, key=None) -> None:
+        """Run `callback(*args)` on the UI thread before the next frame.
+
+        Safe to call from any thread. Calls run in the order they were
+        posted; a call with a `key` replaces a pending call with the same key
+        instead of queuing another, so a stream of updates costs one call
+        per frame.
+        """
+        if key is None:
+            key = object()
+        with self._soon_lock:
+            first = not self._soon
+            if key in self._soon:
+                self.stats['coalesced'] += 1
+            self._soon[key] = (callback, args)
+        if first:
+            # one wakeup per frame is enough, however many calls follow
+            self.wake()
+
+    def set_threadsafe(self, component, attr: str, value) -> None:
+        """Set `component.<attr>` on the UI thread; the last value per frame wins.
+
+        E.g. ``window.set_threadsafe(progress, 'value', done / total)`` from a
+        worker pool.
+        """
+        self.call_soon_threadsafe(setattr, component, attr, value, key=(component, attr))
+
+    def _run_soon(self) -> None:
+        if not self._soon:
+            return
+        with self._soon_lock:
+            pending = self._soon
+            self._soon = {}
+        for callback, args in pending.values():
+            try:
+                callback(*args)
+            except Exception:
+                # one bad update must not drop the rest of the batch
+                traceback.print_exc()
+
+    def _needs_frame(self) -> bool:
+        """Whether the next loop iteration has anything to draw."""
+        return bool(
+            self._full_redraw
+            or self._damage
+            or self._render_queue
+            or self.mode == 'immediate'
+            or self.animations
+            # updates posted by worker threads
+            or self._soon
+            # per-frame hooks (animations) need a steady frame stream
+            or 'draw' in self._event_handlers
+        )
+
+    def _poll_events(self) -> list:
+        """Fetch pending events, blocking while idle and nothing is dirty."""
+        if not self.idle or self._needs_frame():
+            return pygame.event.get()
+
+        start = time.perf_counter()
+        timeout = self.idle_timeout
+        due = self._timers.next_due()
+        if due is not None:
+            # sleep until the next timer at the latest
+            remaining = math.ceil((due - start) * 1000)
+            if remaining <= 0:
+                return pygame.event.get()
+            timeout = min(timeout, remaining)
+        if self._tasks and self._loop is not None:
+            # tasks on the window's own loop cannot wake the wait; poll them
+            timeout = min(timeout, TASK_POLL_MS)
+        stats = self.stats
+        try:
+            event = pygame.event.wait(timeout)
+        finally:
+            stats['idle_waits'] += 1
+            stats['idle_time'] += time.perf_counter() - start
+            # account the wait's wall time along with its idle time, even if
+            # the loop ends (QUIT) before _step reaches its own bookkeeping
+            self._update_loop_stats()
+        if event.type == pygame.NOEVENT:
+            # timed out without input
+            return []
+        stats['wakeups'] += 1
+        return [event, *pygame.event.get()]
+
+    def _update_loop_stats(self) -> None:
+        cpu, wall = time.process_time(), time.perf_counter()
+        if self._loop_marks is not None:
+            last_cpu, last_wall = self._loop_marks
+            self.stats['cpu_time'] += cpu - last_cpu
+            self.stats['wall_time'] += wall - last_wall
+        self._loop_marks = (cpu, wall)
+
+    def spawn(self, awaitable):
+        """Run a coroutine alongside the UI and return its task.
+
+        Under run_async() it becomes a task on the running event loop.
+        Under the blocking mainloop() it goes to an event loop owned by the
+        window, which advances once per loop iteration, so the UI keeps
+        drawing while the task waits. Tasks are kept alive until done;
+        failures go to the loop's exception handler.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            loop = self._loop
+        task = asyncio.ensure_future(awaitable, loop=loop)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            task.get_loop().call_exception_handler({
+                'message': 'Unhandled exception in async UI handler',
+                'exception': task.exception(),
+                'task': task,
+            })
+
+    def _run_tasks(self) -> None:
+        """Advance tasks on the window's own loop by one loop iteration."""
+        loop = self._loop
+        if loop is None or not self._tasks:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # stop() lands after the callbacks already ready, so each task
+            # runs up to its next await
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+
+    def _cancel_tasks(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # let cancelled tasks unwind before closing the loop
+                pending = [t for t in asyncio.all_tasks(loop) if not t.done()]
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.close()
+                self._loop = None
+
+    def _settle(self, result):
+        """Start `result` as a task if a handler returned an awaitable.
+
+        An async handler cannot stop propagation, so it counts as not handled.
+        """
+        if inspect.isawaitable(result):
+            self.spawn(result)
+            return None
+        return result
+
+    def _start_loop(self) -> None:
         self.render()
 
-        while True:
-            # Calculate high precision deltatime
-            current_time = time.perf_counter()
-            self.dt = (current_time - self._last_frame_time) * 1000
-            self._last_frame_time = current_time
-
-            # Still use pygame clock for FPS calculation
-            self.clock.tick()
-            util.set_average_fps(self.clock.get_fps())
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
+        self._loop_marks = None
+        self._update_loop_stats()
+
+    def _step(self, events: list) -> bool:
+        """Run one main loop iteration; False once the window was closed."""
+        # Calculate high precision deltatime
+        current_time = time.perf_counter()
+        self.dt = (current_time - self._last_frame_time) * 1000
+        self._last_frame_time = current_time
 
-                self._event(event)
+        # Still use pygame clock for FPS calculation
+        self.clock.tick()
+        util.set_average_fps(self.clock.get_fps())
 
-            # Only render every frame if in immediate mode
-            # You should never enable this unless something breaks.
-            # Immediate mode will give 10x worse performance.
-            if self.mode == 'immediate':
-                self.render()
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return False
+            if event.type == WAKE_EVENT:
+                continue
 
+            self._event(event)
+
+        self._run_soon()
+        self._run_timers()
+        self._run_tasks()
+
+        # Only render every frame if in immediate mode
+        # You should never enable this unless something breaks.
+        # Immediate mode will give 10x worse performance.
+        if self.mode == 'immediate':
+            self.render()
+
+        if not self.idle or self._needs_frame():
             self.draw()
+            self.stats['frames'] += 1
+
+        self.stats['iterations'] += 1
+        self._update_loop_stats()
+        return True
 
+    def mainloop(self) -> None:
+        self._start_loop()
+        try:
+            while self._step(self._poll_events()):
+                pass
+        finally:
+            self._cancel_tasks()
+
+    async def run_async(self, fps: float = 60) -> None:
+        """Drive the window from an asyncio event loop, e.g. ``asyncio.run(window.run_async())``.
+
+        Between frames the loop awaits the rest of the frame time, so
+        network clients and other tasks run in the same thread without
+        busy-waiting. Handlers passed to on(), on_click and on_enter may be
+        ``async def``; they run as tasks (see spawn()). Pending tasks are
+        cancelled when the window closes.
+        """
+        frame_time = 1 / fps
+        self._start_loop()
+        try:
+            while True:
+                start = time.perf_counter()
+                if not self._step(pygame.event.get()):
+                    return
+                delay = frame_time - (time.perf_counter() - start)
+                due = self._timers.next_due()
+                if due is not None:
+                    # wake up in time for the next timer
+                    delay = min(delay, due - time.perf_counter())
+                await asyncio.sleep(max(0.0, delay))
+        finally:
+            self._cancel_tasks()
@@ -46,12 +46,12 @@ avatar = ui.IconButton(tab0, (300, 36), avatar_surf, size=(64, 64), on_click=lam
 
 # Form buttons
 submit_btn = ui.Button(tab0, (8, 220), "Submit", (120, 32), on_click=lambda b: print('Form submitted'))
-clear_btn = ui.Button(tab0, (140, 220), "Clear", (80, 32), on_click=lambda b: [
-    setattr(name_field, 'value', ''), 
-    setattr(email_field, 'value', ''),
-    setattr(addr_field, 'value', ''),
-    setattr(phone_field, 'value', '')
-])
+def clear_form(_):
+    with window.batch():
+        for field in (name_field, email_field, addr_field, phone_field):
+            field.value = ''
+
+clear_btn = ui.Button(tab0, (140, 220), "Clear", (80, 32), on_click=clear_form)
 
 # Tab 1: Controls
 tab1 = left_tab[1]
@@ -130,9 +130,8 @@ def on_key(evt):
 
 window.event(pygame.KEYDOWN)(on_key)
 
-# Animation for progress bars
-@window.event('draw')
-def frame(dt):
+# Animation for progress bars, ~30 times a second
+def bump_progress():
     # Occasional progress bump for demo
     progress.value  += 0.01
     progress2.value += 0.02
@@ -140,5 +139,6 @@ def frame(dt):
         progress.value =  (progress.value  + random.random() * 6) % 100
         progress2.value = (progress2.value + random.random() * 3) % 100
 
+window.set_interval(bump_progress, 33)
 
 window.mainloop()
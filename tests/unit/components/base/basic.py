@@ -69,3 +69,91 @@ class TestBaseComponent:
         frame.off('test_event')
         frame.emit('test_event')
         assert not callback_called
+
+    def test_absolute_pos_is_cached(self, window):
+        """absolute_pos is computed once and reused until something moves."""
+        outer = ui.Frame(window, (10, 20), (200, 200))
+        inner = ui.Frame(outer, (5, 5), (100, 100))
+        leaf = ui.Frame(inner, (1, 2), (10, 10))
+        assert leaf.absolute_pos == (16, 27)
+        assert leaf._abs_pos == (16, 27)
+        assert inner._abs_pos == (15, 25)
+
+    def test_absolute_pos_follows_ancestor_moves(self, window):
+        """Moving an ancestor invalidates the cache of its whole subtree."""
+        outer = ui.Frame(window, (10, 20), (200, 200))
+        inner = ui.Frame(outer, (5, 5), (100, 100))
+        leaf = ui.Frame(inner, (1, 2), (10, 10))
+        sibling = ui.Frame(window, (300, 0), (10, 10))
+        assert leaf.absolute_pos == (16, 27)
+        assert sibling.absolute_pos == (300, 0)
+
+        outer.pos = (50, 60)
+        assert leaf._abs_pos is None
+        assert leaf.absolute_pos == (56, 67)
+        assert sibling._abs_pos == (300, 0)
+
+        leaf.pos = (0, 0)
+        assert leaf.absolute_pos == (55, 65)
+
+    def test_remove_detaches_subtree(self):
+        """remove() takes the subtree off screen but keeps it usable."""
+        window = ui.Window((400, 300))
+        outer = ui.Frame(window, (10, 10), (200, 200))
+        inner = ui.Frame(outer, (5, 5), (50, 50))
+        window.draw()
+        assert window.component_at((20, 20)) is inner
+
+        window.set_input_focus(inner)
+        outer.remove()
+        assert outer not in window.children
+        assert window.input_focus is None
+        assert window.component_at((20, 20)) is None
+        assert inner not in window._spatial
+
+        window.addChild(outer)
+        window.draw()
+        assert window.component_at((20, 20)) is inner
+
+    def test_add_child_moves_component_to_new_parent(self):
+        """addChild() reparents a component and draws it at its new position."""
+        window = ui.Window((400, 300))
+        first = ui.Frame(window, (40, 40), (100, 100))
+        second = ui.Frame(window, (140, 140), (100, 100))
+        child = ui.Frame(first, (10, 10), (20, 20))
+        window.draw()
+        assert child._rect.topleft == (50, 50)
+
+        child.remove()
+        second.addChild(child)
+        assert child.parent is second
+        window.draw()
+        assert child._rect.topleft == (150, 150)
+        assert window.component_at((155, 155)) is child
+
+        # moving without remove() unlinks it from the old parent as well
+        first.addChild(child)
+        assert child not in second.children and child.parent is first
+        window.draw()
+        assert child._rect.topleft == (50, 50)
+
+    def test_destroy_releases_resources(self):
+        """destroy() drops listeners, surfaces and index entries of the subtree."""
+        window = ui.Window((400, 300))
+        outer = ui.Frame(window, (10, 10), (200, 200))
+        inner = ui.Frame(outer, (5, 5), (50, 50))
+        window.draw()
+        destroyed = []
+        inner.on('destroy', lambda: destroyed.append(inner))
+        inner.on('click', lambda: None)
+        inner.mark_dirty()
+
+        outer.destroy()
+        assert destroyed == [inner]
+        assert inner.events == {}
+        assert outer.children == []
+        assert inner._surface is None and inner._blit is None
+        assert inner not in window._render_queue
+        assert len(window._spatial) == 0
+        window.draw()
+        assert window._display_list == []
@@ -316,3 +316,17 @@ class TestChildWindow:
         # Test setting new position
         child_window.pos = (200, 150)
         assert child_window.pos == (200, 150)
+
+    def test_recreating_ui_destroys_old_components(self, mock_window):
+        """Minimizing rebuilds the title bar and drops focus from the old one."""
+        cw = ChildWindow(mock_window, pos=(100, 100), size=(300, 200), title="Test Window")
+        old_close = cw._close_button
+        old_frame = cw._window_frame
+        old_close.focus()
+        assert mock_window.input_focus is old_close
+
+        cw.minimize()
+        assert mock_window.input_focus is None
+        assert old_frame not in cw.children
+        assert cw._close_button is not old_close
+        assert cw._window_frame.parent is cw
@@ -1,5 +1,6 @@
 """Tests for Field component."""
 
+import time
 import pytest
 import pygame
 import engine as ui
@@ -145,3 +146,78 @@ class TestField:
                 field.render()
             except Exception as e:
                 pytest.fail(f"Field with font size {size} failed to render: {e}")
+
+    def test_multiline_renders_visible_lines_only(self, window, monkeypatch):
+        """A long multiline field draws only the lines inside its viewport."""
+        from engine.components import field as field_module
+        drawn = []
+        real = field_module.draw_lines
+
+        def spy(surf, lines, *args, **kwargs):
+            lines = list(lines)
+            drawn.append(len(lines))
+            return real(surf, lines, *args, **kwargs)
+
+        monkeypatch.setattr(field_module, 'draw_lines', spy)
+        text = "\n".join(f"line {i}" for i in range(20000))
+        field = ui.Field(window, (10, 10), (None, 16), text, size=(200, 100), multiline=True)
+        field.render()
+
+        assert drawn and max(drawn) < 20
+        assert field.surface.get_size() == (200, 100)
+
+    def test_caret_blink_redraws_overlay_only(self, window, monkeypatch):
+        """Blinking swaps the caret overlay's entry without re-rendering anything."""
+        field = ui.Field(window, (10, 10), (None, 16), "Blink", size=(200, 40))
+        field.focus()
+        window.flush_renders()
+        overlay = field._caret_overlay
+        bar = lambda: overlay._blit[0].get_at((0, overlay.size[1] // 2)).a
+        shown = bar()
+        assert shown
+
+        renders = []
+        monkeypatch.setattr(ui.Field, 'render', lambda self: renders.append(self))
+        monkeypatch.setattr(type(overlay), 'render', lambda self: renders.append(self))
+        window._timers.run_due(time.perf_counter() + 1)
+        window.flush_renders()
+        assert not renders
+        assert bar() != shown
+
+        timer = field._blink_timer
+        monkeypatch.undo()
+        window.clear_input_focus()
+        assert field._blink_timer is None and timer not in window._timers
+        window.flush_renders()
+        assert overlay in window._z
+        assert not bar()
+
+    def test_caret_focus_and_blink_keep_display_list(self, window, monkeypatch):
+        """Focus changes and blinks neither rebuild the display list nor re-bake."""
+        frame = ui.Frame(window, (0, 100), (300, 100))
+        field = ui.Field(frame, (10, 10), (None, 16), "Static", size=(200, 40))
+        frame.static = True
+        window.draw()
+        rebuilds = []
+        real = ui.Window._rebuild_display_list
+        monkeypatch.setattr(ui.Window, '_rebuild_display_list', lambda self: rebuilds.append(1) or real(self))
+
+        field.focus()
+        window.draw()
+        assert not frame._dirty and not frame._composite_dirty
+        field._blink()
+        assert not frame._dirty and not frame._composite_dirty
+        window.clear_input_focus()
+        window.draw()
+        assert not rebuilds
+
+    def test_setting_long_value_measures_visible_lines_only(self, window, monkeypatch):
+        """Replacing the value of a long document does not measure every line."""
+        from engine.components import field as field_module
+        measured = []
+        real = field_module.prefix_widths
+        monkeypatch.setattr(field_module, 'prefix_widths', lambda line, font: measured.append(line) or real(line, font))
+        field = ui.Field(window, (10, 10), (None, 16), "", size=(200, 100), multiline=True)
+        field.value = "\n".join(f"row {i}" for i in range(20000))
+        field.render()
+        assert 0 < len(measured) < 30
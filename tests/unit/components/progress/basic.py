@@ -155,3 +155,56 @@ class TestProgressBar:
             progress.render()
         except Exception as e:
             pytest.fail(f"Minimal size progress bar rendering failed: {e}")
+
+    def test_progressive_bars_use_shared_animator(self):
+        """Progressive bars ease on the window animator, not a draw hook each."""
+        window = ui.Window((400, 300))
+        bars = [ui.ProgressBar(window, (10, 10 + i * 30), (200, 20)) for i in range(2)]
+        for bar in bars:
+            bar.progressive = True
+            bar.value = 80
+        assert not window._event_handlers.get('draw')
+        assert len(window.animations) == 2
+        assert window._needs_frame()
+
+        start = window.animations._active[(bars[0], '_progress_display')].started
+        window.animations.tick(start + 0.05)
+        assert 0 < bars[0]._progress_display < 80
+        window.animations.tick(start + 10)
+        assert bars[0]._progress_display == 80
+        assert len(window.animations) == 0
+
+    def test_destroy_cancels_animation(self):
+        """A destroyed progressive bar stops animating."""
+        window = ui.Window((400, 300))
+        bar = ui.ProgressBar(window, (10, 10), (200, 20))
+        bar.progressive = True
+        bar.value = 50
+        assert len(window.animations) == 1
+        bar.destroy()
+        assert len(window.animations) == 0
+
+    def test_deprecated_tuning_properties_shape_the_ease(self):
+        """progress_slowdown and min_progress_rate still work, with a warning."""
+        window = ui.Window((400, 300))
+        bar = ui.ProgressBar(window, (10, 10), (200, 20))
+        bar.progressive = True
+        with pytest.warns(DeprecationWarning):
+            assert bar.progress_slowdown == 0.01
+        with pytest.warns(DeprecationWarning):
+            bar.progress_slowdown = 1.0
+        with pytest.warns(DeprecationWarning):
+            bar.min_progress_rate = 0
+        bar.value = 50
+        anim = window.animations._active[(bar, '_progress_display')]
+        # base ease of 3 / rate seconds, doubled by the slowdown
+        assert anim.duration == pytest.approx(0.6)
+
+        # snap to 50, then a short move must not crawl below 100 units/s
+        bar.progressive = False
+        bar.progressive = True
+        with pytest.warns(DeprecationWarning):
+            bar.min_progress_rate = 100
+        bar.value = 60
+        anim = window.animations._active[(bar, '_progress_display')]
+        assert anim.duration == pytest.approx(0.1)
@@ -137,6 +137,19 @@ class TestRadio:
         # In a proper radio group, first should now be unselected
         # But we'll accept any implementation that handles grouping
 
+    def test_destroy_leaves_group(self, window):
+        """A destroyed radio is no longer part of its group."""
+        gid = max(ui.Radio._groups, default=-1) + 1
+        first = ui.Radio(window, (10, 10), group_gid=gid)
+        second = ui.Radio(window, (10, 40), group_gid=gid)
+        first.destroy()
+        assert ui.Radio._groups[gid] == [second]
+        second._select_self_and_unselect_others()
+        assert second.checked
+        # the last member takes the group with it
+        second.destroy()
+        assert gid not in ui.Radio._groups
+
     def test_different_sizes(self, window):
         """Test radio buttons with different sizes."""
         sizes = [(10, 10), (20, 20), (30, 30)]
@@ -478,3 +491,14 @@ class TestRadio:
                 radio._event(click_event)
             except Exception as e:
                 pytest.fail(f"Radio bounds checking failed at ({x}, {y}): {e}")
+
+    def test_keyboard_selection(self, window):
+        """A focused radio is selected with Space and arrows move through its group."""
+        a = ui.Radio(window, (10, 10), group_gid=97)
+        b = ui.Radio(window, (40, 10), group_gid=97)
+        a.focus()
+        assert a._event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0))
+        assert a.checked and not b.checked
+        assert a._event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT, mod=0))
+        assert b.checked and not a.checked
+        assert window.input_focus is b
@@ -105,3 +105,17 @@ class TestSegmentedButton:
             # Just verify no exception is thrown
         except Exception as e:
             pytest.fail(f"SegmentedButton click interaction failed: {e}")
+
+    def test_keyboard_selection(self, window, segment_options):
+        """Arrow keys and Home/End change the segment of a focused control."""
+        changes = []
+        seg = ui.SegmentedButton(window, (10, 10), segment_options, size=(200, 30),
+                                 on_change=lambda i, label: changes.append(i))
+        seg.focus()
+        key = lambda k: seg._event(pygame.event.Event(pygame.KEYDOWN, key=k, mod=0))
+        assert key(pygame.K_RIGHT) and seg.selected == 1
+        assert key(pygame.K_END) and seg.selected == 3
+        assert key(pygame.K_HOME) and seg.selected == 0
+        assert changes == [1, 3, 0]
+        window.clear_input_focus()
+        assert not key(pygame.K_RIGHT)
@@ -152,3 +152,27 @@ class TestToggle:
             toggle.render()
         except Exception as e:
             pytest.fail(f"Large size toggle rendering failed: {e}")
+
+    def test_knob_slides(self, window):
+        """Toggling slides the knob over a few frames instead of snapping."""
+        toggle = ui.Toggle(window, (10, 10), (60, 30))
+        toggle._toggle()
+        anim = window.animations._active[(toggle, '_knob')]
+        window.animations.tick(anim.started + 0.03)
+        assert 0.0 < toggle._knob < 1.0
+        window.animations.tick(anim.started + 1)
+        assert toggle._knob == 1.0
+        assert (toggle, '_knob') not in window.animations
+
+    def test_keys_toggle_only_when_focused(self, window):
+        """Space/Enter toggle a focused Toggle, never one that is merely hovered."""
+        toggle = ui.Toggle(window, (10, 10), (60, 30))
+        toggle._was_hovered = True
+        space = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0)
+        assert not toggle._event(space)
+        assert toggle.value is False
+
+        toggle.focus()
+        assert toggle._event(space)
+        assert toggle.value is True
+        window.clear_input_focus()
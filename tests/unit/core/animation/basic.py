@@ -0,0 +1,86 @@
+"""Tests for the animation core module."""
+
+import pytest
+import pygame
+import engine as ui
+from engine.animation import Animator, EASINGS
+
+
+class Dummy:
+    """Attribute holder counting mark_dirty() calls."""
+
+    def __init__(self):
+        self.x = 0.0
+        self.pos = (0, 0)
+        self.dirty = 0
+
+    def mark_dirty(self):
+        self.dirty += 1
+
+
+class TestAnimator:
+    """Test suite for Animator and the easing curves."""
+
+    @pytest.mark.parametrize("name", sorted(EASINGS))
+    def test_easing_endpoints(self, name):
+        ease = EASINGS[name]
+        assert ease(0.0) == pytest.approx(0.0)
+        assert ease(1.0) == pytest.approx(1.0)
+
+    def test_tween_reaches_target_and_retires(self):
+        animator = Animator()
+        obj = Dummy()
+        done = []
+        anim = animator.animate(obj, 'x', 10.0, duration=100, easing='linear', on_done=lambda: done.append(1))
+        animator.tick(anim.started + 0.05)
+        assert obj.x == pytest.approx(5.0)
+        animator.tick(anim.started + 0.2)
+        assert obj.x == 10.0
+        assert done == [1]
+        assert len(animator) == 0
+        assert obj.dirty == 2
+
+    def test_retarget_starts_from_current_value(self):
+        animator = Animator()
+        obj = Dummy()
+        anim = animator.animate(obj, 'x', 10.0, duration=100, easing='linear')
+        animator.tick(anim.started + 0.05)
+        anim = animator.animate(obj, 'x', 0.0, duration=100, easing='linear')
+        assert anim.start == pytest.approx(5.0)
+        assert len(animator) == 1
+
+    def test_tuples_of_ints_stay_ints(self):
+        animator = Animator()
+        obj = Dummy()
+        anim = animator.animate(obj, 'pos', (10, 21), duration=100, easing='linear')
+        animator.tick(anim.started + 0.05)
+        assert obj.pos == (5, 10) or obj.pos == (5, 11)
+        assert all(isinstance(v, int) for v in obj.pos)
+
+    def test_cancel_leaves_value_in_place(self):
+        animator = Animator()
+        obj = Dummy()
+        anim = animator.animate(obj, 'x', 10.0, duration=100, easing='linear')
+        animator.animate(obj, 'pos', (5, 5), duration=100)
+        animator.tick(anim.started + 0.05)
+        assert animator.cancel(obj) == 2
+        assert obj.x == pytest.approx(5.0)
+
+    def test_window_renders_animated_component_once_per_frame(self, monkeypatch):
+        pygame.init()
+        window = ui.Window((400, 300))
+        frame = ui.Frame(window, (10, 10), (50, 50))
+        window.draw()
+        assert not window._needs_frame()
+
+        renders = []
+        real = ui.Frame.render
+        monkeypatch.setattr(ui.Frame, 'render', lambda self: renders.append(self) or real(self))
+        frame.animate('pos', (100, 10), duration=10_000)
+        frame.animate('size', (80, 80), duration=10_000)
+        assert window._needs_frame()
+        window.draw()
+        assert len(renders) == 1
+
+        window.animations.clear()
+        assert not window.animations
@@ -0,0 +1,114 @@
+"""Tests for the glyph atlas core module."""
+
+import pygame
+import engine as ui
+from engine.atlas import GlyphAtlas, get_atlas, PAGE_SIZE
+
+PAGE_BYTES = PAGE_SIZE * PAGE_SIZE * 4 + 256
+
+
+class CountingFont(pygame.font.Font):
+    """Font that counts render() calls."""
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.renders = 0
+
+    def render(self, *args, **kwargs):
+        self.renders += 1
+        return super().render(*args, **kwargs)
+
+
+class TestGlyphAtlas:
+    """Test suite for GlyphAtlas."""
+
+    @staticmethod
+    def font():
+        if not pygame.font.get_init():
+            pygame.font.init()
+        return CountingFont(None, 20)
+
+    def test_glyphs_rasterized_once(self):
+        font = self.font()
+        atlas = GlyphAtlas(font, (255, 255, 255))
+        atlas.layout("12:00")
+        assert len(atlas) == 4 and font.renders == 4
+        blits, end = atlas.layout("10:02")
+        assert font.renders == 4
+        assert len(blits) == 5
+        assert end == atlas.size("10:02")[0]
+
+    def test_glyphs_match_font_render(self):
+        font = self.font()
+        atlas = GlyphAtlas(font, (200, 100, 50))
+        surf, advance = atlas.glyph('H')
+        ref = font.render('H', True, (200, 100, 50))
+        assert advance == ref.get_width()
+        for x in range(ref.get_width()):
+            for y in range(ref.get_height()):
+                assert surf.get_at((x, y)) == ref.get_at((x, y))
+
+    def test_gaps_and_empty_text(self):
+        font = self.font()
+        atlas = GlyphAtlas(font, (0, 0, 0))
+        plain = atlas.layout("abc")[1]
+        spaced = atlas.layout("abc", gaps=[2, 3])[1]
+        assert spaced == plain + 5
+        assert atlas.layout("") == ([], 0)
+
+    def test_new_page_when_full(self):
+        font = self.font()
+        atlas = GlyphAtlas(font, (0, 0, 0), page_size=32)
+        atlas.layout("ABCDEFGHIJKLMNOP")
+        assert atlas.pages > 1
+
+    def test_shared_per_font_and_color(self):
+        font = self.font()
+        assert get_atlas(font, (1, 2, 3)) is get_atlas(font, [1, 2, 3])
+        assert get_atlas(font, (1, 2, 3)) is not get_atlas(font, (3, 2, 1))
+
+    def test_text_draw_uses_atlas(self, monkeypatch):
+        """Changing counters are drawn without font.render once glyphs are known."""
+        monkeypatch.setattr(ui.text, 'GLYPH_ATLAS_ENABLED', True)
+        font = self.font()
+        ui.text.draw("0123456789", font, (255, 255, 255), width=200, height=40)
+        renders = font.renders
+        for i in range(50):
+            ui.text.draw(str(i * 7919), font, (255, 255, 255), width=200, height=40)
+        assert font.renders == renders
+
+    def test_justified_cache_separates_atlas_path(self, monkeypatch):
+        """Toggling the atlas flag never returns a surface drawn by the other path."""
+        font = self.font()
+        args = ("justified text", font, (255, 255, 255))
+        ui.text.draw_justified(*args, width=200, height=40)
+        monkeypatch.setattr(ui.text, 'GLYPH_ATLAS_ENABLED', True)
+        atlases = []
+        real = ui.text.get_atlas
+        monkeypatch.setattr(ui.text, 'get_atlas', lambda *a: atlases.append(a) or real(*a))
+        ui.text.draw_justified(*args, width=200, height=40)
+        assert atlases
+
+    def test_atlases_bounded_by_cache_budget(self, monkeypatch):
+        """Atlases for many colors are evicted by page bytes, not kept forever."""
+        from engine.atlas import ATLAS_CACHE
+        ATLAS_CACHE.clear()
+        monkeypatch.setattr(ATLAS_CACHE, 'budget', 3 * PAGE_BYTES)
+        font = self.font()
+        for i in range(20):
+            get_atlas(font, (i, 0, 0)).layout("abc")
+            get_atlas(font, (i, 0, 0))
+        assert len(ATLAS_CACHE) <= 3
+        assert ATLAS_CACHE.bytes <= 3 * PAGE_BYTES
+
+    def test_atlas_does_not_keep_font_alive(self):
+        """A collected font's atlas is never handed to a new font."""
+        import gc
+        import weakref
+        font = self.font()
+        atlas = get_atlas(font, (9, 9, 9))
+        ref = weakref.ref(font)
+        del font
+        gc.collect()
+        assert ref() is None and atlas.font is None
+        assert get_atlas(self.font(), (9, 9, 9)) is not atlas
@@ -0,0 +1,67 @@
+"""Tests for the text buffer core module."""
+
+import random
+import pytest
+import engine.buffer as buffer_module
+from engine.buffer import TextBuffer
+
+
+class TestTextBuffer:
+    """Test suite for TextBuffer."""
+
+    def test_line_index(self):
+        buf = TextBuffer("ab\ncde\n\nf")
+        assert buf.line_count == 4
+        assert list(buf.lines()) == ["ab", "cde", "", "f"]
+        assert buf.line_start(1) == 3
+        assert buf.line_of(4) == (1, 1)
+        assert buf.line_of(len(buf)) == (3, 1)
+        assert buf[3:6] == "cde"
+        assert buf[2] == "\n"
+
+    def test_edits(self):
+        buf = TextBuffer("hello world")
+        buf.insert(5, ",\nthere")
+        assert buf.text == "hello,\nthere world"
+        buf.delete(0, 7)
+        assert buf.text == "there world"
+        buf.replace(5, 6, "\n")
+        assert buf.line_count == 2 and buf.line(1) == "world"
+
+    def test_version_counts_edits(self):
+        buf = TextBuffer("x")
+        v = buf.version
+        buf.insert(1, "y")
+        assert buf.version == v + 1
+
+    def test_edits_touch_only_their_block(self):
+        """A keystroke in a long document leaves the other blocks alone."""
+        lines = [f"line {i}" for i in range(50_000)]
+        buf = TextBuffer("\n".join(lines))
+        other = buf._blocks[0]
+        offset = buf.line_start(40_000) + 2
+        buf.insert(offset, "X")
+        assert buf._blocks[0] is other
+        assert buf.line(40_000) == "liXne 40000"
+        assert buf.line_of(offset + 1) == (40_000, 3)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_string_model(self, seed, monkeypatch):
+        """Random edits agree with plain string slicing, across block splits."""
+        monkeypatch.setattr(buffer_module, "BLOCK_LINES", 4)
+        rng = random.Random(seed)
+        s = "".join(rng.choice("ab\n") for _ in range(40))
+        buf = TextBuffer(s)
+        for _ in range(200):
+            a = rng.randint(0, len(s))
+            b = rng.randint(a, len(s))
+            t = "".join(rng.choice("xy\n") for _ in range(rng.randint(0, 12)))
+            buf.replace(a, b, t)
+            s = s[:a] + t + s[b:]
+            x = rng.randint(0, len(s))
+            li, col = buf.line_of(x)
+            assert li == s.count("\n", 0, x)
+            assert buf.line_start(li) + col == x
+            assert buf[x:x + 7] == s[x:x + 7]
+        assert buf.text == s
+        assert list(buf.lines()) == s.split("\n")
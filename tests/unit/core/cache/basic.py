@@ -0,0 +1,75 @@
+"""Tests for the LRU cache core module."""
+
+import pygame
+import engine as ui
+from engine.cache import LRUCache, CacheManager, estimate_bytes
+
+
+class TestLRUCache:
+    """Test suite for LRUCache and CacheManager."""
+
+    def test_surface_size_estimate(self):
+        surf = pygame.Surface((10, 20), pygame.SRCALPHA)
+        assert estimate_bytes(surf) >= 10 * 20 * 4
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache('t', budget=300, sizeof=lambda v: 100)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['c'] = 3
+        assert cache.get('a') == 1  # 'b' is now the oldest
+        cache['d'] = 4
+        assert 'b' not in cache
+        assert list(k for k in ('a', 'c', 'd') if k in cache) == ['a', 'c', 'd']
+        assert cache.bytes == 300
+        assert cache.evictions == 1
+
+    def test_hit_miss_counters(self):
+        cache = LRUCache('t', budget=1000, sizeof=lambda v: 1)
+        cache['x'] = 'y'
+        cache.get('x')
+        cache.get('x')
+        cache.get('missing')
+        stats = cache.stats
+        assert (stats['hits'], stats['misses'], stats['entries']) == (2, 1, 1)
+
+    def test_lowering_budget_evicts(self):
+        cache = LRUCache('t', budget=1000, sizeof=lambda v: 100)
+        for i in range(10):
+            cache[i] = i
+        cache.budget = 250
+        assert len(cache) == 2 and cache.bytes == 200
+
+    def test_oversized_entry_is_not_stored(self):
+        cache = LRUCache('t', budget=50, sizeof=lambda v: 100)
+        cache['big'] = 1
+        assert len(cache) == 0 and cache.bytes == 0
+
+    def test_manager_reports_per_cache(self):
+        manager = CacheManager()
+        a = manager.create('a', 1000, sizeof=lambda v: 10)
+        manager.create('b', 1000)
+        a['k'] = 1
+        stats = manager.stats()
+        assert set(stats) == {'a', 'b'}
+        assert manager.total_bytes == 10
+        manager.clear()
+        assert len(a) == 0
+
+    def test_text_caches_stay_within_budget(self):
+        """Distinct live-updating strings no longer grow the text caches forever."""
+        if not pygame.font.get_init():
+            pygame.font.init()
+        cache = ui.text.DRAW_JUSTIFIED_SURF_CACHE
+        old_budget = cache.budget
+        try:
+            cache.clear()
+            cache.budget = 64 << 10
+            font = ui.text.get_font(None, 20)
+            for i in range(500):
+                ui.text.draw_justified(f"status {i}", font, (255, 255, 255), width=200, height=40)
+            assert cache.bytes <= cache.budget
+            assert cache.evictions > 0
+            assert 'text.justified' in ui.cache.manager.stats()
+        finally:
+            cache.budget = old_budget
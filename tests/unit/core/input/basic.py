@@ -191,3 +191,23 @@ class TestInputManager:
                 input_manager.handle_event(event)
             except Exception as e:
                 pytest.fail(f"Cursor movement failed for key {event.key}: {e}")
+
+    def test_multiline_editing_uses_buffer(self, window):
+        """Typing, Enter, arrows and Backspace edit the field's text buffer."""
+        field = ui.Field(window, (10, 10), (None, 16), "ab\ncd", multiline=True)
+        window.set_input_focus(field)
+        manager = field.input_manager
+        key = lambda k, mod=0: pygame.event.Event(pygame.KEYDOWN, key=k, mod=mod, unicode='')
+
+        field._caret = 1
+        manager.handle_event(pygame.event.Event(pygame.TEXTINPUT, text='X'))
+        assert field.value == "aXb\ncd"
+        manager.handle_event(key(pygame.K_DOWN))
+        assert field._caret == field.buffer.line_start(1) + 2
+        manager.handle_event(key(pygame.K_RETURN))
+        assert field.value == "aXb\ncd\n"
+        manager.handle_event(key(pygame.K_BACKSPACE))
+        manager.handle_event(key(pygame.K_UP))
+        manager.handle_event(key(pygame.K_BACKSPACE, pygame.KMOD_CTRL))
+        assert field.value == "b\ncd"
+        window.clear_input_focus()
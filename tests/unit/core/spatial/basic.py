@@ -0,0 +1,56 @@
+"""Tests for the spatial index core module."""
+
+import pygame
+from engine.spatial import SpatialGrid
+
+
+class TestSpatialGrid:
+    """Test suite for SpatialGrid."""
+
+    def test_insert_and_query_point(self):
+        grid = SpatialGrid(cell_size=64)
+        grid.insert('a', (10, 10, 50, 50))
+        grid.insert('b', (40, 40, 100, 100))
+        assert sorted(grid.query_point((45, 45))) == ['a', 'b']
+        assert grid.query_point((120, 120)) == ['b']
+        assert grid.query_point((500, 500)) == []
+
+    def test_query_rect(self):
+        grid = SpatialGrid(cell_size=32)
+        for i in range(20):
+            grid.insert(i, (i * 40, 0, 30, 30))
+        assert grid.query_rect((0, 0, 100, 30)) == {0, 1, 2}
+        # touching edges do not count as overlap
+        assert grid.query_rect((30, 0, 10, 30)) == set()
+        assert grid.query_rect((-1000, -1000, 5000, 5000)) == set(range(20))
+
+    def test_update_moves_item(self):
+        grid = SpatialGrid(cell_size=64)
+        grid.insert('a', (0, 0, 10, 10))
+        grid.update('a', (300, 300, 10, 10))
+        assert grid.query_point((5, 5)) == []
+        assert grid.query_point((305, 305)) == ['a']
+        assert grid.rect_of('a') == pygame.Rect(300, 300, 10, 10)
+        assert len(grid) == 1
+
+    def test_remove(self):
+        grid = SpatialGrid()
+        grid.insert('a', (0, 0, 500, 500))
+        assert grid.remove('a')
+        assert not grid.remove('a')
+        assert 'a' not in grid
+        assert grid.query_rect((0, 0, 500, 500)) == set()
+        assert not grid._cells
+
+    def test_negative_coordinates(self):
+        grid = SpatialGrid(cell_size=50)
+        grid.insert('a', (-80, -80, 40, 40))
+        assert grid.query_point((-60, -60)) == ['a']
+        assert grid.query_rect((-100, -100, 30, 30)) == {'a'}
+
+    def test_zero_sized_rect_is_never_hit(self):
+        grid = SpatialGrid()
+        grid.insert('a', (10, 10, 0, 0))
+        assert grid.query_point((10, 10)) == []
+        grid.clear()
+        assert len(grid) == 0
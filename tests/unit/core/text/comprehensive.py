@@ -223,6 +223,37 @@ class TestTextModuleComprehensive:
         except NameError:
             pytest.skip("_get_caret_index_at_x function not available")
 
+    def test_prefix_widths_match_drawn_advances(self, monkeypatch):
+        """Caret offsets are cumulative advances of the text as drawn."""
+        font = get_font(None, 24)
+        line = "Typewriter AV kerning"
+        kerned = text_module.prefix_widths(line, font)
+        assert len(kerned) == len(line) + 1
+        assert kerned == sorted(kerned)
+        assert abs(kerned[-1] - font.size(line)[0]) <= len(line) // 4
+        assert text_module._measure_caret_x(line, font, 4) == kerned[4]
+        assert text_module.prefix_widths(line, font) is kerned
+
+        monkeypatch.setattr(text_module, 'GLYPH_ATLAS_ENABLED', True)
+        widths = text_module.prefix_widths(line, font)
+        assert widths[-1] == sum(font.size(ch)[0] for ch in line)
+
+    def test_caret_index_bisect_picks_closest(self):
+        """x -> index agrees with walking every caret position."""
+        font = get_font(None, 24)
+        line = "Hello, long line of editable text " * 4
+        widths = text_module.prefix_widths(line, font)
+        for x in range(0, widths[-1] + 20, 3):
+            expected = min(range(len(widths)), key=lambda i: (abs(widths[i] - x), -i))
+            assert _get_caret_index_at_x(line, font, x) == expected
+
+    def test_render_selection_draws(self):
+        """Selections render across lines using the prefix index."""
+        font = get_font(None, 24)
+        surf = pygame.Surface((300, 100), pygame.SRCALPHA)
+        text_module._render_selection(surf, "first\nsecond", 2, 9, font, (50, 100, 200), 0, 0)
+        assert surf.get_at((text_module._measure_caret_x("first", font, 3), 5))[:3] == (50, 100, 200)
+
     def test_text_wrapping_if_supported(self):
         """Test text wrapping functionality."""
         long_text = "This is a very long line of text that should wrap when it exceeds the specified width"
@@ -365,3 +396,12 @@ class TestTextModuleComprehensive:
         
         # Most operations should succeed
         assert sum(results) >= len(results) // 2
+
+    def test_prefix_width_cache_sized_cheaply(self):
+        """Prefix arrays are charged by length, without walking their items."""
+        font = get_font(None, 24)
+        before = text_module.PREFIX_WIDTH_CACHE.bytes
+        line = "x" * 99 + "unique prefix budget line"
+        text_module.prefix_widths(line, font)
+        assert text_module.PREFIX_WIDTH_CACHE.bytes - before == 8 * (len(line) + 1) + 64
+        assert text_module.PREFIX_WIDTH_CACHE.budget >= 8 << 20
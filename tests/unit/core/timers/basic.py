@@ -0,0 +1,78 @@
+"""Tests for the timer queue core module."""
+
+import time
+from engine.timers import TimerQueue
+
+
+class TestTimerQueue:
+    """Test suite for TimerQueue."""
+
+    def test_timeouts_run_once_in_due_order(self):
+        timers = TimerQueue()
+        calls = []
+        timers.add(calls.append, 20, args=('b',))
+        timers.add(calls.append, 10, args=('a',))
+        now = time.perf_counter()
+        assert timers.run_due(now) == 0
+        assert timers.run_due(now + 1) == 2
+        assert calls == ['a', 'b']
+        assert len(timers) == 0
+        assert timers.next_due() is None
+
+    def test_interval_repeats_and_skips_missed_ticks(self):
+        timers = TimerQueue()
+        calls = []
+        tid = timers.add(lambda: calls.append(1), 10, interval=10)
+        now = time.perf_counter()
+        # a long stall runs the interval once, not once per missed tick
+        assert timers.run_due(now + 1) == 1
+        assert tid in timers
+        assert timers.next_due() > now + 1
+        assert timers.run_due(now + 1.011) == 1
+        assert len(calls) == 2
+
+    def test_cancel(self):
+        timers = TimerQueue()
+        calls = []
+        first = timers.add(calls.append, 5, args=(1,))
+        timers.add(calls.append, 50, args=(2,))
+        assert timers.cancel(first)
+        assert not timers.cancel(first)
+        assert timers.next_due() > time.perf_counter() + 0.02
+        timers.run_due(time.perf_counter() + 1)
+        assert calls == [2]
+
+    def test_callback_can_cancel_later_timer(self):
+        timers = TimerQueue()
+        calls = []
+        later = None
+
+        def first():
+            calls.append('first')
+            timers.cancel(later)
+
+        timers.add(first, 1)
+        later = timers.add(calls.append, 2, args=('later',))
+        timers.run_due(time.perf_counter() + 1)
+        assert calls == ['first']
+
+    def test_zero_delay_from_callback_waits_for_next_run(self):
+        timers = TimerQueue()
+        calls = []
+
+        def again():
+            calls.append(1)
+            timers.add(again, 0)
+
+        timers.add(again, 0)
+        timers.run_due(time.perf_counter() + 1)
+        assert calls == [1]
+        assert len(timers) == 1
+
+    def test_cancelled_entries_are_compacted(self):
+        timers = TimerQueue()
+        ids = [timers.add(lambda: None, 1000) for _ in range(100)]
+        for tid in ids[:-1]:
+            timers.cancel(tid)
+        assert len(timers._heap) < 50
+        assert len(timers) == 1
@@ -1,5 +1,8 @@
 """Tests for Window core module."""
 
+import time
+import asyncio
+import threading
 import pytest
 import pygame
 import engine as ui
@@ -183,3 +186,872 @@ class TestWindow:
                 window.quit()
         except Exception as e:
             pytest.fail(f"Window cleanup failed: {e}")
+
+    def test_dirty_present_mode_skips_unchanged_frames(self):
+        """Dirty presentation pushes nothing when nothing changed."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.present_mode = 'dirty'
+        ui.Frame(window, (10, 10), (100, 100))
+        window.render()
+        stats = pygame.Surface((75, 50), pygame.SRCALPHA)
+
+        with patch('engine.util.get_performance_statistics', return_value=stats), \
+                patch('pygame.display.update') as update, \
+                patch('pygame.display.flip') as flip:
+            window.draw()  # first frame is always a full repaint
+            assert flip.call_count == 1
+            window.draw()
+            assert update.call_count == 0
+            assert flip.call_count == 1
+
+    def test_dirty_present_mode_updates_changed_region(self):
+        """Only the area of a re-rendered component is pushed."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.present_mode = 'dirty'
+        ui.Frame(window, (0, 0), (400, 300))
+        button = ui.Button(window, (20, 20), "Test", (50, 30))
+        window.render()
+        stats = pygame.Surface((75, 50), pygame.SRCALPHA)
+
+        with patch('engine.util.get_performance_statistics', return_value=stats), \
+                patch('pygame.display.update') as update, \
+                patch('pygame.display.flip'):
+            window.draw()
+            button.text = "Changed"
+            window.draw()
+            assert update.call_count == 1
+            rects = update.call_args[0][0]
+            assert rects == [pygame.Rect(20, 20, 50, 30)]
+
+    def test_dirty_present_mode_damages_moved_component(self):
+        """Moving a component repaints both its old and new location."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.present_mode = 'dirty'
+        frame = ui.Frame(window, (10, 10), (40, 40))
+        window.render()
+        stats = pygame.Surface((75, 50), pygame.SRCALPHA)
+
+        with patch('engine.util.get_performance_statistics', return_value=stats), \
+                patch('pygame.display.update') as update, \
+                patch('pygame.display.flip'):
+            window.draw()
+            frame.pos = (200, 200)
+            window.draw()
+            rects = update.call_args[0][0]
+            assert any(r.contains((10, 10, 40, 40)) for r in rects)
+            assert any(r.contains((200, 200, 40, 40)) for r in rects)
+
+    def test_idle_loop_blocks_when_nothing_dirty(self):
+        """Idle mode waits for events instead of polling once clean."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.idle = True
+        ui.Frame(window, (10, 10), (50, 50))
+        window.render()
+        assert window._needs_frame()
+        window.draw()
+        assert not window._needs_frame()
+
+        with patch('pygame.event.wait', return_value=pygame.event.Event(pygame.NOEVENT)) as wait, \
+                patch('pygame.event.get') as get:
+            assert window._poll_events() == []
+            wait.assert_called_once_with(window.idle_timeout)
+            get.assert_not_called()
+        assert window.stats['idle_waits'] == 1
+        assert window.stats['wakeups'] == 0
+
+    def test_idle_loop_counts_wakeups(self):
+        """An event ending the idle wait is returned and counted."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.idle = True
+        window.draw()
+        motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1))
+
+        with patch('pygame.event.wait', return_value=motion), \
+                patch('pygame.event.get', return_value=[]):
+            assert window._poll_events() == [motion]
+        assert window.stats['wakeups'] == 1
+
+    def test_idle_loop_polls_while_dirty(self):
+        """Pending damage or per-frame hooks keep the loop polling."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.idle = True
+        window.draw()
+        window.invalidate((0, 0, 10, 10))
+        with patch('pygame.event.wait') as wait, patch('pygame.event.get', return_value=[]):
+            window._poll_events()
+            wait.assert_not_called()
+
+    def test_idle_wait_ends_at_next_timer(self):
+        """Idle waits are shortened to the next set_timeout()/set_interval()."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.idle = True
+        window.draw()
+        calls = []
+        tid = window.set_interval(lambda: calls.append(1), 200)
+        window.set_timeout(calls.append, 50, 'once')
+
+        with patch('pygame.event.wait', return_value=pygame.event.Event(pygame.NOEVENT)) as wait:
+            window._poll_events()
+            assert 0 < wait.call_args[0][0] <= 50
+
+        window._timers.run_due(time.perf_counter() + 0.1)
+        assert calls == ['once']
+        assert window.cancel(tid)
+        assert window._timers.next_due() is None
+
+    def test_run_async_runs_async_handlers(self):
+        """run_async() drives frames from asyncio and runs async handlers as tasks."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        custom = pygame.event.custom_type()
+        seen = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            seen.append(event.type)
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+        async def forever():
+            await asyncio.sleep(3600)
+
+        window.on(custom, handler)
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(custom))
+        with patch('pygame.quit'):
+            async def main():
+                task = window.spawn(forever())
+                await asyncio.wait_for(window.run_async(fps=200), 5)
+                await asyncio.sleep(0)
+                return task
+            task = asyncio.run(main())
+        assert seen == [custom]
+        assert task.cancelled()
+        assert window.stats['frames'] >= 1
+
+    def test_async_click_handler_without_event_loop(self):
+        """Under the blocking loop an async on_click advances with each iteration."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        clicked = []
+
+        async def on_click(text):
+            await asyncio.sleep(0)
+            clicked.append(text)
+
+        button = ui.Button(window, (10, 10), "Go", (80, 30), on_click=on_click)
+        window.render()
+        button._event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(20, 20), button=1))
+        # the click returns at once instead of running the coroutine
+        assert clicked == []
+        assert len(window._tasks) == 1
+        for _ in range(3):
+            window._step([])
+        assert clicked == ["Go"]
+        assert not window._tasks
+
+    def test_mainloop_cancels_own_tasks_on_close(self):
+        """Tasks spawned under mainloop() are cancelled when the window closes."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+
+        async def forever():
+            await asyncio.sleep(3600)
+
+        task = window.spawn(forever())
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        with patch('pygame.quit'):
+            window.mainloop()
+        assert task.cancelled()
+        assert window._loop is None
+
+    def test_threadsafe_updates_coalesce(self):
+        """Updates posted from workers run once per frame, last write winning."""
+        from engine.window import WAKE_EVENT
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        bar = ui.ProgressBar(window, (10, 10), (200, 20))
+        calls = []
+        pygame.event.clear()
+
+        def worker(n):
+            for i in range(200):
+                window.set_threadsafe(bar, 'value', n * 1000 + i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        window.call_soon_threadsafe(calls.append, 'a')
+        window.call_soon_threadsafe(calls.append, 'b')
+
+        assert window._needs_frame()
+        assert sum(e.type == WAKE_EVENT for e in pygame.event.get()) == 1
+        assert window.stats['coalesced'] == 799
+
+        changes = []
+        bar.on('change', changes.append)
+        window._run_soon()
+        assert len(changes) == 1
+        assert calls == ['a', 'b']
+        assert not window._soon
+
+    def test_failing_threadsafe_call_does_not_drop_others(self, capsys):
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        calls = []
+        window.call_soon_threadsafe(calls.append, 'a')
+        window.call_soon_threadsafe(lambda: 1 / 0)
+        window.call_soon_threadsafe(calls.append, 'b')
+
+        window._run_soon()
+        assert calls == ['a', 'b']
+        assert not window._soon
+        assert 'ZeroDivisionError' in capsys.readouterr().err
+
+    def test_wake_posts_event(self):
+        """wake() interrupts an idle wait by posting WAKE_EVENT."""
+        from engine.window import WAKE_EVENT
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        pygame.event.clear()
+        window.wake()
+        assert any(e.type == WAKE_EVENT for e in pygame.event.get())
+        assert window.cpu_usage == 0.0
+
+    def test_idle_stats_include_final_wait(self):
+        """The wait that ends a run counts towards wall time as well as idle time."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.idle = True
+        window.render()
+        window.draw()
+        waits = iter([pygame.event.Event(pygame.NOEVENT), pygame.event.Event(pygame.QUIT)])
+
+        def wait(timeout):
+            time.sleep(0.05)
+            return next(waits)
+
+        pygame.event.clear()
+        with patch('pygame.event.wait', side_effect=wait), patch('pygame.quit'):
+            window.mainloop()
+        stats = window.stats
+        assert stats['idle_waits'] == 2
+        assert stats['wall_time'] >= stats['idle_time'] >= 0.1
+        assert 0.0 <= window.cpu_usage <= 1.0
+
+    def test_display_list_is_retained(self):
+        """The display list follows tree order and is reused between frames."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (10, 10), (200, 200))
+        inner = ui.Frame(frame, (5, 5), (20, 20))
+        other = ui.Frame(window, (250, 10), (40, 40))
+        window.render()
+        window.draw()
+        assert window._display_list == [frame, inner, other]
+
+        cached = window._frame_blits
+        window.draw()
+        assert window._frame_blits is cached
+
+        ui.Frame(window, (300, 200), (10, 10))
+        assert window._display_dirty
+        window.draw()
+        assert len(window._display_list) == 4
+        assert window._frame_blits is not cached
+
+    def test_display_list_culls_offscreen_entries(self):
+        """Entries entirely outside the window are not handed to fblits."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        ui.Frame(window, (10, 10), (20, 20))
+        offscreen = ui.Frame(window, (390, 290), (50, 50))
+        window.render()
+        offscreen.pos = (500, 500)
+        window.draw()
+        assert offscreen._blit not in window._frame_blits
+        assert len(window._frame_blits) == 1
+
+    def test_component_at_returns_topmost(self):
+        """Point queries go through the spatial index in paint order."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (0, 0), (200, 200))
+        inner = ui.Frame(frame, (10, 10), (50, 50))
+        window.render()
+        assert window.component_at((20, 20)) is inner
+        assert window.component_at((150, 150)) is frame
+        assert window.components_at((20, 20)) == [frame, inner]
+        assert window.component_at((350, 250)) is None
+
+        inner.pos = (100, 100)
+        assert window.component_at((20, 20)) is frame
+        assert window.component_at((120, 120)) is inner
+
+    def test_removed_component_leaves_index(self):
+        """Components dropped from the tree stop being hit or drawn."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (0, 0), (100, 100))
+        window.render()
+        window.draw()
+        window.children.remove(frame)
+        window._mark_display_dirty()
+        window.draw()
+        assert window.component_at((10, 10)) is None
+        assert frame not in window._spatial
+        assert window._frame_blits == []
+
+    def test_pointer_events_only_reach_components_under_cursor(self):
+        """Mouse events skip components away from the cursor."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        near = ui.Button(window, (10, 10), "Near", (80, 30))
+        far = ui.Button(window, (200, 200), "Far", (80, 30))
+        window.render()
+        seen = []
+        original = ui.Button._event
+
+        def spy(self, event):
+            seen.append(self)
+            return original(self, event)
+
+        with patch.object(ui.Button, '_event', spy):
+            window._event(pygame.event.Event(pygame.MOUSEMOTION, pos=(20, 20), rel=(0, 0), buttons=(0, 0, 0)))
+        assert seen == [near]
+
+    def test_pointer_routing_emits_enter_and_leave(self):
+        """Enter/leave fire as the cursor crosses components."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        button = ui.Button(window, (10, 10), "Hover", (80, 30))
+        window.render()
+        log = []
+        button.on('mouseenter', lambda: log.append('enter'))
+        button.on('mouseleave', lambda: log.append('leave'))
+
+        seen = []
+        original = ui.Button._event
+
+        def spy(self, event):
+            seen.append(event.pos)
+            return original(self, event)
+
+        motion = lambda pos: pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+        with patch.object(ui.Button, '_event', spy):
+            window._event(motion((20, 20)))
+            window._event(motion((25, 25)))
+            window._event(motion((300, 250)))
+            window._event(motion((310, 250)))
+        assert log == ['enter', 'leave']
+        # the leaving motion still reaches the button so it can drop its
+        # hover look; later motions elsewhere do not
+        assert seen == [(20, 20), (25, 25), (300, 250)]
+
+    def test_pointer_capture_follows_drag(self):
+        """The component that took the press keeps the drag outside its rect."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        slider = ui.Slider(window, (10, 10), (100, 20), min_value=0, max_value=100, value=0)
+        window.render()
+        window._event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(20, 15), button=1))
+        assert window._capture is slider
+        window._event(pygame.event.Event(pygame.MOUSEMOTION, pos=(300, 250), rel=(0, 0), buttons=(1, 0, 0)))
+        assert slider.value == 100
+        window._event(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(300, 250), button=1))
+        assert window._capture is None
+        assert not slider._dragging
+
+    def test_input_focus_emits_focus_and_blur(self):
+        """set_input_focus moves focus and notifies both components."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        first = ui.Field(window, (10, 10), (None, 20))
+        second = ui.Field(window, (10, 80), (None, 20))
+        log = []
+        first.on('focus', lambda: log.append('first focus'))
+        first.on('blur', lambda: log.append('first blur'))
+        second.on('focus', lambda: log.append('second focus'))
+        window.event('focus')(lambda comp: log.append(comp))
+
+        window.set_input_focus(first)
+        assert first.focused and first._focused
+        window.set_input_focus(second)
+        assert not first._focused and second.focused
+        window.clear_input_focus()
+        assert window.input_focus is None
+        assert log == ['first focus', first, 'first blur', 'second focus', second, None]
+
+    def test_key_events_go_to_focused_component(self):
+        """Typing only reaches the focused Field."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        fields = [ui.Field(window, (10, 10 + i * 60), (None, 20)) for i in range(3)]
+        window.render()
+        window.set_input_focus(fields[1])
+        window._event(pygame.event.Event(pygame.TEXTINPUT, text='x'))
+        assert [f.value for f in fields] == ['', 'x', '']
+
+    def test_tab_traverses_focus_in_tree_order(self):
+        """Tab and Shift+Tab cycle through focusable components."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (0, 0), (400, 300))
+        field = ui.Field(frame, (10, 10), (None, 20))
+        ui.Label(frame, (10, 70), "Not focusable", (None, 16))
+        button = ui.Button(frame, (10, 100), "OK", (60, 30))
+        window.render()
+
+        tab = lambda mod=0: pygame.event.Event(pygame.KEYDOWN, key=pygame.K_TAB, mod=mod, unicode='\t')
+        window._event(tab())
+        assert window.input_focus is field
+        window._event(tab())
+        assert window.input_focus is button
+        window._event(tab())
+        assert window.input_focus is field
+        window._event(tab(pygame.KMOD_SHIFT))
+        assert window.input_focus is button
+
+    def test_tab_reaches_keydown_hooks(self):
+        """Tab is left to app hooks when they claim it or nothing can take focus."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        ui.Label(window, (10, 70), "Not focusable", (None, 16))
+        window.render()
+        seen = []
+        window.on(pygame.KEYDOWN, lambda e: seen.append(e.key))
+        tab = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_TAB, mod=0, unicode='\t')
+        window._event(tab)
+        assert seen == [pygame.K_TAB]
+        assert not window._tab_focus(tab)
+
+        button = ui.Button(window, (10, 100), "OK", (60, 30))
+        window.render()
+        window.on(pygame.KEYDOWN, lambda e: True, priority=1)
+        window._event(tab)
+        assert window.input_focus is None
+        assert window._tab_focus(tab)
+        assert window.input_focus is button
+        # already on the only focusable component: focus does not move
+        assert not window._tab_focus(tab)
+
+    def test_click_outside_clears_focus(self):
+        """Clicking empty space drops keyboard focus."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        field = ui.Field(window, (10, 10), (None, 20), size=(150, 40))
+        window.render()
+        window._event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(20, 20), button=1))
+        assert window.input_focus is field
+        window._event(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(20, 20), button=1))
+        window._event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(300, 250), button=1))
+        assert window.input_focus is None
+        assert not field._focused
+
+    def test_focused_button_activates_with_space(self):
+        """Space on a focused Button clicks it."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        clicks = []
+        button = ui.Button(window, (10, 10), "Go", (60, 30), on_click=clicks.append)
+        window.render()
+        button.focus()
+        window._event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=' '))
+        assert clicks == ["Go"]
+
+    def test_subscriber_index_by_event_type(self):
+        """Components are indexed under the event types they declare."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (0, 0), (400, 300))
+        button = ui.Button(frame, (10, 10), "OK", (60, 30))
+        field = ui.Field(frame, (10, 60), (None, 20))
+        assert window.subscribers(pygame.MOUSEBUTTONDOWN) == [button, field]
+        assert window.subscribers(pygame.TEXTINPUT) == [field]
+        assert window.subscribers(pygame.WINDOWMOVED) == []
+
+        # a new component resets the index
+        slider = ui.Slider(frame, (10, 120), (100, 20))
+        assert window.subscribers(pygame.MOUSEBUTTONUP) == [field, slider]
+
+    def test_unsubscribed_event_skips_components(self):
+        """Event types no component declares never reach the tree."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        ui.Button(window, (10, 10), "OK", (60, 30))
+        window.render()
+        handled = []
+        window.event(pygame.WINDOWMOVED)(handled.append)
+
+        with patch.object(ui.Button, '_event', side_effect=AssertionError('offered')):
+            window._event(pygame.event.Event(pygame.WINDOWMOVED, x=0, y=0))
+        assert len(handled) == 1
+
+    def test_components_without_declaration_get_every_event(self):
+        """Custom components that declare nothing still see all events."""
+        ensure_pygame_ready()
+        from engine.components.base import ComponentBase
+        seen = []
+
+        class Custom(ComponentBase):
+            def _event(self, event):
+                seen.append(event.type)
+                return False
+
+        window = Window((400, 300))
+        Custom(window, (0, 0), (10, 10))
+        window._event(pygame.event.Event(pygame.USEREVENT))
+        assert seen == [pygame.USEREVENT]
+
+    def test_hooks_run_by_priority_then_order(self):
+        """Several handlers can share a hook; priority decides who runs first."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        calls = []
+        window.on('draw', lambda f: calls.append('a'))
+        window.on('draw', lambda f: calls.append('b'))
+        window.on('draw', lambda f: calls.append('urgent'), priority=10)
+        window.on('draw', lambda f: calls.append('late'), priority=-1)
+        window.draw()
+        assert calls == ['urgent', 'a', 'b', 'late']
+
+    def test_handler_returning_true_stops_propagation(self):
+        """A handler that returns True hides the event from later ones."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        seen = []
+        window.on(pygame.USEREVENT, lambda e: seen.append('first') or True, priority=1)
+        window.on(pygame.USEREVENT, lambda e: seen.append('second'))
+        window._event(pygame.event.Event(pygame.USEREVENT))
+        assert seen == ['first']
+
+    def test_off_unsubscribes_handlers(self):
+        """off() removes one handler, or all of them for a type."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        handler = window.on('draw', lambda f: None)
+        other = window.on('draw', lambda f: None)
+        window.off('draw', handler)
+        assert [h for _, h in window._event_handlers['draw']] == [other]
+        window.off('draw', other)
+        assert 'draw' not in window._event_handlers
+
+        window.on(pygame.KEYDOWN, lambda e: None)
+        window.on(pygame.KEYDOWN, lambda e: None)
+        window.off(pygame.KEYDOWN)
+        assert pygame.KEYDOWN not in window._event_handlers
+
+    def test_setters_coalesce_into_one_render(self):
+        """Several property changes in a frame cost a single render."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        label = ui.Label(window, (10, 10), "a", (None, 16))
+        window.render()
+        calls = []
+        original = ui.Label.render
+
+        def spy(self):
+            calls.append(self)
+            original(self)
+
+        with patch.object(ui.Label, 'render', spy):
+            for text in ("b", "c", "d", "e", "f"):
+                label.text = text
+            assert calls == []
+            window.draw()
+        assert calls == [label]
+        assert not window._render_queue
+
+    def test_dirty_components_render_in_tree_order(self):
+        """The flush renders parents before children regardless of marking order."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        outer = ui.Frame(window, (0, 0), (300, 200))
+        inner = ui.Frame(outer, (10, 10), (50, 50))
+        other = ui.Frame(window, (310, 0), (50, 50))
+        window.render()
+        order = []
+        original = ui.Frame.render
+
+        def spy(self):
+            order.append(self)
+            original(self)
+
+        with patch.object(ui.Frame, 'render', spy):
+            other.color = (1, 2, 3)
+            inner.color = (1, 2, 3)
+            outer.color = (1, 2, 3)
+            window.flush_renders()
+        assert order == [outer, inner, other]
+
+    def test_parent_render_does_not_render_children(self):
+        """Re-rendering a container leaves its children's surfaces alone."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (0, 0), (300, 200))
+        label = ui.Label(frame, (10, 10), "child", (None, 16))
+        window.render()
+        with patch.object(ui.Label, 'render', side_effect=AssertionError('re-rendered')):
+            frame.color = (10, 10, 10)
+            window.draw()
+
+    def test_new_components_render_with_next_frame(self):
+        """Components created after startup appear without a manual render."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        window.render()
+        frame = ui.Frame(window, (10, 10), (20, 20))
+        assert frame._blit is None
+        window.draw()
+        assert frame._blit is not None
+
+    def test_switched_in_tab_is_drawn_again(self):
+        """Pages that leave and re-enter the tree return to the display list."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        tabs = ui.TabFrame(window, (0, 0), (400, 300), tab_count=2)
+        window.render()
+        window.draw()
+        first = tabs[0]
+        assert first._blit in window._frame_blits
+
+        tabs.current = 1
+        window.draw()
+        assert first._blit not in window._frame_blits
+        assert tabs[1]._blit in window._frame_blits
+
+        tabs.current = 0
+        window.draw()
+        assert first._blit in window._frame_blits
+        assert window.component_at((50, 100)) is first
+
+    def test_batch_defers_rendering_until_exit(self):
+        """Nothing renders inside batch(); each changed component renders once after."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        fields = [ui.Field(window, (10, 10 + i * 40), (None, 16), value='x') for i in range(4)]
+        window.render()
+        calls = []
+        original = ui.Field.render
+
+        def spy(self):
+            calls.append(self)
+            original(self)
+
+        with patch.object(ui.Field, 'render', spy):
+            with window.batch():
+                for field in fields:
+                    field.value = ''
+                    field.value = 'y'
+                window.flush_renders()
+                assert calls == []
+            assert calls == fields
+        assert [f.value for f in fields] == ['y'] * 4
+
+    def test_batch_collects_composite_invalidation(self):
+        """Composite dirtiness is applied once per branch when the batch ends."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        outer = ui.Frame(window, (0, 0), (300, 200))
+        inner = ui.Frame(outer, (10, 10), (100, 100))
+        labels = [ui.Label(inner, (0, i * 20), str(i), (None, 14)) for i in range(3)]
+        outer._composite_dirty = inner._composite_dirty = False
+
+        with window.batch():
+            with window.batch():
+                for label in labels:
+                    label.pos = (5, label.pos[1])
+            assert not inner._composite_dirty
+            assert window._batch_depth == 1
+        assert inner._composite_dirty and outer._composite_dirty
+        assert window._batch_depth == 0
+        assert not window._render_queue
+
+    def test_static_subtree_is_one_blit(self):
+        """A static panel paints all its descendants through one composite."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (0, 0), (400, 300))
+        labels = [ui.Label(panel, (5 + (i % 10) * 38, 5 + (i // 10) * 14), str(i), (None, 12)) for i in range(200)]
+        panel.static = True
+        window.draw()
+        assert window._frame_blits == [panel._blit]
+        assert panel._blit[0] is panel._composite_surface
+        # descendants are still there for hit testing
+        assert window.component_at(labels[0].absolute_pos) is labels[0]
+
+    def test_static_subtree_rebakes_on_descendant_change(self):
+        """Changing something inside a static subtree refreshes the composite once."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (0, 0), (200, 200))
+        label = ui.Label(panel, (10, 10), "before", (None, 16))
+        panel.static = True
+        window.draw()
+        baked = panel._composite_surface
+
+        bakes = []
+        original = ui.Frame._rebuild_composite
+
+        def spy(self):
+            bakes.append(self)
+            original(self)
+
+        with patch.object(ui.Frame, '_rebuild_composite', spy):
+            label.text = "after"
+            label.color = (255, 0, 0)
+            window.draw()
+        assert bakes == [panel]
+        assert panel._composite_surface is not baked
+
+    def test_draw_hook_changes_show_in_same_frame(self):
+        """Components changed by a 'draw' hook are rendered in that frame."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        frame = ui.Frame(window, (0, 0), (50, 50), color=(255, 0, 0))
+        window.draw()
+        window.on('draw', lambda n: setattr(frame, 'color', (0, 0, 255)))
+        window.draw()
+        assert tuple(window.surface.get_at((25, 25)))[:3] == (0, 0, 255)
+
+    def test_nested_static_subtrees_paint_once(self):
+        """A static panel inside a static panel does not paint its children twice."""
+        ensure_pygame_ready()
+
+        def pixel(nested_static):
+            window = Window((400, 300))
+            outer = ui.Frame(window, (0, 0), (200, 200), color=(100, 100, 100))
+            inner = ui.Frame(outer, (10, 10), (150, 150), color=(0, 0, 0, 0))
+            ui.Frame(inner, (10, 10), (50, 50), color=(255, 255, 255, 100))
+            if nested_static:
+                inner.static = True
+                outer.static = True
+            window.draw()
+            if nested_static:
+                assert window._frame_blits == [outer._blit]
+            return tuple(window.surface.get_at((40, 40)))
+
+        assert pixel(True) == pixel(False)
+
+    def test_static_off_restores_individual_entries(self):
+        """Turning static off paints descendants on their own again."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (0, 0), (200, 200))
+        label = ui.Label(panel, (10, 10), "text", (None, 16))
+        panel.static = True
+        window.draw()
+        panel.static = False
+        window.draw()
+        assert window._frame_blits == [panel._blit, label._blit]
+        assert panel._blit[0] is not panel._composite_surface
+
+    def test_moving_subtree_does_not_rerender(self):
+        """Moving a container only offsets its subtree's entries."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (10, 10), (200, 150))
+        label = ui.Label(panel, (5, 5), "text", (None, 16))
+        button = ui.Button(panel, (5, 40), "OK", (60, 30))
+        window.draw()
+
+        with patch.object(ui.Label, 'render', side_effect=AssertionError('label re-rendered')), \
+                patch.object(ui.Button, 'render', side_effect=AssertionError('button re-rendered')), \
+                patch.object(ui.Frame, 'render', side_effect=AssertionError('frame re-rendered')):
+            panel.pos = (50, 60)
+            window.draw()
+        assert panel._blit[1] == (50, 60)
+        assert label._blit[1] == (55, 65)
+        assert button._rect.topleft == (55, 100)
+        assert window.component_at((60, 110)) is button
+
+    def test_dragging_child_window_keeps_surfaces(self):
+        """ChildWindow drags translate its content instead of re-rasterizing it."""
+        ensure_pygame_ready()
+        window = Window((600, 400))
+        child = ui.ChildWindow(window, (20, 20), (250, 200), title="Drag me")
+        window.draw()
+        surfaces = [c._blit[0] for c in window._display_list if c._blit]
+
+        child.pos = (120, 80)
+        assert not window._render_queue
+        window.draw()
+        assert [c._blit[0] for c in window._display_list if c._blit] == surfaces
+        assert child._title_label.absolute_pos[0] - child.absolute_pos[0] > 0
+
+    def test_moving_static_subtree_keeps_composite(self):
+        """A static panel moves without being re-baked."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (0, 0), (100, 100))
+        ui.Label(panel, (5, 5), "text", (None, 16))
+        panel.static = True
+        window.draw()
+        composite = panel._composite_surface
+        panel.pos = (30, 30)
+        window.draw()
+        assert panel._composite_surface is composite
+        assert panel._blit == (composite, (30, 30))
+
+    def test_hidden_subtree_costs_nothing(self):
+        """Hidden components are not rendered, hit or painted."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (0, 0), (200, 200))
+        button = ui.Button(panel, (10, 10), "OK", (80, 30))
+        window.draw()
+        button.focus()
+
+        panel.visible = False
+        assert window.input_focus is None
+        button.text = "Changed"
+        with patch.object(ui.Button, 'render', side_effect=AssertionError('hidden button rendered')):
+            window.draw()
+        assert window.component_at((20, 20)) is None
+        assert button not in window.subscribers(pygame.MOUSEBUTTONDOWN)
+        assert all(entry[0] is not button._surface for entry in window._frame_blits)
+
+        panel.visible = True
+        window.draw()
+        assert not button._dirty
+        assert window.component_at((20, 20)) is button
+
+    def test_hidden_tab_pages_follow_moves(self):
+        """TabFrame pages stay in the tree, so hidden ones move with it."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        tabs = ui.TabFrame(window, (0, 0), (300, 200), tab_count=2)
+        window.draw()
+        assert tabs.children == [tabs[0], tabs[1]]
+        assert not tabs[1].visible
+
+        tabs.pos = (50, 40)
+        tabs.current = 1
+        window.draw()
+        assert tabs[1]._rect.topleft == (58, 40 + 48)
+        assert window.component_at((60, 100)) is tabs[1]
+
+    def test_release_hidden_surfaces(self):
+        """Hidden subtrees can drop their surfaces and redraw them when shown."""
+        ensure_pygame_ready()
+        window = Window((400, 300))
+        panel = ui.Frame(window, (0, 0), (200, 200))
+        label = ui.Label(panel, (5, 5), "text", (None, 16))
+        window.draw()
+        panel.visible = False
+        assert window.release_hidden_surfaces() == 1
+        assert label._surface is None and label._blit is None
+
+        panel.visible = True
+        window.draw()
+        assert label._blit is not None
+        assert window.component_at((6, 6)) is label